@@ -0,0 +1,513 @@
+"""
+Local stand-in for the Azure DevOps REST API.
+
+Serves the endpoints the tools call, including the resource area and
+OPTIONS location discovery the SDK does first. Responses are generated
+from canned data whose size is configurable, and every request waits for
+a configurable latency, so the real SDK clients, HTTP stack and formatting
+can be measured without a network or an organization.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Pattern, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+ORGANIZATION = "benchmark"
+PROJECT = "Benchmark"
+WIKI = "Benchmark.wiki"
+
+
+@dataclass
+class FakeSettings:
+    """
+    Shape of the canned data and of the simulated network.
+
+    Attributes:
+        latency: Seconds every request waits before it is answered
+        work_items: Number of work items returned by a WIQL query
+        text_size: Characters in descriptions, comments and wiki pages
+        relations: Links on every work item
+        comments: Comments on every work item
+        repositories: Repositories in the project
+        pull_requests: Active pull requests in every repository
+        search_results: Wiki search hits
+    """
+
+    latency: float = 0.0
+    work_items: int = 50
+    text_size: int = 2000
+    relations: int = 3
+    comments: int = 10
+    repositories: int = 10
+    pull_requests: int = 20
+    search_results: int = 20
+
+
+@dataclass
+class _Route:
+    location_id: str
+    area: str
+    resource: str
+    template: str
+    handlers: Dict[str, Callable]
+    pattern: Pattern = field(init=False)
+
+    def __post_init__(self):
+        self.pattern = _route_pattern(self.template)
+
+
+def _route_pattern(template: str) -> Pattern:
+    """Build the regular expression matching the URLs of a route."""
+    pattern = ""
+    for segment in template.replace("{*", "{").split("/"):
+        optional = re.fullmatch(r"\{(\w+)\}", segment)
+        if optional:
+            pattern += rf"(?:/(?P<{optional.group(1)}>[^/]+))?"
+            continue
+        prefixed = re.fullmatch(r"(.*)\{(\w+)\}", segment)
+        if prefixed:
+            prefix, name = prefixed.groups()
+            pattern += "/" + re.escape(prefix) + rf"(?P<{name}>[^/]+)"
+        else:
+            pattern += "/" + re.escape(segment)
+    return re.compile(pattern + "$", re.IGNORECASE)
+
+
+class FakeAzureDevOps:
+    """
+    Fake Azure DevOps organization served over HTTP on localhost.
+
+    Use it as a context manager; ``organization_url`` is the value for
+    AZURE_DEVOPS_ORGANIZATION_URL. Requests are counted per endpoint in
+    ``requests``.
+    """
+
+    def __init__(self, settings: Optional[FakeSettings] = None):
+        self.settings = settings or FakeSettings()
+        self.requests: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._next_id = 100000
+        self._routes = self._build_routes()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def organization_url(self) -> str:
+        assert self._server, "The fake server has not been started"
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/{ORGANIZATION}"
+
+    def start(self) -> "FakeAzureDevOps":
+        fake = self
+
+        class Handler(_Handler):
+            server_fake = fake
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(
+            target=self._server.serve_forever,
+            name="fake-azure-devops",
+            daemon=True,
+        ).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "FakeAzureDevOps":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _build_routes(self) -> List[_Route]:
+        return [
+            _Route(
+                "e81700f7-3be2-46de-8624-2eb35882fcaa",
+                "Location",
+                "ResourceAreas",
+                "_apis/resourceAreas/{areaId}",
+                {"GET": lambda match, query, body: []},
+            ),
+            _Route(
+                "603fe2ac-9723-48b9-88ad-09305aa6c6e1",
+                "core",
+                "projects",
+                "_apis/projects/{*projectId}",
+                {"GET": self._projects},
+            ),
+            _Route(
+                "72c7ddf8-2cdc-4f60-90cd-ab71c14a399b",
+                "wit",
+                "workItems",
+                "{project}/_apis/wit/workItems/{id}",
+                {"GET": self._get_work_items, "PATCH": self._save_work_item},
+            ),
+            _Route(
+                "62d3d110-0047-428c-ad3c-4fe872c91c74",
+                "wit",
+                "workItems",
+                "{project}/_apis/wit/workItems/${type}",
+                {"POST": self._save_work_item},
+            ),
+            _Route(
+                "1a9c53f7-f243-4447-b110-35ef023636e4",
+                "wit",
+                "wiql",
+                "{project}/{team}/_apis/wit/wiql",
+                {"POST": self._wiql},
+            ),
+            _Route(
+                "608aac0a-32e1-4493-a863-b9cf4566d257",
+                "wit",
+                "comments",
+                "{project}/_apis/wit/workItems/{workItemId}/comments",
+                {"GET": self._comments, "POST": self._add_comment},
+            ),
+            _Route(
+                "225f7195-f9c7-4d14-ab28-a83f7ff77e1f",
+                "git",
+                "repositories",
+                "{project}/_apis/git/repositories/{repositoryId}",
+                {"GET": self._repositories},
+            ),
+            _Route(
+                "9946fd70-0d40-406e-b686-b4744cbbcc37",
+                "git",
+                "pullRequests",
+                "{project}/_apis/git/repositories/{repositoryId}/pullRequests",
+                {"GET": self._pull_requests},
+            ),
+            _Route(
+                "25d3fbc7-fe3d-46cb-b5a5-0b6f79caf27b",
+                "wiki",
+                "pages",
+                "{project}/_apis/wiki/wikis/{wikiIdentifier}/pages",
+                {"GET": self._wiki_page},
+            ),
+            _Route(
+                "ceddcf75-1068-452d-8b13-2d4d76e1f970",
+                "wiki",
+                "pagesById",
+                "{project}/_apis/wiki/wikis/{wikiIdentifier}/pages/{id}",
+                {"GET": self._wiki_page},
+            ),
+            _Route(
+                "e90e7664-7049-4100-9a86-66b161d81080",
+                "search",
+                "wikiSearchResults",
+                "{project}/_apis/search/wikisearchresults",
+                {"POST": self._wiki_search},
+            ),
+        ]
+
+    def locations(self) -> List[dict]:
+        """API resource locations returned by OPTIONS discovery."""
+        return [
+            {
+                "id": route.location_id,
+                "area": route.area,
+                "resourceName": route.resource,
+                "routeTemplate": route.template,
+                "resourceVersion": 4,
+                "minVersion": 1.0,
+                "maxVersion": 7.1,
+                "releasedVersion": "7.1",
+            }
+            for route in self._routes
+        ]
+
+    def dispatch(
+        self, method: str, path: str, query: dict, body
+    ) -> Tuple[int, object]:
+        """Answer one request; returns the status and the JSON payload."""
+        prefix = f"/{ORGANIZATION}"
+        if not path.lower().startswith(prefix):
+            return 404, {"message": f"Unknown organization: {path}"}
+        path = path[len(prefix) :].rstrip("/")
+        if method == "OPTIONS" and path.lower() == "/_apis":
+            self._count("OPTIONS _apis")
+            return 200, _collection(self.locations())
+
+        for route in self._routes:
+            match = route.pattern.match(path)
+            if match and method in route.handlers:
+                self._count(f"{method} {route.area}/{route.resource}")
+                payload = route.handlers[method](match, query, body)
+                if isinstance(payload, list):
+                    payload = _collection(payload)
+                return 200, payload
+        return 404, {"message": f"No fake route for {method} {path}"}
+
+    def _count(self, endpoint: str) -> None:
+        with self._lock:
+            self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+
+    def _text(self, seed: str) -> str:
+        sentence = f"{seed} lorem ipsum dolor sit amet. "
+        size = self.settings.text_size
+        return (sentence * (size // len(sentence) + 1))[:size]
+
+    def _identity(self, n: int) -> dict:
+        return {
+            "displayName": f"User {n}",
+            "uniqueName": f"user{n}@example.com",
+            "id": f"00000000-0000-0000-0000-{n:012d}",
+        }
+
+    def work_item(self, item_id: int, fields: Optional[dict] = None) -> dict:
+        """Canned work item with the configured text size and links."""
+        item = {
+            "id": item_id,
+            "rev": 3,
+            "url": f"{self.organization_url}/_apis/wit/workItems/{item_id}",
+            "fields": {
+                "System.Id": item_id,
+                "System.TeamProject": PROJECT,
+                "System.WorkItemType": "User Story",
+                "System.Title": f"Work item {item_id}",
+                "System.State": "Active",
+                "System.Reason": "New",
+                "System.AreaPath": PROJECT,
+                "System.IterationPath": f"{PROJECT}\\Sprint 1",
+                "System.AssignedTo": self._identity(item_id % 7),
+                "System.CreatedBy": self._identity(item_id % 5),
+                "System.CreatedDate": "2024-01-01T10:00:00Z",
+                "System.ChangedDate": "2024-01-02T10:00:00Z",
+                "System.Tags": "backend; performance",
+                "System.Description": self._text(f"Description {item_id}"),
+                "Microsoft.VSTS.Common.Priority": 2,
+                "Microsoft.VSTS.Scheduling.StoryPoints": 3.0,
+            },
+            "relations": [
+                {
+                    "rel": "System.LinkTypes.Related",
+                    "url": (
+                        f"{self.organization_url}/_apis/wit/workItems/"
+                        f"{item_id + n + 1}"
+                    ),
+                    "attributes": {"isLocked": False, "name": "Related"},
+                }
+                for n in range(self.settings.relations)
+            ],
+        }
+        item["fields"].update(fields or {})
+        return item
+
+    def _get_work_items(self, match, query, body):
+        if match.group("id"):
+            return self._project(self.work_item(int(match.group("id"))), query)
+        ids = query.get("ids", "")
+        return [
+            self._project(self.work_item(int(i)), query)
+            for i in ids.split(",")
+            if i
+        ]
+
+    @staticmethod
+    def _project(item: dict, query: dict) -> dict:
+        """Apply the fields and $expand parameters like the real API."""
+        fields = query.get("fields")
+        if fields:
+            item["fields"] = {
+                name: item["fields"][name]
+                for name in fields.split(",")
+                if name in item["fields"]
+            }
+        if query.get("$expand", "").lower() not in ("relations", "all"):
+            del item["relations"]
+        return item
+
+    def _save_work_item(self, match, query, body):
+        fields = {
+            op["path"].rsplit("/", 1)[-1]: op["value"]
+            for op in body or []
+            if op.get("path", "").startswith("/fields/")
+        }
+        item_id = match.groupdict().get("id")
+        if item_id is None:
+            with self._lock:
+                self._next_id += 1
+                item_id = self._next_id
+        return self.work_item(int(item_id), fields)
+
+    def _wiql(self, match, query, body):
+        count = self.settings.work_items
+        top = query.get("$top")
+        if top:
+            count = min(count, int(top))
+        select = re.match(
+            r"\s*SELECT\s+(.*?)\s+FROM\s",
+            (body or {}).get("query", ""),
+            re.IGNORECASE | re.DOTALL,
+        )
+        columns = re.findall(
+            r"\[([^\]]+)\]", select.group(1) if select else ""
+        )
+        return {
+            "queryType": "flat",
+            "asOf": "2024-01-02T10:00:00Z",
+            "columns": [
+                {"referenceName": name, "name": name} for name in columns
+            ],
+            "workItems": [
+                {"id": n, "url": f"{self.organization_url}/_apis/wit/{n}"}
+                for n in range(1, count + 1)
+            ],
+        }
+
+    def _comment(self, item_id: int, n: int, text: str) -> dict:
+        return {
+            "id": n,
+            "workItemId": item_id,
+            "version": 1,
+            "text": text,
+            "createdBy": self._identity(n),
+            "createdDate": "2024-01-02T10:00:00Z",
+        }
+
+    def _comments(self, match, query, body):
+        item_id = int(match.group("workItemId"))
+        comments = [
+            self._comment(item_id, n, self._text(f"Comment {n}"))
+            for n in range(1, self.settings.comments + 1)
+        ]
+        return {
+            "totalCount": len(comments),
+            "count": len(comments),
+            "comments": comments,
+        }
+
+    def _add_comment(self, match, query, body):
+        item_id = int(match.group("workItemId"))
+        return self._comment(item_id, 1, (body or {}).get("text", ""))
+
+    def _projects(self, match, query, body):
+        return [
+            {
+                "id": f"10000000-0000-0000-0000-{n:012d}",
+                "name": PROJECT if n == 0 else f"{PROJECT} {n}",
+                "description": self._text(f"Project {n}")[:200],
+                "url": f"{self.organization_url}/_apis/projects/{n}",
+                "state": "wellFormed",
+                "visibility": "private",
+                "lastUpdateTime": "2024-01-02T10:00:00Z",
+            }
+            for n in range(10)
+        ]
+
+    def _repository(self, n: int) -> dict:
+        return {
+            "id": f"20000000-0000-0000-0000-{n:012d}",
+            "name": f"repo-{n}",
+            "defaultBranch": "refs/heads/main",
+            "webUrl": f"{self.organization_url}/{PROJECT}/_git/repo-{n}",
+            "project": {"id": "10000000", "name": PROJECT},
+        }
+
+    def _repositories(self, match, query, body):
+        if match.group("repositoryId"):
+            return self._repository(0)
+        return [self._repository(n) for n in range(self.settings.repositories)]
+
+    def _pull_requests(self, match, query, body):
+        return [
+            {
+                "pullRequestId": n,
+                "title": f"Pull request {n}",
+                "description": self._text(f"Pull request {n}")[:500],
+                "status": "active",
+                "isDraft": n % 4 == 0,
+                "createdBy": self._identity(n),
+                "sourceRefName": f"refs/heads/feature/{n}",
+                "targetRefName": "refs/heads/main",
+                "url": f"{self.organization_url}/_apis/git/pullRequests/{n}",
+            }
+            for n in range(1, self.settings.pull_requests + 1)
+        ]
+
+    def _wiki_page(self, match, query, body):
+        path = query.get("path") or f"/Page {match.groupdict().get('id')}"
+        return {
+            "id": 1,
+            "path": path,
+            "order": 0,
+            "gitItemPath": f"{path.replace(' ', '-')}.md",
+            "content": self._text(f"Wiki page {path}"),
+            "subPages": [
+                {"id": n, "path": f"{path}/Child {n}", "order": n}
+                for n in range(1, 6)
+            ],
+        }
+
+    def _wiki_search(self, match, query, body):
+        results = [
+            {
+                "fileName": f"Page-{n}.md",
+                "path": f"/Page-{n}.md",
+                "project": {"id": "10000000", "name": PROJECT},
+                "wiki": {"id": "30000000", "name": WIKI},
+                "hits": [],
+            }
+            for n in range(1, self.settings.search_results + 1)
+        ]
+        return {"count": len(results), "results": results}
+
+
+def _collection(values: list) -> dict:
+    return {"count": len(values), "value": values}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server_fake: FakeAzureDevOps
+
+    def _handle(self) -> None:
+        fake = self.server_fake
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        body = json.loads(raw) if raw else None
+        url = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+        if fake.settings.latency:
+            time.sleep(fake.settings.latency)
+        status, payload = fake.dispatch(
+            self.command, unquote(url.path), query, body
+        )
+
+        data = json.dumps(payload).encode("utf-8")
+        etag = '"' + hashlib.sha1(data).hexdigest() + '"'
+        if (
+            self.command == "GET"
+            and status == 200
+            and self.headers.get("If-None-Match") == etag
+        ):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        if status == 200:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PATCH = do_OPTIONS = _handle
+
+    def log_message(self, format, *args):
+        pass
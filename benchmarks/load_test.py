@@ -0,0 +1,571 @@
+"""
+Concurrent load test driving the MCP server like a fleet of agents.
+
+By default every session starts its own ``mcp-azure-devops`` process over
+stdio, the way MCP clients launch the server, configured against a local
+fake Azure DevOps organization. With ``--transport http`` a single server
+is started over streamable HTTP instead and every session connects to it,
+and with ``--url`` the sessions connect to a server that is already
+running.
+
+Sessions replay a weighted mix of tool calls (work item reads, WIQL
+queries, wiki searches, creates, ...) until the duration or request budget
+is used up. The report covers throughput, latency percentiles per tool and
+the memory of the server processes over the run:
+
+    python -m benchmarks.load_test --sessions 8 --duration 60
+    python -m benchmarks.load_test --transport http --server-workers 2
+    python -m benchmarks.load_test --url http://127.0.0.1:8000/mcp \\
+        --server-pid 1234
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from contextlib import AsyncExitStack, contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from benchmarks.fake_azure_devops import (
+    PROJECT,
+    WIKI,
+    FakeAzureDevOps,
+    FakeSettings,
+)
+from benchmarks.run import percentile
+
+# Default workload: tool name -> (weight, arguments)
+WORKLOAD: Dict[str, Tuple[float, dict]] = {
+    "get_work_item": (40, {"id": 1}),
+    "query_work_items": (
+        20,
+        {"query": "SELECT [System.Id] FROM WorkItems", "top": 50},
+    ),
+    "search_wiki": (15, {"query": "performance"}),
+    "get_work_item_comments": (10, {"id": 1}),
+    "create_work_item": (
+        10,
+        {"title": "Load test", "project": PROJECT, "work_item_type": "Task"},
+    ),
+    "get_wiki_by_path": (
+        5,
+        {"project": PROJECT, "wiki_id": WIKI, "path": "/Home"},
+    ),
+}
+
+# Seconds between memory samples
+MEMORY_INTERVAL = 0.5
+# Seconds an HTTP server may take to start answering
+STARTUP_TIMEOUT = 30.0
+
+
+@dataclass
+class ToolStats:
+    """Latencies and failures of one tool."""
+
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """Parse a TOOL=WEIGHT,... workload mix."""
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in WORKLOAD:
+            raise argparse.ArgumentTypeError(
+                f"unknown tool {name!r} (expected one of "
+                f"{', '.join(WORKLOAD)})"
+            )
+        try:
+            mix[name] = float(weight) if weight else WORKLOAD[name][0]
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid weight: {weight}")
+    return mix
+
+
+def read_rss(pid: int) -> Optional[int]:
+    """Resident memory of a process in bytes, or None if unavailable."""
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def child_pids(parent: Optional[int] = None) -> List[int]:
+    """
+    Processes started by a process (Linux only; empty elsewhere).
+
+    Args:
+        parent: Process whose children to list; this one when omitted
+    """
+    pids = []
+    own = str(parent or os.getpid())
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return pids
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", encoding="ascii") as stat:
+                # The command name may contain spaces; fields follow ")"
+                fields = stat.read().rsplit(")", 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        if fields[1] == own:
+            pids.append(int(entry))
+    return pids
+
+
+class MemorySampler:
+    """Samples the total resident memory of a set of processes."""
+
+    def __init__(self, pids: List[int]):
+        self.pids = pids
+        self.samples: List[int] = []
+
+    def sample(self) -> None:
+        sizes = [read_rss(pid) for pid in self.pids]
+        sizes = [size for size in sizes if size is not None]
+        if sizes:
+            self.samples.append(sum(sizes))
+
+    async def run(self) -> None:
+        while True:
+            self.sample()
+            await asyncio.sleep(MEMORY_INTERVAL)
+
+    def summary(self) -> Optional[dict]:
+        if not self.samples:
+            return None
+        mib = 1024 * 1024
+        return {
+            "processes": len(self.pids),
+            "start_mib": self.samples[0] / mib,
+            "peak_mib": max(self.samples) / mib,
+            "end_mib": self.samples[-1] / mib,
+            "growth_mib": (self.samples[-1] - self.samples[0]) / mib,
+        }
+
+
+class LoadRun:
+    """Shared state of the sessions taking part in one run."""
+
+    def __init__(
+        self,
+        mix: Dict[str, float],
+        duration: float,
+        requests: Optional[int],
+        seed: int,
+    ):
+        self.tools = list(mix)
+        self.weights = [mix[name] for name in self.tools]
+        self.stats = {name: ToolStats() for name in self.tools}
+        self.rng = random.Random(seed)
+        self.deadline = time.monotonic() + duration
+        self.requests = requests
+        self._issued = itertools.count()
+        self._created = itertools.count(1)
+
+    def next_call(self) -> Optional[Tuple[str, dict]]:
+        """Pick the next call, or None when the budget is used up."""
+        if time.monotonic() >= self.deadline:
+            return None
+        if self.requests is not None and next(self._issued) >= self.requests:
+            return None
+        tool = self.rng.choices(self.tools, self.weights)[0]
+        arguments = dict(WORKLOAD[tool][1])
+        if tool == "create_work_item":
+            arguments["title"] += f" {next(self._created)}"
+        return tool, arguments
+
+    async def drive(self, session) -> None:
+        """Issue calls on one session until the budget is used up."""
+        while True:
+            call = self.next_call()
+            if call is None:
+                return
+            tool, arguments = call
+            stats = self.stats[tool]
+            start = time.perf_counter()
+            try:
+                result = await session.call_tool(tool, arguments)
+                text = "".join(
+                    getattr(item, "text", "") for item in result.content
+                )
+                if result.isError or text.startswith("Error"):
+                    stats.errors += 1
+            except Exception:
+                stats.errors += 1
+            stats.latencies.append(time.perf_counter() - start)
+
+
+def free_port() -> int:
+    """Pick a local TCP port nothing is listening on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def http_server(
+    command: List[str], env: Dict[str, str], errlog, workers: int = 1
+) -> Iterator[Tuple[str, List[int]]]:
+    """
+    Start the server over streamable HTTP and wait until it answers.
+
+    Yields:
+        Tuple containing (MCP endpoint URL, server process IDs)
+
+    Raises:
+        RuntimeError: If the server exits or does not answer in time
+    """
+    port = free_port()
+    base = f"http://127.0.0.1:{port}"
+    process = subprocess.Popen(
+        command
+        + [
+            "--transport",
+            "streamable-http",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+        ],
+        env=env,
+        stdout=errlog,
+        stderr=errlog,
+    )
+    try:
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(
+                    f"server exited with status {process.returncode}"
+                )
+            try:
+                with urllib.request.urlopen(f"{base}/healthz", timeout=1):
+                    break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise RuntimeError("server did not start in time")
+                time.sleep(0.1)
+        # Workers are children of the uvicorn supervisor
+        pids = [process.pid] + child_pids(process.pid)
+        yield f"{base}/mcp", pids
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def _stdio_transport(
+    command: List[str], env: Optional[Dict[str, str]], errlog
+):
+    from mcp import StdioServerParameters
+    from mcp.client.stdio import stdio_client
+
+    params = StdioServerParameters(
+        command=command[0], args=command[1:], env=env
+    )
+    return stdio_client(params, errlog=errlog)
+
+
+def _http_transport(url: str):
+    from mcp.client.streamable_http import streamablehttp_client
+
+    return streamablehttp_client(url)
+
+
+async def run_load(
+    sessions: int,
+    concurrency: int,
+    make_run,
+    command: Optional[List[str]] = None,
+    env: Optional[Dict[str, str]] = None,
+    url: Optional[str] = None,
+    server_pids: Optional[List[int]] = None,
+    errlog=sys.stderr,
+) -> Tuple[LoadRun, float, Optional[dict]]:
+    """
+    Open the sessions, replay the workload and measure it.
+
+    Every session lives in its own task, and all of them start sending
+    calls at the same time once each one is initialized.
+
+    Returns:
+        The finished run, the seconds it took and the memory summary
+    """
+    from mcp import ClientSession
+
+    ready = asyncio.Semaphore(0)
+    go = asyncio.Event()
+    runs: List[LoadRun] = []
+
+    async def session_task():
+        if url:
+            transport = _http_transport(url)
+        else:
+            assert command, "run_load needs a url or a server command"
+            transport = _stdio_transport(command, env, errlog)
+        async with AsyncExitStack() as stack:
+            streams = await stack.enter_async_context(transport)
+            session = await stack.enter_async_context(
+                ClientSession(streams[0], streams[1])
+            )
+            await session.initialize()
+            ready.release()
+            await go.wait()
+            await asyncio.gather(
+                *(runs[0].drive(session) for _ in range(concurrency))
+            )
+
+    tasks = [asyncio.create_task(session_task()) for _ in range(sessions)]
+    for _ in range(sessions):
+        await ready.acquire()
+
+    if url:
+        pids = server_pids or []
+    else:
+        pids = child_pids()
+    sampler = MemorySampler(pids)
+    sampling = asyncio.create_task(sampler.run())
+
+    runs.append(make_run())
+    start = time.perf_counter()
+    go.set()
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    sampling.cancel()
+    sampler.sample()
+    return runs[0], elapsed, sampler.summary()
+
+
+def summarize(load: LoadRun, elapsed: float, memory: Optional[dict]) -> dict:
+    """Summarize a finished run."""
+    tools = {}
+    all_latencies: List[float] = []
+    for name, stats in load.stats.items():
+        if not stats.latencies:
+            continue
+        all_latencies.extend(stats.latencies)
+        tools[name] = {
+            "calls": len(stats.latencies),
+            "errors": stats.errors,
+            "p50_ms": percentile(stats.latencies, 50) * 1000,
+            "p95_ms": percentile(stats.latencies, 95) * 1000,
+            "p99_ms": percentile(stats.latencies, 99) * 1000,
+            "max_ms": max(stats.latencies) * 1000,
+        }
+    calls = len(all_latencies)
+    return {
+        "seconds": elapsed,
+        "calls": calls,
+        "errors": sum(t["errors"] for t in tools.values()),
+        "throughput": calls / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(all_latencies, 50) * 1000 if calls else 0.0,
+        "p99_ms": percentile(all_latencies, 99) * 1000 if calls else 0.0,
+        "tools": tools,
+        "memory": memory,
+    }
+
+
+def format_report(summary: dict) -> str:
+    """Format a run summary as plain text."""
+    header = (
+        f"{'tool':<24} {'calls':>6} {'errors':>6} {'p50 ms':>8} "
+        f"{'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}"
+    )
+    lines = [header, "-" * len(header)]
+    for name, t in summary["tools"].items():
+        lines.append(
+            f"{name:<24} {t['calls']:>6} {t['errors']:>6} "
+            f"{t['p50_ms']:>8.1f} {t['p95_ms']:>8.1f} {t['p99_ms']:>8.1f} "
+            f"{t['max_ms']:>8.1f}"
+        )
+    lines.append("")
+    lines.append(
+        f"{summary['calls']} calls in {summary['seconds']:.1f}s: "
+        f"{summary['throughput']:.1f} calls/s, "
+        f"p50 {summary['p50_ms']:.1f}ms, p99 {summary['p99_ms']:.1f}ms, "
+        f"{summary['errors']} errors"
+    )
+    memory = summary["memory"]
+    if memory:
+        lines.append(
+            f"Server memory ({memory['processes']} processes): "
+            f"{memory['start_mib']:.1f} MiB at start, "
+            f"{memory['peak_mib']:.1f} MiB peak, "
+            f"{memory['end_mib']:.1f} MiB at end "
+            f"({memory['growth_mib']:+.1f} MiB)"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Drive the MCP server with concurrent sessions"
+    )
+    parser.add_argument(
+        "--sessions", type=int, default=4, help="Concurrent MCP sessions"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Calls in flight per session",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=30.0, help="Seconds to run"
+    )
+    parser.add_argument(
+        "--requests",
+        type=int,
+        default=None,
+        help="Stop after this many calls in total",
+    )
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=None,
+        metavar="TOOL=WEIGHT,...",
+        help=f"Workload mix (tools: {', '.join(WORKLOAD)})",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--command",
+        default=None,
+        help=(
+            "Command starting the stdio server "
+            "(default: this Python running mcp_azure_devops)"
+        ),
+    )
+    parser.add_argument(
+        "--transport",
+        choices=("stdio", "http"),
+        default="stdio",
+        help=(
+            "Start a stdio server per session, or one streamable HTTP "
+            "server shared by all sessions"
+        ),
+    )
+    parser.add_argument(
+        "--server-workers",
+        type=int,
+        default=1,
+        help="Worker processes of the HTTP server",
+    )
+    parser.add_argument(
+        "--url",
+        default=None,
+        help="Connect over streamable HTTP to a running server instead",
+    )
+    parser.add_argument(
+        "--server-pid",
+        type=int,
+        default=None,
+        help="Process to sample memory of when using --url",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.02,
+        help="Seconds the fake Azure DevOps server waits per response",
+    )
+    parser.add_argument(
+        "--server-log",
+        default=os.devnull,
+        help="File receiving the output of started servers (default: none)",
+    )
+    parser.add_argument("--json", help="Write the summary to this file")
+    args = parser.parse_args(argv)
+
+    mix = args.mix or {name: w for name, (w, _) in WORKLOAD.items()}
+
+    def make_run():
+        return LoadRun(mix, args.duration, args.requests, args.seed)
+
+    if args.url:
+        load, elapsed, memory = asyncio.run(
+            run_load(
+                args.sessions,
+                args.concurrency,
+                make_run,
+                url=args.url,
+                server_pids=[args.server_pid] if args.server_pid else None,
+            )
+        )
+    else:
+        command = (
+            args.command.split()
+            if args.command
+            else [sys.executable, "-m", "mcp_azure_devops"]
+        )
+        with (
+            tempfile.TemporaryDirectory() as cache_dir,
+            open(args.server_log, "a", encoding="utf-8") as errlog,
+            FakeAzureDevOps(FakeSettings(latency=args.latency)) as fake,
+        ):
+            env = {
+                **os.environ,
+                "AZURE_DEVOPS_ORGANIZATION_URL": fake.organization_url,
+                "AZURE_DEVOPS_PAT": "load-test",
+                "AZURE_DEVOPS_CACHE_DIR": cache_dir,
+            }
+            env.setdefault("AZURE_DEVOPS_MAX_REQUESTS_PER_SECOND", "0")
+            if args.transport == "http":
+                with http_server(
+                    command, env, errlog, args.server_workers
+                ) as (url, pids):
+                    load, elapsed, memory = asyncio.run(
+                        run_load(
+                            args.sessions,
+                            args.concurrency,
+                            make_run,
+                            url=url,
+                            server_pids=pids,
+                        )
+                    )
+            else:
+                load, elapsed, memory = asyncio.run(
+                    run_load(
+                        args.sessions,
+                        args.concurrency,
+                        make_run,
+                        command=command,
+                        env=env,
+                        errlog=errlog,
+                    )
+                )
+
+    summary = summarize(load, elapsed, memory)
+    print(format_report(summary))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as out:
+            json.dump(summary, out, indent=2)
+    return 1 if summary["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
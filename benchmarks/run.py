@@ -0,0 +1,284 @@
+"""
+Benchmark the tools against a local fake Azure DevOps organization.
+
+Every case calls a real tool through the MCP server, so the measurement
+covers client setup, the HTTP pipeline, deserialization and formatting.
+Per case it reports throughput, p50/p99 latency and the number of Azure
+DevOps requests per call. Results can be saved and compared with a
+baseline, failing when a case got slower or needs more round trips:
+
+    python -m benchmarks.run --json baseline.json
+    python -m benchmarks.run --baseline baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Tuple
+
+from benchmarks.fake_azure_devops import (
+    PROJECT,
+    WIKI,
+    FakeAzureDevOps,
+    FakeSettings,
+)
+
+# Benchmark case name -> (tool, arguments)
+CASES: Dict[str, Tuple[str, dict]] = {
+    "get_work_item": ("get_work_item", {"id": 1}),
+    "get_work_item_batch": ("get_work_item", {"id": list(range(1, 21))}),
+    "query_work_items": (
+        "query_work_items",
+        {"query": "SELECT [System.Id] FROM WorkItems", "top": 50},
+    ),
+    "get_work_item_comments": ("get_work_item_comments", {"id": 1}),
+    "create_work_item": (
+        "create_work_item",
+        {
+            "title": "Benchmark",
+            "project": PROJECT,
+            "work_item_type": "Task",
+            "description": "Created by the benchmark",
+        },
+    ),
+    "get_projects": ("get_projects", {}),
+    "list_repositories": ("list_repositories", {"project": PROJECT}),
+    "get_pull_requests": (
+        "get_pull_requests",
+        {"project": PROJECT, "repository_id": "repo-0"},
+    ),
+    "get_wiki_by_path": (
+        "get_wiki_by_path",
+        {"project": PROJECT, "wiki_id": WIKI, "path": "/Home"},
+    ),
+    "search_wiki": ("search_wiki", {"query": "performance"}),
+}
+
+
+@dataclass
+class CaseResult:
+    """Measurements for one benchmark case."""
+
+    name: str
+    calls: int
+    errors: int
+    throughput: float
+    p50_ms: float
+    p99_ms: float
+    requests_per_call: float
+
+
+def percentile(samples: List[float], p: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(p / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _is_error(content) -> bool:
+    text = "".join(getattr(item, "text", "") for item in content)
+    return text.startswith("Error")
+
+
+async def run_case(
+    server,
+    fake: FakeAzureDevOps,
+    name: str,
+    iterations: int,
+    concurrency: int,
+    warmup: int,
+) -> CaseResult:
+    """Call one tool repeatedly and measure it."""
+    tool, arguments = CASES[name]
+    for _ in range(warmup):
+        await server.call_tool(tool, arguments)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def call():
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                content = await server.call_tool(tool, arguments)
+                errors += _is_error(content)
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    requests_before = sum(fake.requests.values())
+    start = time.perf_counter()
+    await asyncio.gather(*(call() for _ in range(iterations)))
+    elapsed = time.perf_counter() - start
+    requests = sum(fake.requests.values()) - requests_before
+
+    return CaseResult(
+        name=name,
+        calls=iterations,
+        errors=errors,
+        throughput=iterations / elapsed,
+        p50_ms=percentile(latencies, 50) * 1000,
+        p99_ms=percentile(latencies, 99) * 1000,
+        requests_per_call=requests / iterations,
+    )
+
+
+async def run_benchmarks(
+    fake: FakeAzureDevOps,
+    cases: List[str],
+    iterations: int,
+    concurrency: int,
+    warmup: int,
+) -> List[CaseResult]:
+    """Run the selected cases one after another on a fresh server."""
+    # Imported late so the environment prepared by main() applies
+    from mcp_azure_devops.server import create_server
+
+    server = create_server()
+    return [
+        await run_case(server, fake, name, iterations, concurrency, warmup)
+        for name in cases
+    ]
+
+
+def compare(
+    results: List[CaseResult], baseline: Dict[str, dict], tolerance: float
+) -> List[str]:
+    """
+    Find cases that regressed against a baseline.
+
+    A case regresses when its p50 latency grew by more than the tolerance,
+    or when it sends more requests per call than before.
+    """
+    regressions = []
+    for result in results:
+        before = baseline.get(result.name)
+        if before is None:
+            continue
+        if result.p50_ms > before["p50_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{result.name}: p50 {before['p50_ms']:.1f}ms -> "
+                f"{result.p50_ms:.1f}ms"
+            )
+        if result.requests_per_call > before["requests_per_call"] + 1e-9:
+            regressions.append(
+                f"{result.name}: requests per call "
+                f"{before['requests_per_call']:.2f} -> "
+                f"{result.requests_per_call:.2f}"
+            )
+    return regressions
+
+
+def format_table(results: List[CaseResult]) -> str:
+    """Format results as a plain text table."""
+    header = (
+        f"{'case':<24} {'calls':>6} {'errors':>6} {'calls/s':>9} "
+        f"{'p50 ms':>8} {'p99 ms':>8} {'req/call':>9}"
+    )
+    rows = [header, "-" * len(header)]
+    for r in results:
+        rows.append(
+            f"{r.name:<24} {r.calls:>6} {r.errors:>6} {r.throughput:>9.1f} "
+            f"{r.p50_ms:>8.1f} {r.p99_ms:>8.1f} {r.requests_per_call:>9.2f}"
+        )
+    return "\n".join(rows)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark tools against a fake Azure DevOps server"
+    )
+    parser.add_argument(
+        "--cases",
+        default=",".join(CASES),
+        help="Comma separated cases to run (default: all)",
+    )
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=2,
+        help="Unmeasured calls per case before measuring",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Seconds the fake server waits before every response",
+    )
+    parser.add_argument(
+        "--work-items",
+        type=int,
+        default=FakeSettings.work_items,
+        help="Work items returned by WIQL queries",
+    )
+    parser.add_argument(
+        "--text-size",
+        type=int,
+        default=FakeSettings.text_size,
+        help="Characters in descriptions, comments and wiki pages",
+    )
+    parser.add_argument("--json", help="Write the results to this file")
+    parser.add_argument(
+        "--baseline", help="Fail if results regressed against this file"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed relative p50 increase over the baseline",
+    )
+    args = parser.parse_args(argv)
+
+    cases = [c.strip() for c in args.cases.split(",") if c.strip()]
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown case: {', '.join(sorted(unknown))}")
+
+    settings = FakeSettings(
+        latency=args.latency,
+        work_items=args.work_items,
+        text_size=args.text_size,
+    )
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # Keep the SDK's discovery caches away from the real ones, and do
+        # not pace requests to a server that cannot be overloaded
+        os.environ["AZURE_DEVOPS_CACHE_DIR"] = cache_dir
+        os.environ.setdefault("AZURE_DEVOPS_MAX_REQUESTS_PER_SECOND", "0")
+        with FakeAzureDevOps(settings) as fake:
+            os.environ["AZURE_DEVOPS_ORGANIZATION_URL"] = fake.organization_url
+            os.environ["AZURE_DEVOPS_PAT"] = "benchmark"
+            results = asyncio.run(
+                run_benchmarks(
+                    fake, cases, args.iterations, args.concurrency, args.warmup
+                )
+            )
+
+    print(format_table(results))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as out:
+            json.dump({r.name: asdict(r) for r in results}, out, indent=2)
+
+    failed = [r.name for r in results if r.errors]
+    if failed:
+        print(f"\nCases with errors: {', '.join(failed)}", file=sys.stderr)
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+    return 1 if failed or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,70 @@
 # Azure DevOps MCP features package
-from mcp_azure_devops.features import git, projects, teams, wiki, work_items
+import importlib
+import os
+from typing import Iterable, List, Optional
 
+# Feature groups, in registration order
+FEATURES = ("work_items", "projects", "teams", "wiki", "git")
 
-def register_all(mcp):
+
+def _split(value: Optional[str]) -> List[str]:
+    """Split a comma separated environment variable."""
+    return [v.strip() for v in (value or "").split(",") if v.strip()]
+
+
+def select_features(
+    features: Optional[Iterable[str]] = None,
+    disabled_features: Optional[Iterable[str]] = None,
+) -> List[str]:
     """
-    Register all features with the MCP server.
+    Resolve which feature groups to register.
+
+    Args:
+        features: Feature groups to enable. Uses AZURE_DEVOPS_FEATURES
+            (comma separated) when omitted; all groups when neither is set.
+        disabled_features: Feature groups to leave out. Uses
+            AZURE_DEVOPS_DISABLED_FEATURES when omitted.
+
+    Returns:
+        Names of the selected feature groups, in registration order
+
+    Raises:
+        ValueError: If a feature group is unknown
+    """
+    env = os.environ
+    enabled = set(
+        features or _split(env.get("AZURE_DEVOPS_FEATURES")) or FEATURES
+    )
+    disabled = set(
+        disabled_features or _split(env.get("AZURE_DEVOPS_DISABLED_FEATURES"))
+    )
+    unknown = (enabled | disabled) - set(FEATURES)
+    if unknown:
+        raise ValueError(
+            f"Unknown feature: {', '.join(sorted(unknown))} "
+            f"(expected {', '.join(FEATURES)})"
+        )
+    return [f for f in FEATURES if f in enabled and f not in disabled]
+
+
+def register_all(
+    mcp,
+    features: Optional[Iterable[str]] = None,
+    disabled_features: Optional[Iterable[str]] = None,
+):
+    """
+    Register the selected features with the MCP server.
+
+    Feature packages are imported here, so groups that are not selected
+    are never imported.
 
     Args:
         mcp: The FastMCP server instance
+        features: Feature groups to enable (see select_features)
+        disabled_features: Feature groups to leave out
+
+    Raises:
+        ValueError: If a feature group is unknown
     """
-    work_items.register(mcp)
-    projects.register(mcp)
-    teams.register(mcp)
-    wiki.register(mcp)
-    git.register(mcp)
+    for name in select_features(features, disabled_features):
+        importlib.import_module(f"{__name__}.{name}").register(mcp)
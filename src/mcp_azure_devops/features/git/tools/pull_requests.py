@@ -4,8 +4,6 @@ Tools for Azure DevOps Git pull requests
 
 from typing import Optional
 
-from azure.devops.v7_1.git.models import GitPullRequestSearchCriteria
-
 from mcp_azure_devops.features.git.common import (
     AzureDevOpsClientError,
     get_git_client,
@@ -28,6 +26,8 @@ def _format_pull_request(pr):
 
 def _get_pull_requests_impl(git_client, project, repository_id):
     """Implementation of listing pull requests."""
+    from azure.devops.v7_1.git.models import GitPullRequestSearchCriteria
+
     search_criteria = GitPullRequestSearchCriteria(status="active")
     prs = git_client.get_pull_requests(
         repository_id=repository_id,
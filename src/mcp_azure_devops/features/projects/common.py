@@ -4,13 +4,16 @@ Common utilities for Azure DevOps projects features.
 This module provides shared functionality used by both tools and resources.
 """
 
-from azure.devops.v7_1.core import CoreClient
+from typing import TYPE_CHECKING
 
 from mcp_azure_devops.utils.azure_client import get_connection
 from mcp_azure_devops.utils.exceptions import AzureDevOpsClientError
 
+if TYPE_CHECKING:
+    from azure.devops.v7_1.core import CoreClient
 
-def get_core_client() -> CoreClient:
+
+def get_core_client() -> "CoreClient":
     """
     Get the core client for Azure DevOps.
 
@@ -4,18 +4,20 @@ Project tools for Azure DevOps.
 This module provides MCP tools for working with Azure DevOps projects.
 """
 
-from typing import Optional
-
-from azure.devops.v7_1.core import CoreClient
-from azure.devops.v7_1.core.models import TeamProjectReference
+from typing import TYPE_CHECKING, Optional
 
 from mcp_azure_devops.features.projects.common import (
     AzureDevOpsClientError,
     get_core_client,
 )
+from mcp_azure_devops.utils.cache import cached
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.core import CoreClient
+    from azure.devops.v7_1.core.models import TeamProjectReference
 
 
-def _format_project(project: TeamProjectReference) -> str:
+def _format_project(project: "TeamProjectReference") -> str:
     """
     Format project information.
 
@@ -53,9 +55,10 @@ def _format_project(project: TeamProjectReference) -> str:
 
 
 def _get_projects_impl(
-    core_client: CoreClient,
+    core_client: "CoreClient",
     state_filter: Optional[str] = None,
     top: Optional[int] = None,
+    fresh: bool = False,
 ) -> str:
     """
     Implementation of projects retrieval.
@@ -64,12 +67,21 @@ def _get_projects_impl(
         core_client: Core client
         state_filter: Filter on team projects in a specific state
         top: Maximum number of projects to return
+        fresh: Bypass the metadata cache
 
     Returns:
         Formatted string containing project information
     """
     try:
-        projects = core_client.get_projects(state_filter=state_filter, top=top)
+        projects = cached(
+            "projects",
+            core_client,
+            ("list", state_filter, top),
+            lambda: core_client.get_projects(
+                state_filter=state_filter, top=top
+            ),
+            fresh=fresh,
+        )
 
         if not projects:
             return "No projects found."
@@ -94,7 +106,9 @@ def register_tools(mcp) -> None:
 
     @mcp.tool()
     def get_projects(
-        state_filter: Optional[str] = None, top: Optional[int] = None
+        state_filter: Optional[str] = None,
+        top: Optional[int] = None,
+        fresh: bool = False,
     ) -> str:
         """
         Retrieves all projects accessible to the authenticated user
@@ -110,6 +124,7 @@ def register_tools(mcp) -> None:
             state_filter: Filter on team projects in a specific state
                 (e.g., "WellFormed", "Deleting")
             top: Maximum number of projects to return
+            fresh: Fetch the latest data instead of a recently cached copy
 
         Returns:
             Formatted string containing project information including names,
@@ -118,6 +133,6 @@ def register_tools(mcp) -> None:
         """
         try:
             core_client = get_core_client()
-            return _get_projects_impl(core_client, state_filter, top)
+            return _get_projects_impl(core_client, state_filter, top, fresh)
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
@@ -4,14 +4,17 @@ Common utilities for Azure DevOps teams features.
 This module provides shared functionality used by both tools and resources.
 """
 
-from azure.devops.v7_1.core import CoreClient
-from azure.devops.v7_1.work import WorkClient
+from typing import TYPE_CHECKING
 
 from mcp_azure_devops.utils.azure_client import get_connection
 from mcp_azure_devops.utils.exceptions import AzureDevOpsClientError
 
+if TYPE_CHECKING:
+    from azure.devops.v7_1.core import CoreClient
+    from azure.devops.v7_1.work import WorkClient
 
-def get_core_client() -> CoreClient:
+
+def get_core_client() -> "CoreClient":
     """
     Get the core client for Azure DevOps.
 
@@ -33,7 +36,7 @@ def get_core_client() -> CoreClient:
     return core_client
 
 
-def get_work_client() -> WorkClient:
+def get_work_client() -> "WorkClient":
     """
     Get the work client for Azure DevOps.
 
@@ -4,20 +4,21 @@ Team tools for Azure DevOps.
 This module provides MCP tools for working with Azure DevOps teams.
 """
 
-from typing import Optional
-
-from azure.devops.v7_1.core import CoreClient
-from azure.devops.v7_1.core.models import WebApiTeam
-from azure.devops.v7_1.work.models import TeamContext
+from typing import TYPE_CHECKING, Optional
 
 from mcp_azure_devops.features.teams.common import (
     AzureDevOpsClientError,
     get_core_client,
     get_work_client,
 )
+from mcp_azure_devops.utils.cache import cached
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.core import CoreClient
+    from azure.devops.v7_1.core.models import WebApiTeam
 
 
-def _format_team(team: WebApiTeam) -> str:
+def _format_team(team: "WebApiTeam") -> str:
     """
     Format team information.
 
@@ -164,11 +165,12 @@ def _format_team_iteration(iteration) -> str:
 
 
 def _get_all_teams_impl(
-    core_client: CoreClient,
+    core_client: "CoreClient",
     user_is_member_of: Optional[bool] = None,
     top: Optional[int] = None,
     skip: Optional[int] = None,
     expand_identity: Optional[bool] = None,
+    fresh: bool = False,
 ) -> str:
     """
     Implementation of teams retrieval.
@@ -180,6 +182,7 @@ def _get_all_teams_impl(
                           access.
         top: Maximum number of teams to return
         skip: Number of teams to skip
+        fresh: Bypass the metadata cache
 
     Returns:
         Formatted string containing team information
@@ -187,8 +190,14 @@ def _get_all_teams_impl(
     try:
         # Call the SDK function - note we're mapping user_is_member_of to mine
         # param
-        teams = core_client.get_all_teams(
-            mine=user_is_member_of, top=top, skip=skip
+        teams = cached(
+            "teams",
+            core_client,
+            ("all", user_is_member_of, top, skip),
+            lambda: core_client.get_all_teams(
+                mine=user_is_member_of, top=top, skip=skip
+            ),
+            fresh=fresh,
         )
 
         if not teams:
@@ -205,7 +214,7 @@ def _get_all_teams_impl(
 
 
 def _get_team_members_impl(
-    core_client: CoreClient,
+    core_client: "CoreClient",
     project_id: str,
     team_id: str,
     top: Optional[int] = None,
@@ -259,6 +268,8 @@ def _get_team_area_paths_impl(
     Returns:
         Formatted string containing team area path information
     """
+    from azure.devops.v7_1.work.models import TeamContext
+
     try:
         # Create a TeamContext object
         team_context = TeamContext(
@@ -298,6 +309,8 @@ def _get_team_iterations_impl(
     Returns:
         Formatted string containing team iteration information
     """
+    from azure.devops.v7_1.work.models import TeamContext
+
     try:
         # Create a TeamContext object
         team_context = TeamContext(
@@ -341,6 +354,7 @@ def register_tools(mcp) -> None:
         user_is_member_of: Optional[bool] = None,
         top: Optional[int] = None,
         skip: Optional[int] = None,
+        fresh: bool = False,
     ) -> str:
         """
         Retrieves all teams in the Azure DevOps organization.
@@ -357,6 +371,7 @@ def register_tools(mcp) -> None:
                 has read access to.
             top: Maximum number of teams to return
             skip: Number of teams to skip
+            fresh: Fetch the latest data instead of a recently cached copy
 
         Returns:
             Formatted string containing team information including names,
@@ -366,7 +381,7 @@ def register_tools(mcp) -> None:
         try:
             core_client = get_core_client()
             return _get_all_teams_impl(
-                core_client, user_is_member_of, top, skip
+                core_client, user_is_member_of, top, skip, fresh=fresh
             )
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
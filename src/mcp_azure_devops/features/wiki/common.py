@@ -4,14 +4,17 @@ Common utilities for Azure DevOps teams features.
 This module provides shared functionality used by both tools and resources.
 """
 
-from azure.devops.v7_1.search import SearchClient
-from azure.devops.v7_1.wiki import WikiClient
+from typing import TYPE_CHECKING
 
 from mcp_azure_devops.utils.azure_client import get_connection
 from mcp_azure_devops.utils.exceptions import AzureDevOpsClientError
 
+if TYPE_CHECKING:
+    from azure.devops.v7_1.search import SearchClient
+    from azure.devops.v7_1.wiki import WikiClient
 
-def get_wiki_client() -> WikiClient:
+
+def get_wiki_client() -> "WikiClient":
     """
     Get the wiki client for Azure DevOps.
 
@@ -33,7 +36,7 @@ def get_wiki_client() -> WikiClient:
     return wiki_client
 
 
-def get_search_client() -> SearchClient:
+def get_search_client() -> "SearchClient":
     """
     Get the search client for Azure DevOps.
 
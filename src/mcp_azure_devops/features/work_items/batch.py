@@ -0,0 +1,60 @@
+"""
+Batched retrieval of work items.
+
+The work items batch API accepts at most 200 IDs per request. Longer ID
+lists are split into chunks of that size, which are fetched concurrently
+and put back together in the order the IDs were requested.
+"""
+
+from typing import TYPE_CHECKING, List, Sequence, Tuple
+
+from mcp_azure_devops.utils.concurrency import map_concurrently
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+    from azure.devops.v7_1.work_item_tracking.models import WorkItem
+
+# Largest number of IDs the work items batch API accepts
+MAX_BATCH_SIZE = 200
+
+
+def get_work_items_batched(
+    wit_client: "WorkItemTrackingClient",
+    ids: Sequence[int],
+    **kwargs,
+) -> Tuple[List["WorkItem"], List[int]]:
+    """
+    Get any number of work items, 200 IDs per request.
+
+    IDs that do not exist or cannot be read are left out rather than
+    failing the whole batch. Duplicate IDs are fetched once.
+
+    Args:
+        wit_client: Work item tracking client
+        ids: Work item IDs
+        **kwargs: Further arguments for get_work_items, such as expand
+
+    Returns:
+        Tuple containing (work items in the requested order, omitted IDs)
+    """
+    unique_ids = list(dict.fromkeys(int(i) for i in ids))
+    chunks = [
+        unique_ids[start : start + MAX_BATCH_SIZE]
+        for start in range(0, len(unique_ids), MAX_BATCH_SIZE)
+    ]
+
+    def fetch(chunk: List[int]) -> list:
+        return (
+            wit_client.get_work_items(ids=chunk, error_policy="omit", **kwargs)
+            or []
+        )
+
+    found = {}
+    for work_items in map_concurrently(fetch, chunks):
+        for work_item in work_items:
+            if work_item is not None and work_item.id is not None:
+                found[int(work_item.id)] = work_item
+
+    ordered = [found[i] for i in unique_ids if i in found]
+    omitted = [i for i in unique_ids if i not in found]
+    return ordered, omitted
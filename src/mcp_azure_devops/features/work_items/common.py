@@ -4,13 +4,16 @@ Common utilities for Azure DevOps work item features.
 This module provides shared functionality used by both tools and resources.
 """
 
-from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+from typing import TYPE_CHECKING
 
 from mcp_azure_devops.utils.azure_client import get_connection
 from mcp_azure_devops.utils.exceptions import AzureDevOpsClientError
 
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
 
-def get_work_item_client() -> WorkItemTrackingClient:
+
+def get_work_item_client() -> "WorkItemTrackingClient":
     """
     Get the work item tracking client.
 
@@ -4,7 +4,12 @@ Formatting utilities for Azure DevOps work items.
 This module provides functions to format work items for display.
 """
 
-from azure.devops.v7_1.work_item_tracking.models import WorkItem
+from typing import TYPE_CHECKING
+
+from mcp_azure_devops.utils.tracing import traced
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking.models import WorkItem
 
 
 def _format_field_value(field_value) -> str:
@@ -96,7 +101,8 @@ def _format_build_info(fields: dict) -> list[str]:
     return build_info
 
 
-def format_work_item(work_item: WorkItem) -> str:
+@traced("format_work_item")
+def format_work_item(work_item: "WorkItem") -> str:
     """
     Format work item information for display.
 
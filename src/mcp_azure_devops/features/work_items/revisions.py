@@ -0,0 +1,194 @@
+"""
+Work items cached by ID and revision.
+
+A revision of a work item never changes once written, so its body can be
+kept for as long as the cache has room. Before a cached body is used, the
+current revision of the work item is fetched, which asks for a single
+field of every requested work item in one small request. Work items whose
+revision has moved on, or that were never cached, are fetched in full.
+
+Work items the cache holds nothing for skip the revision check, so a cold
+read costs no more requests than before. The bodies returned by writes are
+cached too, so a work item that was just created or updated is already
+cached when it is read.
+
+Bodies are cached separately for each form they were fetched in (expanded
+relations, all fields or selected fields). Cached work items are shared;
+copy them before changing them.
+"""
+
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
+
+from mcp_azure_devops.features.work_items.batch import (
+    get_work_items_batched,
+)
+from mcp_azure_devops.utils.cache import cache_scope, get_cache
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+    from azure.devops.v7_1.work_item_tracking.models import WorkItem
+
+REVISION_FIELD = "System.Rev"
+
+# Work item bodies by (ID, revision, form); they never change
+_REVISIONS = "work_item_revisions"
+# Last revision cached of each work item, so uncached ones skip the check
+_LATEST = "work_item_latest"
+
+
+def _form(expand: Optional[str], fields: Optional[Sequence[str]]) -> tuple:
+    """Identify the form a work item was fetched in."""
+    return (
+        expand.lower() if expand else None,
+        tuple(fields) if fields else None,
+    )
+
+
+def _arguments(
+    expand: Optional[str], fields: Optional[Sequence[str]], as_of
+) -> dict:
+    arguments = {}
+    if expand:
+        arguments["expand"] = expand
+    if fields:
+        arguments["fields"] = list(fields)
+    if as_of is not None:
+        arguments["as_of"] = as_of
+    return arguments
+
+
+def remember_work_item(
+    wit_client: "WorkItemTrackingClient",
+    work_item: "WorkItem",
+    expand: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> None:
+    """
+    Cache a work item under its revision.
+
+    Work items without a revision are not cached, since they could never
+    be checked.
+
+    Args:
+        wit_client: Work item tracking client the work item came from
+        work_item: The work item
+        expand: Expand argument the work item was fetched with
+        fields: Fields the work item was fetched with
+    """
+    rev = getattr(work_item, "rev", None)
+    if work_item is None or not isinstance(rev, int) or work_item.id is None:
+        return
+    cache = get_cache()
+    scope = cache_scope(wit_client)
+    item_id = int(work_item.id)
+    form = _form(expand, fields)
+    cache.set(_REVISIONS, (scope, (item_id, rev, form)), work_item)
+    cache.set(_LATEST, (scope, (item_id, form)), rev)
+
+
+def _cached_revision(
+    scope: str, item_id: int, rev, form: tuple
+) -> Optional["WorkItem"]:
+    if not isinstance(rev, int):
+        return None
+    return get_cache().get(_REVISIONS, (scope, (item_id, rev, form)))
+
+
+def _was_cached(scope: str, item_id: int, form: tuple) -> bool:
+    return get_cache().get(_LATEST, (scope, (item_id, form))) is not None
+
+
+def get_work_item_cached(
+    wit_client: "WorkItemTrackingClient",
+    item_id: int,
+    expand: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    as_of=None,
+) -> "WorkItem":
+    """
+    Get a work item, from the cache when its revision is cached.
+
+    Args:
+        wit_client: Work item tracking client
+        item_id: Work item ID
+        expand: Expand argument for get_work_item
+        fields: Fields to fetch
+        as_of: Point in time to get the work item at
+
+    Returns:
+        The work item
+
+    Raises:
+        AzureDevOpsServiceError: If the work item cannot be read
+    """
+    scope = cache_scope(wit_client)
+    form = _form(expand, fields)
+    if _was_cached(scope, item_id, form):
+        current = wit_client.get_work_item(
+            item_id, **_arguments(None, [REVISION_FIELD], as_of)
+        )
+        cached = _cached_revision(scope, item_id, current.rev, form)
+        if cached is not None:
+            return cached
+
+    work_item = wit_client.get_work_item(
+        item_id, **_arguments(expand, fields, as_of)
+    )
+    remember_work_item(wit_client, work_item, expand, fields)
+    return work_item
+
+
+def get_work_items_cached(
+    wit_client: "WorkItemTrackingClient",
+    ids: Sequence[int],
+    expand: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    as_of=None,
+) -> Tuple[List["WorkItem"], List[int]]:
+    """
+    Get any number of work items, from the cache where it is current.
+
+    Args:
+        wit_client: Work item tracking client
+        ids: Work item IDs
+        expand: Expand argument for get_work_items
+        fields: Fields to fetch
+        as_of: Point in time to get the work items at
+
+    Returns:
+        Tuple containing (work items in the requested order, omitted IDs)
+    """
+    unique_ids = list(dict.fromkeys(int(i) for i in ids))
+    scope = cache_scope(wit_client)
+    form = _form(expand, fields)
+
+    found = {}
+    gone = set()
+    known = [i for i in unique_ids if _was_cached(scope, i, form)]
+    if known:
+        current, gone_ids = get_work_items_batched(
+            wit_client, known, **_arguments(None, [REVISION_FIELD], as_of)
+        )
+        gone.update(gone_ids)
+        for work_item in current:
+            if work_item.id is None:
+                continue
+            item_id = int(work_item.id)
+            cached = _cached_revision(scope, item_id, work_item.rev, form)
+            if cached is not None:
+                found[item_id] = cached
+
+    stale = [i for i in unique_ids if i not in found and i not in gone]
+    if stale:
+        work_items, _ = get_work_items_batched(
+            wit_client, stale, **_arguments(expand, fields, as_of)
+        )
+        for work_item in work_items:
+            if work_item.id is None:
+                continue
+            remember_work_item(wit_client, work_item, expand, fields)
+            found[int(work_item.id)] = work_item
+
+    ordered = [found[i] for i in unique_ids if i in found]
+    omitted = [i for i in unique_ids if i not in found]
+    return ordered, omitted
@@ -4,15 +4,18 @@ Comment operations for Azure DevOps work items.
 This module provides MCP tools for retrieving and adding work item comments.
 """
 
-from typing import Optional
-
-from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
-from azure.devops.v7_1.work_item_tracking.models import CommentCreate
+from typing import TYPE_CHECKING, Optional
 
 from mcp_azure_devops.features.work_items.common import (
     AzureDevOpsClientError,
     get_work_item_client,
 )
+from mcp_azure_devops.features.work_items.revisions import (
+    get_work_item_cached,
+)
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
 
 
 def _format_comment(comment) -> str:
@@ -48,7 +51,7 @@ def _format_comment(comment) -> str:
 
 
 def _get_project_for_work_item(
-    item_id: int, wit_client: WorkItemTrackingClient
+    item_id: int, wit_client: "WorkItemTrackingClient"
 ) -> Optional[str]:
     """
     Get the project name for a work item.
@@ -61,7 +64,8 @@ def _get_project_for_work_item(
         Project name or None if not found
     """
     try:
-        work_item = wit_client.get_work_item(item_id)
+        # The same form get_work_item reads, so either can use the cache
+        work_item = get_work_item_cached(wit_client, item_id, expand="all")
         if work_item and work_item.fields:
             return work_item.fields.get("System.TeamProject")
     except Exception:
@@ -72,7 +76,7 @@ def _get_project_for_work_item(
 
 def _get_work_item_comments_impl(
     item_id: int,
-    wit_client: WorkItemTrackingClient,
+    wit_client: "WorkItemTrackingClient",
     project: Optional[str] = None,
 ) -> str:
     """
@@ -110,7 +114,7 @@ def _get_work_item_comments_impl(
 def _add_work_item_comment_impl(
     item_id: int,
     text: str,
-    wit_client: WorkItemTrackingClient,
+    wit_client: "WorkItemTrackingClient",
     project: Optional[str] = None,
 ) -> str:
     """
@@ -133,6 +137,8 @@ def _add_work_item_comment_impl(
             return f"Error retrieving work item {item_id} to determine project"
 
     # Create comment request
+    from azure.devops.v7_1.work_item_tracking.models import CommentCreate
+
     comment_request = CommentCreate(text=text)
 
     # Add the comment
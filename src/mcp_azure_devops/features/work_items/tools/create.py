@@ -5,16 +5,17 @@ This module provides MCP tools for creating work items.
 """
 
 import os
-from typing import Any, Dict, Optional
-
-from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
-from azure.devops.v7_1.work_item_tracking.models import JsonPatchOperation
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from mcp_azure_devops.features.work_items.common import (
     AzureDevOpsClientError,
     get_work_item_client,
 )
 from mcp_azure_devops.features.work_items.formatting import format_work_item
+from mcp_azure_devops.features.work_items.revisions import remember_work_item
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
 
 
 def _build_field_document(
@@ -30,6 +31,10 @@ def _build_field_document(
     Returns:
         List of JsonPatchOperation objects
     """
+    from azure.devops.v7_1.work_item_tracking.models import (
+        JsonPatchOperation,
+    )
+
     document = []
 
     for field_name, field_value in fields.items():
@@ -69,6 +74,10 @@ def _build_link_document(target_id: int, link_type: str, org_url: str) -> list:
     Returns:
         List of JsonPatchOperation objects
     """
+    from azure.devops.v7_1.work_item_tracking.models import (
+        JsonPatchOperation,
+    )
+
     return [
         JsonPatchOperation(
             op="add",
@@ -85,7 +94,7 @@ def _create_work_item_impl(
     fields: Dict[str, Any],
     project: str,
     work_item_type: str,
-    wit_client: WorkItemTrackingClient,
+    wit_client: "WorkItemTrackingClient",
     parent_id: Optional[int] = None,
 ) -> str:
     """
@@ -103,10 +112,11 @@ def _create_work_item_impl(
     """
     document = _build_field_document(fields)
 
-    # Create the work item
+    # Create the work item, returned in the form get_work_item caches
     new_work_item = wit_client.create_work_item(
-        document=document, project=project, type=work_item_type
+        document=document, project=project, type=work_item_type, expand="all"
     )
+    remember_work_item(wit_client, new_work_item, expand="all")
 
     # If parent_id is provided, establish parent-child relationship
     if parent_id:
@@ -123,8 +133,12 @@ def _create_work_item_impl(
 
             # Update the work item to add the parent link
             new_work_item = wit_client.update_work_item(
-                document=link_document, id=new_work_item.id, project=project
+                document=link_document,
+                id=new_work_item.id,
+                project=project,
+                expand="all",
             )
+            remember_work_item(wit_client, new_work_item, expand="all")
         except Exception as e:
             return (
                 f"Work item created successfully, but failed to establish "
@@ -139,7 +153,7 @@ def _create_work_item_impl(
 def _update_work_item_impl(
     id: int,
     fields: Dict[str, Any],
-    wit_client: WorkItemTrackingClient,
+    wit_client: "WorkItemTrackingClient",
     project: Optional[str] = None,
 ) -> str:
     """
@@ -158,8 +172,9 @@ def _update_work_item_impl(
 
     # Update the work item
     updated_work_item = wit_client.update_work_item(
-        document=document, id=id, project=project
+        document=document, id=id, project=project, expand="all"
     )
+    remember_work_item(wit_client, updated_work_item, expand="all")
 
     return format_work_item(updated_work_item)
 
@@ -168,7 +183,7 @@ def _add_link_to_work_item_impl(
     source_id: int,
     target_id: int,
     link_type: str,
-    wit_client: WorkItemTrackingClient,
+    wit_client: "WorkItemTrackingClient",
     project: Optional[str] = None,
 ) -> str:
     """
@@ -192,8 +207,9 @@ def _add_link_to_work_item_impl(
 
     # Update the work item to add the link
     updated_work_item = wit_client.update_work_item(
-        document=link_document, id=source_id, project=project
+        document=link_document, id=source_id, project=project, expand="all"
     )
+    remember_work_item(wit_client, updated_work_item, expand="all")
 
     return format_work_item(updated_work_item)
 
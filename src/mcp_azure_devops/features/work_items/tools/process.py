@@ -8,6 +8,7 @@ from mcp_azure_devops.utils.azure_client import (
     get_core_client,
     get_work_item_tracking_process_client,
 )
+from mcp_azure_devops.utils.cache import cached
 
 
 def _format_table(headers, rows):
@@ -97,11 +98,17 @@ def _get_process_details_impl(process_id: str) -> str:
         )
 
 
-def _list_processes_impl() -> str:
+def _list_processes_impl(fresh: bool = False) -> str:
     """Implementation of processes list retrieval."""
     try:
         process_client = get_work_item_tracking_process_client()
-        processes = process_client.get_list_of_processes()
+        processes = cached(
+            "processes",
+            process_client,
+            "list",
+            process_client.get_list_of_processes,
+            fresh=fresh,
+        )
 
         if not processes:
             return "No processes found in the organization."
@@ -182,7 +189,7 @@ def register_tools(mcp) -> None:
             return f"Error: {str(e)}"
 
     @mcp.tool()
-    def list_processes() -> str:
+    def list_processes(fresh: bool = False) -> str:
         """
         Lists all available processes in the organization.
 
@@ -191,11 +198,14 @@ def register_tools(mcp) -> None:
         - Find process IDs for project creation or configuration
         - Check which process is set as the default
 
+        Args:
+            fresh: Fetch the latest data instead of a recently cached copy
+
         Returns:
             A formatted table of all processes with names, IDs, and
             descriptions
         """
         try:
-            return _list_processes_impl()
+            return _list_processes_impl(fresh)
         except Exception as e:
             return f"Error: {str(e)}"
@@ -2,57 +2,223 @@
 Query operations for Azure DevOps work items.
 
 This module provides MCP tools for querying work items.
-"""
 
-from typing import Optional
+A query is executed once. The IDs it matched are kept in the cache under
+a cursor, and the work items are fetched one page at a time, so reading
+further results does not run the query again. A query returns at most
+20,000 work items unless all results are asked for, in which case it is
+partitioned (see wiql.py).
+"""
 
-from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
-from azure.devops.v7_1.work_item_tracking.models import Wiql
+import copy
+import secrets
+from typing import TYPE_CHECKING, Optional
 
 from mcp_azure_devops.features.work_items.common import (
     AzureDevOpsClientError,
     get_work_item_client,
 )
 from mcp_azure_devops.features.work_items.formatting import format_work_item
+from mcp_azure_devops.features.work_items.revisions import (
+    get_work_items_cached,
+)
+from mcp_azure_devops.features.work_items.tools.read import _format_omitted
+from mcp_azure_devops.features.work_items.wiql import (
+    MAX_QUERY_RESULTS,
+    query_work_item_ids,
+)
+from mcp_azure_devops.utils import metrics
+from mcp_azure_devops.utils.cache import cache_scope, get_cache
+from mcp_azure_devops.utils.instrumentation import FORMAT_DURATION
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+
+DEFAULT_PAGE_SIZE = 30
+
+
+def _fetch_arguments(
+    as_of, fields: Optional[list[str]], include_relations: bool
+) -> dict:
+    """
+    Choose what to fetch for the work items a query returned.
+
+    Only the selected fields are requested, as of the time the query ran.
+    The API cannot combine a field list with expanded relations, so those
+    are fetched with every field and trimmed locally.
+    """
+    arguments = {"as_of": as_of}
+    if include_relations:
+        arguments["expand"] = "relations"
+    elif fields:
+        arguments["fields"] = fields
+    else:
+        arguments["expand"] = "all"
+    return arguments
+
+
+def _selected_fields(
+    query_result, fields: Optional[list[str]]
+) -> Optional[list[str]]:
+    """Get the fields to show: the given ones or the query's SELECT list."""
+    if fields:
+        return list(fields)
+    columns = [
+        column.reference_name
+        for column in query_result.columns or []
+        if getattr(column, "reference_name", None)
+    ]
+    return columns or None
+
+
+def _save_cursor(wit_client: "WorkItemTrackingClient", state: dict) -> str:
+    """
+    Keep a query's results for paging.
+
+    Returns:
+        The cursor, or an empty string when the cache is disabled
+    """
+    cursor = secrets.token_urlsafe(12)
+    cache = get_cache()
+    key = (cache_scope(wit_client), cursor)
+    cache.set("query_cursors", key, state)
+    if cache.get("query_cursors", key) is None:
+        return ""
+    return cursor
+
+
+def _load_cursor(
+    wit_client: "WorkItemTrackingClient", cursor: str
+) -> Optional[dict]:
+    return get_cache().get("query_cursors", (cache_scope(wit_client), cursor))
+
+
+def _format_page(
+    wit_client: "WorkItemTrackingClient",
+    state: dict,
+    offset: int,
+    page_size: int,
+    cursor: str,
+) -> str:
+    """Fetch and format one page of a query's results."""
+    ids = state["ids"]
+    end = min(offset + page_size, len(ids))
+    fields = state["fields"]
+    work_items, omitted = get_work_items_cached(
+        wit_client,
+        ids[offset:end],
+        **_fetch_arguments(state["as_of"], fields, state["include_relations"]),
+    )
+    if fields and state["include_relations"]:
+        # Trim copies: the work items may be shared with the cache
+        work_items = [copy.copy(work_item) for work_item in work_items]
+        for work_item in work_items:
+            work_item.fields = {
+                name: value
+                for name, value in (work_item.fields or {}).items()
+                if name in fields
+            }
+
+    # Use the standard formatting for all work items
+    formatted_results = []
+    with metrics.timer(FORMAT_DURATION, tool="query_work_items"):
+        for work_item in work_items:
+            formatted_results.append(format_work_item(work_item))
+    if omitted:
+        formatted_results.append(_format_omitted(omitted))
+
+    if end < len(ids):
+        summary = f"Showing work items {offset + 1}-{end} of {len(ids)}."
+        if cursor:
+            summary += (
+                " For the next page, call get_query_page with cursor "
+                f'"{cursor}:{end}".'
+            )
+        else:
+            summary += " Raise top to see more."
+        formatted_results.append(summary)
+    if state.get("truncated"):
+        formatted_results.append(
+            f"The query may match more than {MAX_QUERY_RESULTS:,} work "
+            "items; run query_work_items with all_results=true to read "
+            "them all."
+        )
+
+    return "\n\n".join(formatted_results)
 
 
 def _query_work_items_impl(
-    query: str, top: int, wit_client: WorkItemTrackingClient
+    query: str,
+    top: int,
+    wit_client: "WorkItemTrackingClient",
+    fields: Optional[list[str]] = None,
+    include_relations: bool = False,
+    all_results: bool = False,
 ) -> str:
     """
     Implementation of query_work_items that operates with a client.
 
     Args:
         query: The WIQL query string
-        top: Maximum number of results to return
+        top: Maximum number of results to return in the first page
         wit_client: Work item tracking client
+        fields: Fields to return instead of the query's SELECT list
+        include_relations: Also fetch links to other work items
+        all_results: Read past the 20,000 results one query returns
 
     Returns:
-        Formatted string containing work item details
+        Formatted string containing work item details, and a cursor for
+        the next page when there are more results
     """
-
-    # Create the WIQL query
-    wiql = Wiql(query=query)
-
-    # Execute the query
-    wiql_results = wit_client.query_by_wiql(wiql, top=top).work_items
+    # Execute the query once for every page
+    query_result = query_work_item_ids(wit_client, query, all_results)
+    wiql_results = query_result.work_items
 
     if not wiql_results:
         return "No work items found matching the query."
 
-    # Get the work items from the results
-    work_item_ids = [int(res.id) for res in wiql_results]
-    work_items = wit_client.get_work_items(
-        ids=work_item_ids, expand="all", error_policy="omit"
-    )
+    state = {
+        "ids": [int(res.id) for res in wiql_results],
+        "fields": _selected_fields(query_result, fields),
+        "as_of": query_result.as_of,
+        "include_relations": include_relations,
+        "truncated": not all_results
+        and len(wiql_results) >= MAX_QUERY_RESULTS,
+    }
+    cursor = ""
+    if len(state["ids"]) > top:
+        cursor = _save_cursor(wit_client, state)
+    return _format_page(wit_client, state, 0, top, cursor)
 
-    # Use the standard formatting for all work items
-    formatted_results = []
-    for work_item in work_items:
-        if work_item:
-            formatted_results.append(format_work_item(work_item))
 
-    return "\n\n".join(formatted_results)
+def _get_query_page_impl(
+    cursor: str, top: int, wit_client: "WorkItemTrackingClient"
+) -> str:
+    """
+    Implementation of get_query_page that operates with a client.
+
+    Args:
+        cursor: Cursor returned with the previous page
+        top: Maximum number of results to return
+        wit_client: Work item tracking client
+
+    Returns:
+        Formatted string containing work item details, and a cursor for
+        the next page when there are more results
+    """
+    query_id, _, offset = cursor.partition(":")
+    if not offset.isdigit():
+        return f"Error: Invalid cursor: {cursor}"
+
+    state = _load_cursor(wit_client, query_id)
+    if state is None:
+        return (
+            "Error: The cursor has expired. Run query_work_items again to "
+            "start over."
+        )
+    if int(offset) >= len(state["ids"]):
+        return "No more work items."
+    return _format_page(wit_client, state, int(offset), top, query_id)
 
 
 def register_tools(mcp) -> None:
@@ -64,7 +230,13 @@ def register_tools(mcp) -> None:
     """
 
     @mcp.tool()
-    def query_work_items(query: str, top: Optional[int] = None) -> str:
+    def query_work_items(
+        query: str,
+        top: Optional[int] = None,
+        fields: Optional[list[str]] = None,
+        include_relations: bool = False,
+        all_results: bool = False,
+    ) -> str:
         """
         Searches for work items using Work Item Query Language (WIQL).
 
@@ -78,17 +250,69 @@ def register_tools(mcp) -> None:
         work items based on their fields. The query must follow Azure DevOps
         WIQL syntax rules, with proper SELECT, FROM, and WHERE clauses.
 
+        Only the fields named in the SELECT clause are returned, so select
+        the columns you need (e.g., "SELECT [System.Id], [System.Title],
+        [System.State] FROM workitems WHERE ...").
+
+        When more work items match than fit in one page, the response ends
+        with a cursor; pass it to get_query_page to read the next page
+        without running the query again. Only the first 20,000 matches can
+        be paged through unless all_results is set, which runs the query in
+        several parts and takes longer.
+
+        Args:
+            query: The WIQL query string (e.g., "SELECT [System.Title] FROM
+                workitems WHERE [System.State] = 'Active'")
+            top: Maximum number of results to return (default: 30)
+            fields: Field reference names to return instead of the SELECT
+                list (e.g., ["System.Title", "System.AssignedTo"])
+            include_relations: Also return links to related work items
+                (default: false)
+            all_results: Page through every match, even beyond 20,000
+                (default: false)
+
+        Returns:
+            Formatted string containing the selected fields of each
+            matching work item, formatted as markdown
+        """
+        try:
+            wit_client = get_work_item_client()
+            return _query_work_items_impl(
+                query,
+                top or DEFAULT_PAGE_SIZE,
+                wit_client,
+                fields,
+                include_relations,
+                all_results,
+            )
+        except AzureDevOpsClientError as e:
+            return f"Error: {str(e)}"
+
+    @mcp.tool()
+    def get_query_page(cursor: str, top: Optional[int] = None) -> str:
+        """
+        Continues reading the results of a work item query.
+
+        Use this tool when you need to:
+        - See more results than query_work_items returned
+        - Walk through a large result set page by page
+
+        The query is not run again: pages come from the results captured
+        when query_work_items ran, with the same fields. Cursors expire
+        15 minutes after the query ran.
+
         Args:
-            query: The WIQL query string (e.g., "SELECT * FROM workitems
-                WHERE [System.State] = 'Active'")
+            cursor: The cursor given at the end of the previous page
             top: Maximum number of results to return (default: 30)
 
         Returns:
-            Formatted string containing detailed information for each matching
-            work item, with all fields and values formatted as markdown
+            Formatted string containing the next work items, and a cursor
+            for the page after it when there are more results
         """
         try:
             wit_client = get_work_item_client()
-            return _query_work_items_impl(query, top or 30, wit_client)
+            return _get_query_page_impl(
+                cursor, top or DEFAULT_PAGE_SIZE, wit_client
+            )
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
@@ -4,17 +4,32 @@ Read operations for Azure DevOps work items.
 This module provides MCP tools for retrieving work item information.
 """
 
-from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+from typing import TYPE_CHECKING
 
 from mcp_azure_devops.features.work_items.common import (
     AzureDevOpsClientError,
     get_work_item_client,
 )
 from mcp_azure_devops.features.work_items.formatting import format_work_item
+from mcp_azure_devops.features.work_items.revisions import (
+    get_work_item_cached,
+    get_work_items_cached,
+)
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+
+
+def _format_omitted(ids: list[int]) -> str:
+    """Report work items that were requested but not returned."""
+    return (
+        "Work items not found or not accessible: "
+        f"{', '.join(str(i) for i in ids)}"
+    )
 
 
 def _get_work_item_impl(
-    item_id: int | list[int], wit_client: WorkItemTrackingClient
+    item_id: int | list[int], wit_client: "WorkItemTrackingClient"
 ) -> str:
     """
     Implementation of work item retrieval.
@@ -29,25 +44,25 @@ def _get_work_item_impl(
     try:
         if isinstance(item_id, int):
             # Handle single work item
-            work_item = wit_client.get_work_item(item_id, expand="all")
+            work_item = get_work_item_cached(wit_client, item_id, expand="all")
             return format_work_item(work_item)
         else:
             # Handle list of work items
-            work_items = wit_client.get_work_items(
-                ids=item_id, error_policy="omit", expand="all"
+            if not item_id:
+                return "No work items found."
+            work_items, omitted = get_work_items_cached(
+                wit_client, item_id, expand="all"
             )
 
             if not work_items:
-                return "No work items found."
-
-            formatted_results = []
-            for work_item in work_items:
-                if work_item:  # Skip None values (failed retrievals)
-                    formatted_results.append(format_work_item(work_item))
-
-            if not formatted_results:
                 return "No valid work items found with the provided IDs."
 
+            formatted_results = [
+                format_work_item(work_item) for work_item in work_items
+            ]
+            if omitted:
+                formatted_results.append(_format_omitted(omitted))
+
             return "\n\n".join(formatted_results)
     except Exception as e:
         if isinstance(item_id, int):
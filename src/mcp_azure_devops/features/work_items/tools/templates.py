@@ -4,15 +4,16 @@ Work item templates operations for Azure DevOps.
 This module provides MCP tools for retrieving work item templates.
 """
 
-from typing import Optional
-
-from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+from typing import TYPE_CHECKING, Optional
 
 from mcp_azure_devops.features.work_items.common import (
     AzureDevOpsClientError,
     get_work_item_client,
 )
 
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+
 
 def _format_table(headers, rows):
     """Format data as a markdown table."""
@@ -56,7 +57,7 @@ def _create_team_context(team_context_dict):
 def _get_work_item_templates_impl(
     team_context: dict,
     work_item_type: Optional[str],
-    wit_client: WorkItemTrackingClient,
+    wit_client: "WorkItemTrackingClient",
 ) -> str:
     """Implementation of work item templates retrieval."""
     try:
@@ -100,7 +101,7 @@ def _get_work_item_templates_impl(
 
 
 def _get_work_item_template_impl(
-    team_context: dict, template_id: str, wit_client: WorkItemTrackingClient
+    team_context: dict, template_id: str, wit_client: "WorkItemTrackingClient"
 ) -> str:
     """Implementation of work item template detail retrieval."""
     try:
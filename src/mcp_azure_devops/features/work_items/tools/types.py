@@ -4,7 +4,7 @@ Work item types and fields operations for Azure DevOps.
 This module provides MCP tools for retrieving work item types and fields.
 """
 
-from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+from typing import TYPE_CHECKING
 
 from mcp_azure_devops.features.work_items.common import (
     AzureDevOpsClientError,
@@ -14,6 +14,10 @@ from mcp_azure_devops.utils.azure_client import (
     get_core_client,
     get_work_item_tracking_process_client,
 )
+from mcp_azure_devops.utils.cache import cached
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
 
 
 def _format_table(headers, rows):
@@ -59,10 +63,16 @@ def _format_work_item_type(wit):
 
 
 def _get_work_item_types_impl(
-    project: str, wit_client: WorkItemTrackingClient
+    project: str, wit_client: "WorkItemTrackingClient", fresh: bool = False
 ) -> str:
     """Implementation of work item types retrieval."""
-    work_item_types = wit_client.get_work_item_types(project)
+    work_item_types = cached(
+        "work_item_types",
+        wit_client,
+        (project,),
+        lambda: wit_client.get_work_item_types(project),
+        fresh=fresh,
+    )
 
     if not work_item_types:
         return f"No work item types found in project {project}."
@@ -81,11 +91,62 @@ def _get_work_item_types_impl(
     )
 
 
+def _get_cached_work_item_type(
+    project: str,
+    type_name: str,
+    wit_client: "WorkItemTrackingClient",
+    fresh: bool = False,
+):
+    """Get a work item type through the metadata cache."""
+    return cached(
+        "work_item_types",
+        wit_client,
+        (project, type_name),
+        lambda: wit_client.get_work_item_type(project, type_name),
+        fresh=fresh,
+    )
+
+
+def _get_cached_process_id(project: str, fresh: bool = False):
+    """Get the ID of a project's process through the metadata cache."""
+    core_client = get_core_client()
+    project_details = cached(
+        "projects",
+        core_client,
+        ("capabilities", project),
+        lambda: core_client.get_project(project, include_capabilities=True),
+        fresh=fresh,
+    )
+    return project_details.capabilities.get("processTemplate", {}).get(
+        "templateTypeId"
+    )
+
+
+def _get_cached_type_fields(
+    process_client, process_id: str, wit_ref_name: str, fresh: bool = False
+):
+    """Get all fields of a work item type through the metadata cache."""
+    return cached(
+        "fields",
+        process_client,
+        (process_id, wit_ref_name),
+        lambda: process_client.get_all_work_item_type_fields(
+            process_id, wit_ref_name
+        ),
+        fresh=fresh,
+    )
+
+
 def _get_work_item_type_impl(
-    project: str, type_name: str, wit_client: WorkItemTrackingClient
+    project: str,
+    type_name: str,
+    wit_client: "WorkItemTrackingClient",
+    fresh: bool = False,
 ) -> str:
     """Implementation of work item type detail retrieval."""
-    work_item_type = wit_client.get_work_item_type(project, type_name)
+    work_item_type = _get_cached_work_item_type(
+        project, type_name, wit_client, fresh
+    )
 
     if not work_item_type:
         return f"Work item type '{type_name}' not found in project {project}."
@@ -94,12 +155,15 @@ def _get_work_item_type_impl(
 
 
 def _get_work_item_type_fields_impl(
-    project: str, type_name: str, wit_client: WorkItemTrackingClient
+    project: str,
+    type_name: str,
+    wit_client: "WorkItemTrackingClient",
+    fresh: bool = False,
 ) -> str:
     """Implementation of work item type fields retrieval using process API."""
     try:
         # Get the work item type to get its reference name
-        wit = wit_client.get_work_item_type(project, type_name)
+        wit = _get_cached_work_item_type(project, type_name, wit_client, fresh)
         if not wit:
             return (
                 f"Work item type '{type_name}' not found in project {project}."
@@ -108,21 +172,15 @@ def _get_work_item_type_fields_impl(
         wit_ref_name = wit.reference_name
 
         # Get project process info
-        core_client = get_core_client()
-        project_details = core_client.get_project(
-            project, include_capabilities=True
-        )
-        process_id = project_details.capabilities.get(
-            "processTemplate", {}
-        ).get("templateTypeId")
+        process_id = _get_cached_process_id(project, fresh)
 
         if not process_id:
             return f"Could not determine process ID for project {project}"
 
         # Get process client and fields for this work item type
         process_client = get_work_item_tracking_process_client()
-        fields = process_client.get_all_work_item_type_fields(
-            process_id, wit_ref_name
+        fields = _get_cached_type_fields(
+            process_client, process_id, wit_ref_name, fresh
         )
 
         if not fields:
@@ -156,13 +214,14 @@ def _get_work_item_type_field_impl(
     project: str,
     type_name: str,
     field_name: str,
-    wit_client: WorkItemTrackingClient,
+    wit_client: "WorkItemTrackingClient",
+    fresh: bool = False,
 ) -> str:
     """Implementation of work item type field detail retrieval using process
     API."""
     try:
         # Get the work item type to get its reference name
-        wit = wit_client.get_work_item_type(project, type_name)
+        wit = _get_cached_work_item_type(project, type_name, wit_client, fresh)
         if not wit:
             return (
                 f"Work item type '{type_name}' not found in project {project}."
@@ -171,13 +230,7 @@ def _get_work_item_type_field_impl(
         wit_ref_name = wit.reference_name
 
         # Get project process info
-        core_client = get_core_client()
-        project_details = core_client.get_project(
-            project, include_capabilities=True
-        )
-        process_id = project_details.capabilities.get(
-            "processTemplate", {}
-        ).get("templateTypeId")
+        process_id = _get_cached_process_id(project, fresh)
 
         if not process_id:
             return f"Could not determine process ID for project {project}"
@@ -188,8 +241,8 @@ def _get_work_item_type_field_impl(
         # Determine if field_name is a display name or reference name
         if "." not in field_name:
             # Get all fields to find the reference name
-            all_fields = process_client.get_all_work_item_type_fields(
-                process_id, wit_ref_name
+            all_fields = _get_cached_type_fields(
+                process_client, process_id, wit_ref_name, fresh
             )
             field_ref = next(
                 (
@@ -206,8 +259,14 @@ def _get_work_item_type_field_impl(
                 )
             field_name = field_ref
 
-        field = process_client.get_work_item_type_field(
-            process_id, wit_ref_name, field_name
+        field = cached(
+            "fields",
+            process_client,
+            (process_id, wit_ref_name, field_name),
+            lambda: process_client.get_work_item_type_field(
+                process_id, wit_ref_name, field_name
+            ),
+            fresh=fresh,
         )
 
         if not field:
@@ -258,7 +317,7 @@ def register_tools(mcp) -> None:
     """
 
     @mcp.tool()
-    def get_work_item_types(project: str) -> str:
+    def get_work_item_types(project: str, fresh: bool = False) -> str:
         """
         Gets a list of all work item types in a project.
 
@@ -269,6 +328,7 @@ def register_tools(mcp) -> None:
 
         Args:
             project: Project ID or project name
+            fresh: Fetch the latest data instead of a recently cached copy
 
         Returns:
             A formatted table of all work item types with names, reference
@@ -276,12 +336,14 @@ def register_tools(mcp) -> None:
         """
         try:
             wit_client = get_work_item_client()
-            return _get_work_item_types_impl(project, wit_client)
+            return _get_work_item_types_impl(project, wit_client, fresh)
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
 
     @mcp.tool()
-    def get_work_item_type(project: str, type_name: str) -> str:
+    def get_work_item_type(
+        project: str, type_name: str, fresh: bool = False
+    ) -> str:
         """
         Gets detailed information about a specific work item type.
 
@@ -293,6 +355,7 @@ def register_tools(mcp) -> None:
         Args:
             project: Project ID or project name
             type_name: The name of the work item type
+            fresh: Fetch the latest data instead of a recently cached copy
 
         Returns:
             Detailed information about the work item type including states,
@@ -300,12 +363,16 @@ def register_tools(mcp) -> None:
         """
         try:
             wit_client = get_work_item_client()
-            return _get_work_item_type_impl(project, type_name, wit_client)
+            return _get_work_item_type_impl(
+                project, type_name, wit_client, fresh
+            )
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
 
     @mcp.tool()
-    def get_work_item_type_fields(project: str, type_name: str) -> str:
+    def get_work_item_type_fields(
+        project: str, type_name: str, fresh: bool = False
+    ) -> str:
         """
         Gets a list of all fields for a specific work item type.
 
@@ -317,6 +384,7 @@ def register_tools(mcp) -> None:
         Args:
             project: Project ID or project name
             type_name: The name of the work item type
+            fresh: Fetch the latest data instead of a recently cached copy
 
         Returns:
             A formatted table of all fields with names, reference names,
@@ -325,14 +393,14 @@ def register_tools(mcp) -> None:
         try:
             wit_client = get_work_item_client()
             return _get_work_item_type_fields_impl(
-                project, type_name, wit_client
+                project, type_name, wit_client, fresh
             )
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
 
     @mcp.tool()
     def get_work_item_type_field(
-        project: str, type_name: str, field_name: str
+        project: str, type_name: str, field_name: str, fresh: bool = False
     ) -> str:
         """
         Gets detailed information about a specific field in a work item type.
@@ -346,6 +414,7 @@ def register_tools(mcp) -> None:
             project: Project ID or project name
             type_name: The name of the work item type
             field_name: The reference name or display name of the field
+            fresh: Fetch the latest data instead of a recently cached copy
 
         Returns:
             Detailed information about the field including type, allowed
@@ -354,7 +423,7 @@ def register_tools(mcp) -> None:
         try:
             wit_client = get_work_item_client()
             return _get_work_item_type_field_impl(
-                project, type_name, field_name, wit_client
+                project, type_name, field_name, wit_client, fresh
             )
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
@@ -0,0 +1,254 @@
+"""
+WIQL queries that match more work items than one query may return.
+
+Flat queries are capped at 20,000 results: Azure DevOps either rejects
+them with VS402337 or returns exactly that many. Reading past the cap
+takes many more requests, so it is only done when asked for: such queries
+are then run again in System.Id windows. The windows are pinned (ASOF) to
+the moment the ID range was measured so they see one consistent state,
+run concurrently, and any window that still overflows is halved until
+every window fits. The IDs are merged in window order, so the query's
+ORDER BY only holds within each window.
+
+Windows are added by rewriting the query text. The WHERE, ORDER BY and
+ASOF keywords are only looked for outside field names and string literals.
+"""
+
+import logging
+import math
+import re
+from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+
+from mcp_azure_devops.utils.concurrency import map_concurrently
+from mcp_azure_devops.utils.exceptions import AzureDevOpsClientError
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+    from azure.devops.v7_1.work_item_tracking.models import (
+        WorkItemQueryResult,
+    )
+
+logger = logging.getLogger(__name__)
+
+# Most work items a WIQL query can return
+MAX_QUERY_RESULTS = 20000
+
+# Windows the ID range is first split into
+INITIAL_WINDOWS = 4
+
+_OVERSIZE_ERROR = "VS402337"
+# A field name, a string literal or a word of WIQL
+_TOKEN = re.compile(r"\[[^\]]*\]|'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|\w+")
+_BY = re.compile(r"\s+BY\b", re.IGNORECASE)
+_LINK_QUERY = re.compile(r"\bFROM\s+WorkItemLinks\b", re.IGNORECASE)
+
+
+def _find_keyword(
+    query: str, keywords: Set[str], start: int = 0
+) -> Optional["re.Match[str]"]:
+    """
+    Find the first of some keywords in a WIQL query.
+
+    Field names in brackets and string literals are skipped, so neither
+    [Custom.Where] nor 'order by date' is taken for a keyword. ORDER only
+    counts when it is followed by BY.
+
+    Args:
+        query: WIQL query
+        keywords: Upper case keywords to look for
+        start: Position to start looking at
+
+    Returns:
+        The match of the keyword, or None
+    """
+    for token in _TOKEN.finditer(query, start):
+        word = token.group().upper()
+        if word in keywords and (
+            word != "ORDER" or _BY.match(query, token.end())
+        ):
+            return token
+    return None
+
+
+def restrict_query(query: str, condition: str, as_of=None) -> str:
+    """
+    Add a condition to a WIQL query, and pin it to a point in time.
+
+    Args:
+        query: WIQL query
+        condition: WIQL condition the results must also meet
+        as_of: Point in time to run the query at, unless the query already
+            has an ASOF clause
+
+    Returns:
+        The restricted query
+    """
+    where = _find_keyword(query, {"WHERE"})
+    tail = _find_keyword(query, {"ORDER", "ASOF"}, where.end() if where else 0)
+    split = tail.start() if tail else len(query)
+    if where:
+        body = query[where.end() : split].strip()
+        restricted = (
+            f"{query[: where.start()]}WHERE ({body}) AND {condition} "
+            f"{query[split:]}"
+        )
+    else:
+        restricted = (
+            f"{query[:split].rstrip()} WHERE {condition} {query[split:]}"
+        )
+    restricted = restricted.strip()
+    if as_of is not None and not _find_keyword(query, {"ASOF"}):
+        stamp = as_of.isoformat() if hasattr(as_of, "isoformat") else as_of
+        restricted += f" ASOF '{stamp}'"
+    return restricted
+
+
+def _is_oversize(error: Exception) -> bool:
+    from azure.devops.exceptions import AzureDevOpsServiceError
+
+    return isinstance(error, AzureDevOpsServiceError) and (
+        _OVERSIZE_ERROR in (error.message or "")
+    )
+
+
+def _run(
+    wit_client: "WorkItemTrackingClient", query: str, complete: bool = False
+) -> Optional["WorkItemQueryResult"]:
+    """
+    Run a query; None when it matched more than one query may return.
+
+    Args:
+        wit_client: Work item tracking client
+        query: WIQL query
+        complete: The query cannot match too much, so a full result is
+            complete rather than truncated and VS402337 is an error
+    """
+    from azure.devops.v7_1.work_item_tracking.models import Wiql
+
+    try:
+        result = wit_client.query_by_wiql(
+            Wiql(query=query), top=MAX_QUERY_RESULTS
+        )
+    except Exception as e:
+        if _is_oversize(e) and not complete:
+            return None
+        raise
+    if not complete and len(result.work_items or []) >= MAX_QUERY_RESULTS:
+        return None
+    return result
+
+
+def _id_bound(
+    wit_client: "WorkItemTrackingClient",
+) -> "WorkItemQueryResult":
+    """Find the highest work item ID, and when it was the highest."""
+    from azure.devops.v7_1.work_item_tracking.models import Wiql
+
+    return wit_client.query_by_wiql(
+        Wiql(
+            query=(
+                "SELECT [System.Id] FROM WorkItems ORDER BY [System.Id] DESC"
+            )
+        ),
+        top=1,
+    )
+
+
+def _split(window: Tuple[int, int], parts: int) -> List[Tuple[int, int]]:
+    low, high = window
+    step = max(math.ceil((high - low) / parts), 1)
+    return [
+        (start, min(start + step, high)) for start in range(low, high, step)
+    ]
+
+
+def query_work_item_ids(
+    wit_client: "WorkItemTrackingClient", query: str, partition: bool = False
+) -> "WorkItemQueryResult":
+    """
+    Run a WIQL query, partitioning it by ID when it matches too much.
+
+    Args:
+        wit_client: Work item tracking client
+        query: WIQL query
+        partition: Read every matching work item, in ID windows when more
+            match than one query may return. Otherwise at most
+            MAX_QUERY_RESULTS work items are returned.
+
+    Returns:
+        The query result, with the work items of every window merged
+
+    Raises:
+        AzureDevOpsClientError: If the query matches too much and is not
+            partitioned
+    """
+    from azure.devops.v7_1.work_item_tracking.models import (
+        Wiql,
+        WorkItemQueryResult,
+    )
+
+    # Link queries return pairs of work items, which ID windows on a
+    # single work item cannot partition
+    if not partition or _LINK_QUERY.search(query):
+        try:
+            return wit_client.query_by_wiql(
+                Wiql(query=query), top=MAX_QUERY_RESULTS
+            )
+        except Exception as e:
+            if _is_oversize(e) and not _LINK_QUERY.search(query):
+                raise AzureDevOpsClientError(
+                    f"The query matches more than {MAX_QUERY_RESULTS:,} work "
+                    "items. Narrow it, or ask for all results to run it in "
+                    "parts."
+                ) from e
+            raise
+
+    result = _run(wit_client, query)
+    if result is not None:
+        return result
+
+    bound = _id_bound(wit_client)
+    upper = max((int(ref.id) for ref in bound.work_items or []), default=0)
+
+    def run_window(window: Tuple[int, int]):
+        low, high = window
+        condition = f"[System.Id] >= {low} AND [System.Id] < {high}"
+        # A window holding no more IDs than the cap cannot overflow
+        return _run(
+            wit_client,
+            restrict_query(query, condition, bound.as_of),
+            complete=high - low <= MAX_QUERY_RESULTS,
+        )
+
+    windows = _split((1, upper + 1), INITIAL_WINDOWS)
+    done = []
+    while windows:
+        overflowing = []
+        for window, window_result in zip(
+            windows, map_concurrently(run_window, windows)
+        ):
+            if window_result is None:
+                overflowing.extend(_split(window, 2))
+            else:
+                done.append((window, window_result))
+        windows = overflowing
+
+    done.sort(key=lambda item: item[0])
+    work_items = [
+        reference
+        for _, window_result in done
+        for reference in window_result.work_items or []
+    ]
+    logger.info(
+        "Query matched %d work items; ran it in %d ID windows",
+        len(work_items),
+        len(done),
+    )
+    first = done[0][1] if done else bound
+    return WorkItemQueryResult(
+        as_of=bound.as_of,
+        columns=first.columns,
+        query_type=first.query_type,
+        sort_columns=first.sort_columns,
+        work_items=work_items,
+    )
@@ -5,31 +5,589 @@ A simple MCP server that exposes Azure DevOps capabilities.
 """
 
 import argparse
+import inspect
+import json
+import logging
+import os
+import sys
+from typing import Iterable, Optional
 
 from mcp.server.fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
 
-from mcp_azure_devops.features import register_all
-from mcp_azure_devops.utils import register_all_prompts
+from mcp_azure_devops.features import FEATURES, register_all
+from mcp_azure_devops.utils import metrics, register_all_prompts
+from mcp_azure_devops.utils.azure_client import (
+    configure_connection_pool,
+    preload_location_cache,
+)
+from mcp_azure_devops.utils.cache import (
+    DEFAULT_LIMITS,
+    DEFAULT_TTLS,
+    configure_cache,
+)
+from mcp_azure_devops.utils.concurrency import (
+    configure_worker_pool,
+    run_in_worker,
+)
+from mcp_azure_devops.utils.credentials import CredentialsMiddleware
+from mcp_azure_devops.utils.instrumentation import (
+    PROMETHEUS_CONTENT_TYPE,
+    instrument_tool,
+    start_metrics_server,
+)
+from mcp_azure_devops.utils.profiling import (
+    PROFILING_MODES,
+    configure_profiling,
+    profile_tool,
+)
+from mcp_azure_devops.utils.tracing import (
+    EXPORTERS,
+    configure_tracing,
+    trace_tool,
+)
 
-# Create a FastMCP server instance with a name
-mcp = FastMCP("Azure DevOps")
+logger = logging.getLogger(__name__)
 
-# Register all features
-register_all(mcp)
-register_all_prompts(mcp)
+TRANSPORTS = ("stdio", "sse", "streamable-http")
 
+# Command line handed to the worker processes started by main()
+_ARGV_ENV = "MCP_AZURE_DEVOPS_ARGV"
 
-def main():
-    """Entry point for the command-line script."""
+
+class AzureDevOpsMCP(FastMCP):
+    """
+    FastMCP server that keeps blocking tools off the event loop.
+
+    Tools are plain synchronous functions doing blocking HTTP calls through
+    the Azure DevOps SDK. They are registered as async wrappers that run on
+    the shared worker pool, so concurrent tool calls overlap instead of
+    serializing on the event loop. Every tool records its latency and
+    outcome, and is traced or profiled when those are enabled. Tools named
+    in ``disabled_tools`` are left out, which keeps them out of the tool
+    list sent to the client. Over HTTP, requests run with the Azure DevOps
+    credentials their client sent, if any.
+    """
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        disabled_tools: Iterable[str] = (),
+        **settings,
+    ):
+        super().__init__(name, **settings)
+        self.disabled_tools = frozenset(disabled_tools)
+        self.skipped_tools = set()
+        # Off when several worker processes share the port, as each one
+        # only counts the requests it answered
+        self.serves_metrics = True
+
+    def sse_app(self, mount_path=None):
+        app = super().sse_app(mount_path)
+        app.add_middleware(CredentialsMiddleware)
+        return app
+
+    def streamable_http_app(self):
+        app = super().streamable_http_app()
+        app.add_middleware(CredentialsMiddleware)
+        return app
+
+    def add_tool(self, fn, name=None, *args, **kwargs):
+        # Other arguments are passed through untouched, since they differ
+        # between mcp releases
+        tool_name = name or fn.__name__
+        if tool_name in self.disabled_tools:
+            self.skipped_tools.add(tool_name)
+            return
+        if not inspect.iscoroutinefunction(fn):
+            fn = run_in_worker(profile_tool(fn, tool_name))
+        fn = trace_tool(instrument_tool(fn, tool_name), tool_name)
+        super().add_tool(fn, name, *args, **kwargs)
+
+
+def _parse_cache_ttl(value: str):
+    """Parse a CATEGORY=SECONDS cache TTL option."""
+    category, _, seconds = value.partition("=")
+    if category not in DEFAULT_TTLS or not seconds:
+        raise argparse.ArgumentTypeError(
+            f"expected CATEGORY=SECONDS with CATEGORY one of "
+            f"{', '.join(DEFAULT_TTLS)}"
+        )
+    try:
+        return category, float(seconds)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid seconds: {seconds}")
+
+
+def _parse_cache_limit(value: str):
+    """Parse a CATEGORY=ENTRIES cache limit option."""
+    category, _, entries = value.partition("=")
+    if category not in DEFAULT_TTLS or not entries:
+        raise argparse.ArgumentTypeError(
+            f"expected CATEGORY=ENTRIES with CATEGORY one of "
+            f"{', '.join(DEFAULT_TTLS)}"
+        )
+    try:
+        return category, int(entries)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid entries: {entries}")
+
+
+def _split(value: Optional[str]) -> list:
+    """Split a comma separated option or environment variable."""
+    return [v.strip() for v in (value or "").split(",") if v.strip()]
+
+
+def _add_http_routes(server: AzureDevOpsMCP) -> None:
+    """Serve health checks and metrics next to the HTTP transports."""
+
+    @server.custom_route("/healthz", methods=["GET"])
+    async def healthz(request: Request) -> Response:
+        return JSONResponse({"status": "ok"})
+
+    @server.custom_route("/metrics", methods=["GET"])
+    async def prometheus_metrics(request: Request) -> Response:
+        if not server.serves_metrics:
+            return JSONResponse(
+                {"error": "metrics are not served with several workers"},
+                status_code=404,
+            )
+        return Response(
+            metrics.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE
+        )
+
+
+def create_server(
+    features: Optional[Iterable[str]] = None,
+    disabled_features: Optional[Iterable[str]] = None,
+    disabled_tools: Optional[Iterable[str]] = None,
+) -> AzureDevOpsMCP:
+    """
+    Create the MCP server with the selected features registered.
+
+    Args:
+        features: Feature groups to enable. Uses AZURE_DEVOPS_FEATURES
+            when omitted; all groups when neither is set.
+        disabled_features: Feature groups to leave out. Uses
+            AZURE_DEVOPS_DISABLED_FEATURES when omitted.
+        disabled_tools: Individual tools to leave out. Uses
+            AZURE_DEVOPS_DISABLED_TOOLS when omitted.
+
+    Returns:
+        The configured server
+
+    Raises:
+        ValueError: If a feature group is unknown
+    """
+    if disabled_tools is None:
+        disabled_tools = _split(os.environ.get("AZURE_DEVOPS_DISABLED_TOOLS"))
+    server = AzureDevOpsMCP("Azure DevOps", disabled_tools=disabled_tools)
+    register_all(server, features, disabled_features)
+    register_all_prompts(server)
+    _add_http_routes(server)
+
+    unknown = server.disabled_tools - server.skipped_tools
+    if unknown:
+        logger.warning(
+            "Disabled tools not provided by the selected features: %s",
+            ", ".join(sorted(unknown)),
+        )
+    return server
+
+
+def __getattr__(name):
+    # The server is created on first use rather than at import time, so
+    # main() can select features before any feature module is imported
+    if name == "mcp":
+        global mcp
+        mcp = create_server()
+        return mcp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Run the Azure DevOps MCP server"
     )
-    # Add more command-line arguments as needed
+    parser.add_argument(
+        "--transport",
+        choices=TRANSPORTS,
+        default=None,
+        help=(
+            "How clients connect: stdio for a single editor, sse or "
+            "streamable-http to share one server over HTTP "
+            "(default: AZURE_DEVOPS_TRANSPORT or stdio)"
+        ),
+    )
+    parser.add_argument(
+        "--host",
+        default=None,
+        help=(
+            "Address the HTTP transports bind to "
+            "(default: AZURE_DEVOPS_HOST or 127.0.0.1)"
+        ),
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=None,
+        help=(
+            "Port the HTTP transports listen on "
+            "(default: AZURE_DEVOPS_PORT or 8000)"
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=(
+            "Server processes sharing the port; streamable-http only "
+            "(default: AZURE_DEVOPS_WORKERS or 1)"
+        ),
+    )
+    parser.add_argument(
+        "--features",
+        default=None,
+        help=(
+            "Comma separated feature groups to enable "
+            f"({', '.join(FEATURES)}; default: AZURE_DEVOPS_FEATURES or all)"
+        ),
+    )
+    parser.add_argument(
+        "--disable-features",
+        default=None,
+        help=(
+            "Comma separated feature groups to leave out "
+            "(default: AZURE_DEVOPS_DISABLED_FEATURES)"
+        ),
+    )
+    parser.add_argument(
+        "--disable-tools",
+        default=None,
+        help=(
+            "Comma separated tools to leave out "
+            "(default: AZURE_DEVOPS_DISABLED_TOOLS)"
+        ),
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help=(
+            "Maximum number of tool calls to run concurrently "
+            "(default: AZURE_DEVOPS_MAX_WORKERS or 8)"
+        ),
+    )
+
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help=(
+            "Serve Prometheus metrics on this port at /metrics "
+            "(default: AZURE_DEVOPS_METRICS_PORT, disabled when unset)"
+        ),
+    )
+    parser.add_argument(
+        "--trace-exporter",
+        choices=EXPORTERS,
+        default=None,
+        help=(
+            "Export OpenTelemetry spans for tool calls and Azure DevOps "
+            "requests (default: AZURE_DEVOPS_TRACE_EXPORTER, disabled when "
+            "unset)"
+        ),
+    )
+    parser.add_argument(
+        "--trace-file",
+        default=None,
+        help=(
+            "File the json trace exporter appends to "
+            "(default: AZURE_DEVOPS_TRACE_FILE or "
+            "mcp-azure-devops-traces.jsonl)"
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        choices=PROFILING_MODES,
+        action="append",
+        default=None,
+        help=(
+            "Profile tool calls with cProfile and/or tracemalloc; can be "
+            "repeated (default: AZURE_DEVOPS_PROFILE, disabled when unset)"
+        ),
+    )
+    parser.add_argument(
+        "--profile-tools",
+        default=None,
+        help=(
+            "Comma separated tools to profile "
+            "(default: AZURE_DEVOPS_PROFILE_TOOLS or all tools)"
+        ),
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default=None,
+        help=(
+            "Directory for per-call profiles "
+            "(default: AZURE_DEVOPS_PROFILE_DIR or ./profiles)"
+        ),
+    )
+    parser.add_argument(
+        "--cache-max-entries",
+        type=int,
+        default=None,
+        help=(
+            "Maximum number of cached metadata lookups, not counting the "
+            "categories with a limit of their own "
+            "(default: AZURE_DEVOPS_CACHE_MAX_ENTRIES or 1024)"
+        ),
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=_parse_cache_ttl,
+        action="append",
+        default=[],
+        metavar="CATEGORY=SECONDS",
+        help=(
+            "Cache lifetime for one category of metadata; can be repeated "
+            f"(categories: {', '.join(DEFAULT_TTLS)})"
+        ),
+    )
+    parser.add_argument(
+        "--cache-limit",
+        type=_parse_cache_limit,
+        action="append",
+        default=[],
+        metavar="CATEGORY=ENTRIES",
+        help=(
+            "Maximum number of cached entries of one category, evicted "
+            "apart from the rest; can be repeated (default: "
+            + ", ".join(f"{c}={n}" for c, n in DEFAULT_LIMITS.items())
+            + ")"
+        ),
+    )
+    parser.add_argument(
+        "--cache-backend",
+        choices=["memory", "sqlite"],
+        default=None,
+        help=(
+            "Where to keep cached data; sqlite persists it across restarts "
+            "and shares it between processes "
+            "(default: AZURE_DEVOPS_CACHE_BACKEND, or memory unless "
+            "--workers is given)"
+        ),
+    )
+    parser.add_argument(
+        "--cache-path",
+        default=None,
+        help=(
+            "SQLite cache file (default: AZURE_DEVOPS_CACHE_PATH or a file "
+            "in AZURE_DEVOPS_CACHE_DIR)"
+        ),
+    )
+    parser.add_argument(
+        "--cache-max-bytes",
+        type=int,
+        default=None,
+        help=(
+            "Maximum size of the SQLite cache "
+            "(default: AZURE_DEVOPS_CACHE_MAX_BYTES or 256 MiB)"
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch projects, teams, processes and types fresh",
+    )
+
+    parser.add_argument(
+        "--cassette",
+        default=None,
+        metavar="PATH",
+        help=(
+            "Cassette file to record to or replay from "
+            "(default: AZURE_DEVOPS_CASSETTE)"
+        ),
+    )
+    parser.add_argument(
+        "--cassette-mode",
+        default=None,
+        help=(
+            "record: save every Azure DevOps response to the cassette; "
+            "replay: answer requests from it without the network "
+            "(default: AZURE_DEVOPS_CASSETTE_MODE or off)"
+        ),
+    )
+    parser.add_argument(
+        "--cassette-latency",
+        default=None,
+        help=(
+            "recorded: replay responses as slowly as they were recorded; "
+            "none: replay immediately "
+            "(default: AZURE_DEVOPS_CASSETTE_LATENCY or recorded)"
+        ),
+    )
+
+    return parser
+
+
+def _resolve_transport(parser: argparse.ArgumentParser, args) -> None:
+    """Fill in transport options from the environment and check them."""
+    env = os.environ
+    args.transport = args.transport or env.get(
+        "AZURE_DEVOPS_TRANSPORT", "stdio"
+    )
+    args.host = args.host or env.get("AZURE_DEVOPS_HOST", "127.0.0.1")
+    try:
+        if args.port is None:
+            args.port = int(env.get("AZURE_DEVOPS_PORT", 8000))
+        if args.workers is None:
+            args.workers = int(env.get("AZURE_DEVOPS_WORKERS", 1))
+    except ValueError as e:
+        parser.error(str(e))
+    if args.metrics_port is None and env.get("AZURE_DEVOPS_METRICS_PORT"):
+        try:
+            args.metrics_port = int(env["AZURE_DEVOPS_METRICS_PORT"])
+        except ValueError as e:
+            parser.error(f"AZURE_DEVOPS_METRICS_PORT: {e}")
+
+    if args.transport not in TRANSPORTS:
+        parser.error(
+            f"unknown transport: {args.transport} "
+            f"(expected {', '.join(TRANSPORTS)})"
+        )
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.workers > 1:
+        # Workers share nothing, so a client must not depend on reaching
+        # the process that holds its session or its metrics server
+        if args.transport != "streamable-http":
+            parser.error("--workers needs the streamable-http transport")
+        if args.metrics_port is not None:
+            parser.error(
+                "--metrics-port cannot be shared by several workers, and "
+                "each worker only counts the requests it answered"
+            )
+        # Query cursors live in the cache, and the next page may be asked
+        # of any worker
+        args.cache_backend = (
+            args.cache_backend
+            or env.get("AZURE_DEVOPS_CACHE_BACKEND")
+            or "sqlite"
+        )
+        if args.cache_backend != "sqlite":
+            parser.error(
+                "--workers needs the sqlite cache backend, so that query "
+                "cursors are shared between workers"
+            )
+
+
+def _configure(parser: argparse.ArgumentParser, args) -> AzureDevOpsMCP:
+    """Create and configure the server from parsed options."""
+    _resolve_transport(parser, args)
+
+    global mcp
+    try:
+        mcp = create_server(
+            _split(args.features),
+            _split(args.disable_features),
+            _split(args.disable_tools) if args.disable_tools else None,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.max_workers is not None and args.max_workers < 1:
+        parser.error("--max-workers must be at least 1")
+    try:
+        configure_worker_pool(args.max_workers)
+    except ValueError as e:
+        parser.error(f"AZURE_DEVOPS_MAX_WORKERS: {e}")
+    try:
+        configure_connection_pool()
+    except ValueError as e:
+        parser.error(f"AZURE_DEVOPS_MAX_CONNECTIONS: {e}")
+    try:
+        configure_cache(
+            max_entries=args.cache_max_entries,
+            ttls=dict(args.cache_ttl),
+            enabled=not args.no_cache,
+            backend=args.cache_backend,
+            path=args.cache_path,
+            max_bytes=args.cache_max_bytes,
+            limits=dict(args.cache_limit),
+        )
+        preload_location_cache()
+    except (OSError, ValueError) as e:
+        parser.error(f"cannot use the cache: {e}")
+    try:
+        configure_tracing(args.trace_exporter, args.trace_file)
+        configure_profiling(
+            args.profile,
+            _split(args.profile_tools) or None,
+            args.profile_dir,
+        )
+        if args.cassette_mode or os.environ.get("AZURE_DEVOPS_CASSETTE_MODE"):
+            # Imported only when used, as it loads msrest
+            from mcp_azure_devops.utils.cassettes import configure_cassette
+
+            configure_cassette(
+                args.cassette_mode, args.cassette, args.cassette_latency
+            )
+    except (OSError, RuntimeError, ValueError) as e:
+        parser.error(str(e))
+
+    if args.metrics_port is not None:
+        start_metrics_server(args.metrics_port)
+
+    mcp.settings.host = args.host
+    mcp.settings.port = args.port
+    # Any worker may receive any request, so none can keep sessions
+    mcp.settings.stateless_http = args.workers > 1
+    mcp.serves_metrics = args.workers == 1
+    return mcp
+
+
+def http_app():
+    """
+    Build the HTTP application of one worker process.
+
+    Used as a uvicorn factory when several workers share the port. Each
+    worker is a fresh interpreter, so it parses the options main() was
+    started with from the environment.
+    """
+    parser = _build_parser()
+    args = parser.parse_args(json.loads(os.environ.get(_ARGV_ENV, "[]")))
+    server = _configure(parser, args)
+    if args.transport == "sse":
+        return server.sse_app()
+    return server.streamable_http_app()
+
+
+def main():
+    """Entry point for the command-line script."""
+    parser = _build_parser()
+    argv = sys.argv[1:]
+    args = parser.parse_args(argv)
+    server = _configure(parser, args)
+
+    if args.workers > 1:
+        import uvicorn
 
-    parser.parse_args()  # Store args if needed later
+        os.environ[_ARGV_ENV] = json.dumps(argv)
+        uvicorn.run(
+            "mcp_azure_devops.server:http_app",
+            factory=True,
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            log_level=server.settings.log_level.lower(),
+        )
+        return
 
     # Start the server
-    mcp.run()
+    server.run(args.transport)
 
 
 if __name__ == "__main__":
@@ -2,39 +2,166 @@
 Azure DevOps client utilities.
 
 This module provides helper functions for connecting to Azure DevOps.
+
+Connections are pooled process-wide: one ``Connection`` is created per
+organization URL and PAT, and every SDK client handed out by it is created
+once and reused. Resource area discovery therefore only happens on the
+first use of each client type instead of on every tool call, and all
+clients of a connection share one keep-alive HTTP session. The SDK itself
+is only imported when the first connection is made. Identical read
+requests that are in flight at the same time are sent only once.
+
+On a shared HTTP server every client may bring its own PAT (see
+utils.credentials), so the pool holds one connection per tenant and
+closes the least recently used ones beyond AZURE_DEVOPS_MAX_CONNECTIONS.
 """
 
+import hashlib
+import logging
 import os
-from typing import Optional, Tuple
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, Tuple
 
-from azure.devops.connection import Connection
-from azure.devops.v7_1.core import CoreClient
-from azure.devops.v7_1.work_item_tracking_process import (
-    WorkItemTrackingProcessClient,
-)
-from msrest.authentication import BasicAuthentication
+from azure.devops import _file_cache
 
+from mcp_azure_devops.utils.credentials import get_request_credentials
 from mcp_azure_devops.utils.exceptions import AzureDevOpsClientError
 
+if TYPE_CHECKING:
+    from azure.devops.v7_1.core import CoreClient
+    from azure.devops.v7_1.work_item_tracking_process import (
+        WorkItemTrackingProcessClient,
+    )
+
+    from mcp_azure_devops.utils.pooled_connection import PooledConnection
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 64
+
+
+def preload_location_cache(ttl: Optional[float] = None) -> None:
+    """
+    Load the on-disk resource area and location caches.
+
+    The SDK persists resource areas and API locations per organization URL
+    (under AZURE_DEVOPS_CACHE_DIR, by default ~/.azure-devops). Loading them
+    at startup means a restarted server with a warm cache resolves every
+    client without discovery requests. Entries older than the TTL are
+    discarded and fetched again on first use.
+
+    Args:
+        ttl: Maximum age of the cache files in seconds; 0 never expires
+            them. Uses AZURE_DEVOPS_LOCATION_CACHE_TTL or the SDK default
+            of 12 hours when omitted.
+
+    Raises:
+        ValueError: If AZURE_DEVOPS_LOCATION_CACHE_TTL is not a number
+    """
+    if ttl is None:
+        value = os.environ.get("AZURE_DEVOPS_LOCATION_CACHE_TTL")
+        try:
+            ttl = float(value) if value else _file_cache.DEFAULT_MAX_AGE
+        except ValueError:
+            raise ValueError(
+                f"invalid AZURE_DEVOPS_LOCATION_CACHE_TTL: {value}"
+            ) from None
+
+    for cache in (_file_cache.RESOURCE_CACHE, _file_cache.OPTIONS_CACHE):
+        # The SDK compares whole seconds
+        cache.max_age = int(ttl)
+        cache.load()
+        logger.debug(
+            "Loaded %d cached locations from %s", len(cache), cache.file_name
+        )
+
 
 def get_credentials() -> Tuple[Optional[str], Optional[str]]:
     """
-    Get Azure DevOps credentials from environment variables.
+    Get Azure DevOps credentials for the current request.
+
+    Credentials sent by the client of a shared server take precedence over
+    the environment variables; the organization URL falls back to the
+    environment when the client did not send one.
 
     Returns:
         Tuple containing (pat, organization_url)
     """
-    pat = os.environ.get("AZURE_DEVOPS_PAT")
     organization_url = os.environ.get("AZURE_DEVOPS_ORGANIZATION_URL")
+    request_credentials = get_request_credentials()
+    if request_credentials is not None:
+        pat, request_url = request_credentials
+        return pat, request_url or organization_url
+    pat = os.environ.get("AZURE_DEVOPS_PAT")
     return pat, organization_url
 
 
-def get_connection() -> Connection:
+# Pooled connections keyed by (organization URL, PAT fingerprint), least
+# recently used first
+_connections: "OrderedDict[Tuple[str, str], PooledConnection]" = OrderedDict()
+_connections_lock = threading.Lock()
+# Key of the connection made with the server's own credentials
+_default_key: Optional[Tuple[str, str]] = None
+_max_connections = DEFAULT_MAX_CONNECTIONS
+
+
+def configure_connection_pool(max_connections: Optional[int] = None) -> None:
     """
-    Create a connection to Azure DevOps.
+    Set how many pooled connections are kept open.
+
+    Args:
+        max_connections: Size of the pool. Uses AZURE_DEVOPS_MAX_CONNECTIONS
+            or the default when omitted.
+
+    Raises:
+        ValueError: If max_connections is not a number of at least 1
+    """
+    global _max_connections
+
+    if max_connections is None:
+        value = os.environ.get("AZURE_DEVOPS_MAX_CONNECTIONS")
+        max_connections = int(value) if value else DEFAULT_MAX_CONNECTIONS
+    if max_connections < 1:
+        raise ValueError("max_connections must be at least 1")
+    _max_connections = max_connections
+
+
+def _fingerprint(pat: str) -> str:
+    """Return a stable, non-reversible identifier for a PAT."""
+    return hashlib.sha256(pat.encode("utf-8")).hexdigest()
+
+
+def invalidate_connections(organization_url: Optional[str] = None) -> None:
+    """
+    Drop pooled connections and the clients created from them.
+
+    Call this after rotating a PAT so that the next tool call authenticates
+    with the new token. The connection made with the server's own
+    credentials is also replaced automatically when its PAT changes.
+
+    Args:
+        organization_url: Only drop connections for this organization.
+            Drops every pooled connection when omitted.
+    """
+    with _connections_lock:
+        if organization_url is None:
+            stale = list(_connections)
+        else:
+            organization_url = organization_url.rstrip("/")
+            stale = [k for k in _connections if k[0] == organization_url]
+        dropped = [_connections.pop(key) for key in stale]
+
+    for connection in dropped:
+        connection.close()
+
+
+def get_connection() -> "PooledConnection":
+    """
+    Get the pooled connection to Azure DevOps for the current credentials.
 
     Returns:
-        Connection object
+        PooledConnection for the organization and PAT
 
     Raises:
         Exception: If credentials are missing or connection cannot be created
@@ -46,8 +173,44 @@ def get_connection() -> Connection:
             "environment variables."
         )
 
-    credentials = BasicAuthentication("", pat)
-    connection = Connection(base_url=organization_url, creds=credentials)
+    organization_url = organization_url.rstrip("/")
+    key = (organization_url, _fingerprint(pat))
+
+    global _default_key
+    dropped = []
+    with _connections_lock:
+        connection = _connections.get(key)
+        if connection is not None:
+            _connections.move_to_end(key)
+        else:
+            if get_request_credentials() is None:
+                # A different PAT of the server's own means the token was
+                # rotated, so the connection built with the old one is stale
+                if _default_key is not None and _default_key[0] == key[0]:
+                    stale = _connections.pop(_default_key, None)
+                    if stale is not None:
+                        dropped.append(stale)
+                _default_key = key
+
+            # Deferred so that starting the server does not load the SDK
+            from msrest.authentication import BasicAuthentication
+
+            from mcp_azure_devops.utils.pooled_connection import (
+                PooledConnection,
+            )
+
+            connection = PooledConnection(
+                base_url=organization_url,
+                creds=BasicAuthentication("", pat),
+                scope=f"{organization_url}#{key[1]}",
+            )
+            _connections[key] = connection
+            while len(_connections) > _max_connections:
+                _, evicted = _connections.popitem(last=False)
+                dropped.append(evicted)
+
+    for stale_connection in dropped:
+        stale_connection.close()
 
     if not connection:
         raise AzureDevOpsClientError(
@@ -58,7 +221,7 @@ def get_connection() -> Connection:
     return connection
 
 
-def get_core_client() -> CoreClient:
+def get_core_client() -> "CoreClient":
     """
     Get the Core client for Azure DevOps.
 
@@ -84,7 +247,7 @@ def get_core_client() -> CoreClient:
     return core_client
 
 
-def get_work_item_tracking_process_client() -> WorkItemTrackingProcessClient:
+def get_work_item_tracking_process_client() -> "WorkItemTrackingProcessClient":
     """
     Get the Work Item Tracking Process client for Azure DevOps.
 
@@ -0,0 +1,599 @@
+"""
+Cache for slow-changing Azure DevOps organization data.
+
+Projects, teams, processes, work item types and their fields rarely change
+but are needed on almost every agent turn. Lookups are cached per
+organization with a time-to-live for each category of data, and the least
+recently used entries are evicted once the cache is full. Categories that
+fill up quickly (work items, query cursors and revalidated responses) have
+their own limits, so reading many work items never evicts the metadata.
+
+Objects that never change once written (work item revisions by id and
+revision) are cached without expiry; content with an ETag, such as wiki
+pages, is kept as revalidated responses instead (see conditional.py). The
+cache lives in memory by default; the SQLite backend keeps it on disk,
+where it survives restarts and is shared by every server process on the
+host.
+"""
+
+import abc
+import logging
+import math
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional
+
+from azure.devops import _file_cache
+
+from mcp_azure_devops.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+CACHE_HITS = "azure_devops_cache_hits_total"
+CACHE_MISSES = "azure_devops_cache_misses_total"
+CACHE_ENTRIES = "azure_devops_cache_entries"
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_CACHE_FILE = "mcp-azure-devops.sqlite3"
+
+# Categories of objects that never change once written
+IMMUTABLE_CATEGORIES = ("work_item_revisions",)
+
+# Seconds each category of data is served from the cache
+DEFAULT_TTLS: Dict[str, float] = {
+    "projects": 300.0,
+    "teams": 300.0,
+    "processes": 3600.0,
+    "work_item_types": 3600.0,
+    "fields": 3600.0,
+    # Responses kept for ETag revalidation; they are checked on every use
+    "responses": 86400.0,
+    # Work item IDs matched by a query, read page by page
+    "query_cursors": 900.0,
+    # Last cached revision of each work item, checked on every use
+    "work_item_latest": 86400.0,
+}
+DEFAULT_TTLS.update(dict.fromkeys(IMMUTABLE_CATEGORIES, math.inf))
+
+# Most entries of each category evicted apart from the others; every other
+# category shares max_entries
+DEFAULT_LIMITS: Dict[str, int] = {
+    "work_item_revisions": 1024,
+    "work_item_latest": 1024,
+    "query_cursors": 64,
+    "responses": 256,
+}
+
+_MISSING = object()
+
+
+class _Cache(abc.ABC):
+    """Shared behaviour of the cache backends."""
+
+    max_entries: int
+    ttls: Dict[str, float]
+    limits: Dict[str, int]
+
+    def _limit(self, category: str) -> int:
+        """Most entries of the category, or of the categories it shares."""
+        return self.limits.get(category, self.max_entries)
+
+    @abc.abstractmethod
+    def get(self, category: str, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value, or the default when there is none."""
+
+    @abc.abstractmethod
+    def set(self, category: str, key: Hashable, value: Any) -> None:
+        """Store a value."""
+
+    @abc.abstractmethod
+    def invalidate(self, category: Optional[str] = None) -> None:
+        """Drop the entries of a category, or every entry."""
+
+    def get_or_load(
+        self,
+        category: str,
+        key: Hashable,
+        loader: Callable[[], Any],
+        fresh: bool = False,
+    ) -> Any:
+        """
+        Get a cached value, loading and storing it on a miss.
+
+        Args:
+            category: Data category
+            key: Key within the category
+            loader: Function fetching the value from Azure DevOps
+            fresh: Skip the cached value and load it again
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        if not fresh:
+            value = self.get(category, key, _MISSING)
+            if value is not _MISSING:
+                metrics.increment(CACHE_HITS, category=category)
+                return value
+        metrics.increment(CACHE_MISSES, category=category)
+        value = loader()
+        self.set(category, key, value)
+        return value
+
+
+class TTLCache(_Cache):
+    """
+    Bounded in-memory LRU cache whose entries expire after a per-category
+    TTL.
+
+    Keys are (category, key) pairs. A category without a TTL, or with a
+    TTL of 0, is never cached. Categories with a limit are evicted on
+    their own; the others share ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttls: Optional[Mapping[str, float]] = None,
+        limits: Optional[Mapping[str, int]] = None,
+        clock=time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttls = dict(DEFAULT_TTLS)
+        self.ttls.update(ttls or {})
+        self.limits = dict(DEFAULT_LIMITS)
+        self.limits.update(limits or {})
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Entries by the category they are limited by, or None if shared
+        self._pools: Dict[Optional[str], OrderedDict] = {}
+
+    def __len__(self) -> int:
+        return sum(len(pool) for pool in self._pools.values())
+
+    def _pool(self, category: str) -> OrderedDict:
+        name = category if category in self.limits else None
+        return self._pools.setdefault(name, OrderedDict())
+
+    def get(self, category: str, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            category: Data category
+            key: Key within the category
+            default: Value returned when there is no fresh entry
+
+        Returns:
+            The cached value, or the default
+        """
+        with self._lock:
+            entries = self._pool(category)
+            entry = entries.get((category, key))
+            if entry is None:
+                return default
+            expires, value = entry
+            if self._clock() >= expires:
+                del entries[(category, key)]
+                return default
+            entries.move_to_end((category, key))
+            return value
+
+    def set(self, category: str, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entries if needed.
+
+        Args:
+            category: Data category
+            key: Key within the category
+            value: Value to store
+        """
+        ttl = self.ttls.get(category, 0)
+        limit = self._limit(category)
+        if ttl <= 0 or limit <= 0:
+            return
+        with self._lock:
+            entries = self._pool(category)
+            entries[(category, key)] = (self._clock() + ttl, value)
+            entries.move_to_end((category, key))
+            while len(entries) > limit:
+                entries.popitem(last=False)
+            size = len(self)
+        metrics.set_gauge(CACHE_ENTRIES, size)
+
+    def invalidate(self, category: Optional[str] = None) -> None:
+        """
+        Drop cached entries.
+
+        Args:
+            category: Only drop entries of this category. Drops everything
+                when omitted.
+        """
+        with self._lock:
+            if category is None:
+                self._pools.clear()
+            else:
+                entries = self._pool(category)
+                for entry_key in [k for k in entries if k[0] == category]:
+                    del entries[entry_key]
+            size = len(self)
+        metrics.set_gauge(CACHE_ENTRIES, size)
+
+
+def _create_private(path: str) -> None:
+    """Create a file only its owner can use, or restrict an existing one."""
+    descriptor = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    os.close(descriptor)
+    if os.name != "nt" and os.stat(path).st_mode & 0o077:
+        os.chmod(path, 0o600)
+
+
+class SQLiteCache(_Cache):
+    """
+    Cache stored in a SQLite database.
+
+    The database runs in WAL mode so several server processes can read and
+    write it at the same time. Every thread uses its own connection. Values
+    are pickled; once the database holds more than ``max_bytes`` of values,
+    or more entries than a category's limit (``max_entries`` for the
+    categories without one), the least recently read entries are evicted.
+    A busy or broken database never fails a lookup, it only misses.
+
+    Unpickling runs code chosen by whoever wrote the file, and the values
+    are work items and other private data, so the database (and the WAL
+    files SQLite derives from it) is only accessible to its owner.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            category TEXT NOT NULL,
+            key TEXT NOT NULL,
+            value BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            expires REAL,
+            accessed REAL NOT NULL,
+            PRIMARY KEY (category, key)
+        );
+        CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttls: Optional[Mapping[str, float]] = None,
+        limits: Optional[Mapping[str, int]] = None,
+        busy_timeout: float = 5.0,
+        clock=time.time,
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttls = dict(DEFAULT_TTLS)
+        self.ttls.update(ttls or {})
+        self.limits = dict(DEFAULT_LIMITS)
+        self.limits.update(limits or {})
+        self.busy_timeout = busy_timeout
+        self._clock = clock
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        _create_private(path)
+        try:
+            self._connect()
+        except sqlite3.Error as ex:
+            raise OSError(f"Cannot open cache database {path}: {ex}") from ex
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get the calling thread's database connection."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                self.path, timeout=self.busy_timeout, isolation_level=None
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                f"PRAGMA busy_timeout={int(self.busy_timeout * 1000)}"
+            )
+            connection.executescript(self._SCHEMA)
+            self._local.connection = connection
+        return connection
+
+    def __len__(self) -> int:
+        try:
+            row = self._connect().execute("SELECT COUNT(*) FROM entries")
+            return row.fetchone()[0]
+        except sqlite3.Error:
+            return 0
+
+    def get(self, category: str, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            category: Data category
+            key: Key within the category
+            default: Value returned when there is no fresh entry
+
+        Returns:
+            The cached value, or the default
+        """
+        now = self._clock()
+        try:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT value, expires FROM entries "
+                "WHERE category = ? AND key = ?",
+                (category, repr(key)),
+            ).fetchone()
+            if row is None:
+                return default
+            if row[1] is not None and now >= row[1]:
+                connection.execute(
+                    "DELETE FROM entries WHERE category = ? AND key = ?",
+                    (category, repr(key)),
+                )
+                return default
+            connection.execute(
+                "UPDATE entries SET accessed = ? "
+                "WHERE category = ? AND key = ?",
+                (now, category, repr(key)),
+            )
+            return pickle.loads(row[0])
+        except (sqlite3.Error, pickle.UnpicklingError, EOFError) as ex:
+            logger.debug("Cache read failed: %s", ex)
+            return default
+
+    def set(self, category: str, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently read entries if needed.
+
+        Args:
+            category: Data category
+            key: Key within the category
+            value: Value to store
+        """
+        ttl = self.ttls.get(category, 0)
+        if ttl <= 0 or self._limit(category) <= 0:
+            return
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as ex:
+            logger.debug("Value for %s is not cacheable: %s", category, ex)
+            return
+        if len(data) > self.max_bytes:
+            return
+
+        now = self._clock()
+        expires = None if math.isinf(ttl) else now + ttl
+        try:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO entries "
+                    "(category, key, value, size, expires, accessed) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (category, repr(key), data, len(data), expires, now),
+                )
+                size = self._evict(connection, now, category)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as ex:
+            logger.debug("Cache write failed: %s", ex)
+            return
+        metrics.set_gauge(CACHE_ENTRIES, size)
+
+    def _evict(
+        self, connection: sqlite3.Connection, now: float, category: str
+    ) -> int:
+        """
+        Drop expired entries, then the least recently read ones.
+
+        Only the entries sharing a limit with the category just written
+        can have grown past it.
+        """
+        connection.execute(
+            "DELETE FROM entries WHERE expires IS NOT NULL AND expires <= ?",
+            (now,),
+        )
+        if category in self.limits:
+            condition, parameters = "category = ?", [category]
+        else:
+            parameters = list(self.limits)
+            marks = ", ".join("?" * len(parameters))
+            condition = f"category NOT IN ({marks})"
+        (pooled,) = connection.execute(
+            f"SELECT COUNT(*) FROM entries WHERE {condition}", parameters
+        ).fetchone()
+        limit = self._limit(category)
+        if pooled > limit:
+            connection.execute(
+                "DELETE FROM entries WHERE rowid IN (SELECT rowid FROM "
+                f"entries WHERE {condition} ORDER BY accessed LIMIT ?)",
+                [*parameters, pooled - limit],
+            )
+
+        count, total = connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return count
+
+        excess_bytes = total - self.max_bytes
+        evicted = []
+        for rowid, size in connection.execute(
+            "SELECT rowid, size FROM entries ORDER BY accessed"
+        ):
+            if excess_bytes <= 0:
+                break
+            evicted.append((rowid,))
+            excess_bytes -= size
+        connection.executemany("DELETE FROM entries WHERE rowid = ?", evicted)
+        return count - len(evicted)
+
+    def invalidate(self, category: Optional[str] = None) -> None:
+        """
+        Drop cached entries.
+
+        Args:
+            category: Only drop entries of this category. Drops everything
+                when omitted.
+        """
+        try:
+            connection = self._connect()
+            if category is None:
+                connection.execute("DELETE FROM entries")
+            else:
+                connection.execute(
+                    "DELETE FROM entries WHERE category = ?", (category,)
+                )
+        except sqlite3.Error as ex:
+            logger.debug("Cache invalidation failed: %s", ex)
+            return
+        metrics.set_gauge(CACHE_ENTRIES, len(self))
+
+
+_cache: Optional[_Cache] = None
+_cache_lock = threading.Lock()
+
+
+def default_cache_path() -> str:
+    """Get the default SQLite cache file, next to the SDK's own caches."""
+    return os.path.join(_file_cache.get_cache_dir(), DEFAULT_CACHE_FILE)
+
+
+def configure_cache(
+    max_entries: Optional[int] = None,
+    ttls: Optional[Mapping[str, float]] = None,
+    enabled: bool = True,
+    backend: Optional[str] = None,
+    path: Optional[str] = None,
+    max_bytes: Optional[int] = None,
+    limits: Optional[Mapping[str, int]] = None,
+) -> _Cache:
+    """
+    Replace the metadata cache.
+
+    Args:
+        max_entries: Maximum number of cached entries of the categories
+            without a limit of their own. Uses
+            AZURE_DEVOPS_CACHE_MAX_ENTRIES or 1024 when omitted.
+        ttls: TTL in seconds per category, overriding the defaults
+        enabled: Whether to cache at all
+        backend: "memory" or "sqlite". Uses AZURE_DEVOPS_CACHE_BACKEND or
+            "memory" when omitted.
+        path: SQLite database file. Uses AZURE_DEVOPS_CACHE_PATH or a file
+            in AZURE_DEVOPS_CACHE_DIR when omitted.
+        max_bytes: Maximum size of the values in the SQLite database. Uses
+            AZURE_DEVOPS_CACHE_MAX_BYTES or 256 MiB when omitted.
+        limits: Maximum number of entries per category, overriding the
+            defaults. Categories given a limit are evicted on their own.
+
+    Returns:
+        The new cache
+
+    Raises:
+        ValueError: If the backend is unknown
+        OSError: If the SQLite database cannot be created or opened
+    """
+    global _cache
+    env = os.environ
+    if max_entries is None:
+        value = env.get("AZURE_DEVOPS_CACHE_MAX_ENTRIES")
+        max_entries = int(value) if value else DEFAULT_MAX_ENTRIES
+    if env.get("AZURE_DEVOPS_CACHE_DISABLED", "").lower() in (
+        "1",
+        "true",
+        "yes",
+    ):
+        enabled = False
+    limits = {**DEFAULT_LIMITS, **(limits or {})}
+    if not enabled:
+        max_entries = 0
+        limits = dict.fromkeys(limits, 0)
+    backend = backend or env.get("AZURE_DEVOPS_CACHE_BACKEND") or "memory"
+
+    if backend == "memory":
+        cache: _Cache = TTLCache(
+            max_entries=max_entries, ttls=ttls, limits=limits
+        )
+    elif backend == "sqlite":
+        if max_bytes is None:
+            value = env.get("AZURE_DEVOPS_CACHE_MAX_BYTES")
+            max_bytes = int(value) if value else DEFAULT_MAX_BYTES
+        cache = SQLiteCache(
+            path or env.get("AZURE_DEVOPS_CACHE_PATH") or default_cache_path(),
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            ttls=ttls,
+            limits=limits,
+        )
+    else:
+        raise ValueError(f"Unknown cache backend: {backend}")
+
+    with _cache_lock:
+        _cache = cache
+    return cache
+
+
+def get_cache() -> _Cache:
+    """Get the metadata cache, creating it from the environment if needed."""
+    with _cache_lock:
+        cache = _cache
+    if cache is None:
+        cache = configure_cache()
+    return cache
+
+
+def cache_scope(client) -> str:
+    """
+    Get the scope that cache keys of an SDK client's data belong to.
+
+    Clients of pooled connections are scoped to their organization and
+    PAT, so tenants of a shared server never see each other's data.
+
+    Args:
+        client: Azure DevOps SDK client
+
+    Returns:
+        The scope of the client's connection, or the organization URL the
+        client talks to
+    """
+    scope = getattr(client, "cache_scope", None)
+    if isinstance(scope, str) and scope:
+        return scope
+    return str(getattr(client, "normalized_url", ""))
+
+
+def cached(
+    category: str,
+    client,
+    key: Hashable,
+    loader: Callable[[], Any],
+    fresh: bool = False,
+) -> Any:
+    """
+    Load organization data through the metadata cache.
+
+    Args:
+        category: Data category, which selects the TTL
+        client: SDK client the data is loaded with
+        key: Arguments identifying the data within the category
+        loader: Function fetching the data from Azure DevOps
+        fresh: Bypass the cached value and refresh it
+
+    Returns:
+        The cached or freshly loaded data
+    """
+    return get_cache().get_or_load(
+        category, (cache_scope(client), key), loader, fresh=fresh
+    )
@@ -0,0 +1,305 @@
+"""
+Record and replay Azure DevOps HTTP exchanges.
+
+In record mode every request sent to Azure DevOps is appended to a
+cassette file together with its response and how long it took. In replay
+mode requests are answered from the cassette without touching the
+network, either after the recorded time or immediately. A slow session
+can therefore be recorded once and replayed locally, against identical
+data, while a fix is benchmarked.
+
+Cassettes are JSON lines files, one exchange per line. The Authorization
+header is never written and the PAT is scrubbed from everything else.
+Requests are matched by method, URL and body, falling back to method and
+URL, and repeated requests cycle through the recorded responses in order.
+Resource discovery is recorded like any other request, so record with an
+empty AZURE_DEVOPS_CACHE_DIR when the cassette will be replayed elsewhere.
+"""
+
+import base64
+import http
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import requests
+from msrest.pipeline import HTTPPolicy
+from msrest.pipeline import Response as PipelineResponse
+from msrest.universal_http.requests import RequestsClientResponse
+from requests.structures import CaseInsensitiveDict
+
+from mcp_azure_devops.utils.exceptions import CassetteMissError
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_MODES = ("record", "replay")
+REPLAY_LATENCIES = ("recorded", "none")
+
+# Headers that carry credentials and are never written to a cassette
+_SECRET_HEADERS = ("authorization", "cookie", "set-cookie")
+SCRUBBED = "<scrubbed>"
+
+
+def _scrub(text: str, secrets: Iterable[str]) -> str:
+    for secret in secrets:
+        text = text.replace(secret, SCRUBBED)
+    return text
+
+
+def _secret_forms(pat: str) -> List[str]:
+    """The PAT as it may appear on the wire: plain and as basic auth."""
+    if not pat:
+        return []
+    basic = base64.b64encode(f":{pat}".encode("utf-8")).decode("ascii")
+    return [pat, basic]
+
+
+def _encode_body(content: Optional[bytes], secrets) -> Tuple[str, str]:
+    """Encode a body for JSON; returns the text and its encoding."""
+    content = content or b""
+    try:
+        return _scrub(content.decode("utf-8"), secrets), "utf-8"
+    except UnicodeDecodeError:
+        return base64.b64encode(content).decode("ascii"), "base64"
+
+
+def _decode_body(exchange: dict) -> bytes:
+    if exchange.get("encoding") == "base64":
+        return base64.b64decode(exchange["body"])
+    return exchange["body"].encode("utf-8")
+
+
+def _request_body(http_request) -> str:
+    data = http_request.data
+    if data is None:
+        return ""
+    if isinstance(data, bytes):
+        return data.decode("utf-8", errors="replace")
+    return str(data)
+
+
+class Cassette:
+    """
+    A cassette file opened for recording or replaying.
+
+    Args:
+        path: Cassette file
+        mode: "record" appends exchanges, "replay" serves them
+        latency: In replay mode, "recorded" waits as long as the original
+            request took and "none" answers immediately
+    """
+
+    def __init__(self, path: str, mode: str, latency: str = "recorded"):
+        if mode not in CASSETTE_MODES:
+            raise ValueError(
+                f"Unknown cassette mode: {mode} "
+                f"(expected {', '.join(CASSETTE_MODES)})"
+            )
+        if latency not in REPLAY_LATENCIES:
+            raise ValueError(
+                f"Unknown replay latency: {latency} "
+                f"(expected {', '.join(REPLAY_LATENCIES)})"
+            )
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self._lock = threading.Lock()
+        self._exchanges: Dict[tuple, List[dict]] = {}
+        self._cursors: Dict[tuple, int] = {}
+        self._file = None
+        if mode == "replay":
+            self._load()
+
+    def _load(self) -> None:
+        with open(self.path, encoding="utf-8") as cassette:
+            for line in cassette:
+                if not line.strip():
+                    continue
+                exchange = json.loads(line)
+                method, url = exchange["method"], exchange["url"]
+                body = exchange.get("request_body", "")
+                for key in ((method, url, body), (method, url)):
+                    self._exchanges.setdefault(key, []).append(exchange)
+        logger.info("Replaying Azure DevOps responses from %s", self.path)
+
+    def record(
+        self,
+        http_request,
+        http_response,
+        elapsed: float,
+        secrets: Iterable[str] = (),
+    ) -> None:
+        """Append one exchange to the cassette."""
+        secrets = list(secrets)
+        body, encoding = _encode_body(
+            http_response.internal_response.content, secrets
+        )
+        exchange = {
+            "method": http_request.method.upper(),
+            "url": _scrub(http_request.url, secrets),
+            "request_headers": {
+                name: _scrub(str(value), secrets)
+                for name, value in http_request.headers.items()
+                if name.lower() not in _SECRET_HEADERS
+            },
+            "request_body": _scrub(_request_body(http_request), secrets),
+            "status": http_response.status_code,
+            "headers": {
+                name: _scrub(value, secrets)
+                for name, value in http_response.headers.items()
+                if name.lower() not in _SECRET_HEADERS
+            },
+            "body": body,
+            "encoding": encoding,
+            "elapsed": elapsed,
+        }
+        line = json.dumps(exchange) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+
+    def play(self, http_request) -> dict:
+        """
+        Find the recorded exchange answering a request.
+
+        Raises:
+            CassetteMissError: If the cassette has no matching exchange
+        """
+        method = http_request.method.upper()
+        url = http_request.url
+        key = (method, url, _request_body(http_request))
+        if key not in self._exchanges:
+            key = (method, url)
+        candidates = self._exchanges.get(key)
+        if not candidates:
+            raise CassetteMissError(
+                f"No recorded response for {method} {url} in {self.path}"
+            )
+        with self._lock:
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = cursor + 1
+        exchange = candidates[cursor % len(candidates)]
+
+        # A recorded 304 only answers a request revalidating the same ETag
+        if exchange["status"] == 304 and http_request.headers.get(
+            "If-None-Match"
+        ) != exchange["headers"].get("ETag"):
+            full = [c for c in candidates if c["status"] == 200]
+            if full:
+                exchange = full[-1]
+        return exchange
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+_cassette: Optional[Cassette] = None
+
+
+def configure_cassette(
+    mode: Optional[str] = None,
+    path: Optional[str] = None,
+    latency: Optional[str] = None,
+) -> Optional[Cassette]:
+    """
+    Start recording or replaying Azure DevOps responses.
+
+    Args:
+        mode: "record" or "replay". Uses AZURE_DEVOPS_CASSETTE_MODE when
+            omitted; requests go to Azure DevOps when neither is set.
+        path: Cassette file. Uses AZURE_DEVOPS_CASSETTE when omitted.
+        latency: Replay latency, "recorded" or "none". Uses
+            AZURE_DEVOPS_CASSETTE_LATENCY or "recorded" when omitted.
+
+    Returns:
+        The active cassette, or None
+
+    Raises:
+        ValueError: If the mode or latency is unknown, or no file is given
+        OSError: If the cassette cannot be read for replaying
+    """
+    global _cassette
+    env = os.environ
+    mode = mode or env.get("AZURE_DEVOPS_CASSETTE_MODE")
+    path = path or env.get("AZURE_DEVOPS_CASSETTE")
+    latency = latency or env.get("AZURE_DEVOPS_CASSETTE_LATENCY") or "recorded"
+
+    cassette = None
+    if mode:
+        if not path:
+            raise ValueError("A cassette file is needed to record or replay")
+        cassette = Cassette(path, mode, latency)
+    if _cassette is not None:
+        _cassette.close()
+    _cassette = cassette
+    return cassette
+
+
+def get_cassette() -> Optional[Cassette]:
+    """Get the active cassette, if any."""
+    return _cassette
+
+
+def _replayed_response(request, exchange: dict):
+    """Build the pipeline response msrest would have received."""
+    status = exchange["status"]
+    internal = requests.Response()
+    internal.status_code = status
+    try:
+        internal.reason = http.HTTPStatus(status).phrase
+    except ValueError:
+        internal.reason = ""
+    internal.headers = CaseInsensitiveDict(exchange["headers"])
+    internal._content = _decode_body(exchange)
+    internal.url = exchange["url"]
+    internal.encoding = "utf-8"
+    return PipelineResponse(
+        request, RequestsClientResponse(request.http_request, internal)
+    )
+
+
+class CassettePolicy(HTTPPolicy):
+    """
+    msrest pipeline policy recording or replaying HTTP exchanges.
+
+    It sits closest to the network, so the rest of the pipeline (metrics,
+    tracing, revalidation, retries) behaves the same in replay mode.
+
+    Args:
+        pat: PAT of the connection, scrubbed from recorded exchanges
+    """
+
+    def __init__(self, pat: str = ""):
+        super().__init__()
+        self._secrets = _secret_forms(pat)
+
+    def send(self, request, **kwargs):
+        assert self.next, "CassettePolicy must be part of a pipeline"
+        cassette = _cassette
+        if cassette is None:
+            return self.next.send(request, **kwargs)
+
+        http_request = request.http_request
+        if cassette.mode == "replay":
+            exchange = cassette.play(http_request)
+            if cassette.latency == "recorded":
+                time.sleep(exchange["elapsed"])
+            return _replayed_response(request, exchange)
+
+        start = time.perf_counter()
+        response = self.next.send(request, **kwargs)
+        cassette.record(
+            http_request,
+            response.http_response,
+            time.perf_counter() - start,
+            self._secrets,
+        )
+        return response
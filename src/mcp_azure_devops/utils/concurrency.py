@@ -0,0 +1,150 @@
+"""
+Concurrency helpers for the MCP Azure DevOps server.
+
+The Azure DevOps SDK is synchronous, so tool bodies are run on a bounded
+thread pool instead of blocking the server's event loop. This lets
+independent tool calls overlap while capping the number of concurrent
+requests made to Azure DevOps. A tool that splits its work into several
+requests fans them out on a second, separate pool, so it never waits for
+a worker that other tool calls are holding.
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Coroutine, Iterable, List, Optional
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_MAX_FANOUT = 4
+
+_executor: Optional[ThreadPoolExecutor] = None
+_max_workers: Optional[int] = None
+_executor_lock = threading.Lock()
+
+_fanout_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _default_max_workers() -> int:
+    """Get the worker count from the environment or the default."""
+    value = os.environ.get("AZURE_DEVOPS_MAX_WORKERS")
+    return int(value) if value else DEFAULT_MAX_WORKERS
+
+
+def configure_worker_pool(max_workers: Optional[int] = None) -> None:
+    """
+    Set the maximum number of tool calls that may run concurrently.
+
+    Args:
+        max_workers: Size of the worker pool. Uses AZURE_DEVOPS_MAX_WORKERS
+            or the default when omitted.
+
+    Raises:
+        ValueError: If max_workers is less than 1
+    """
+    global _executor, _max_workers
+
+    if max_workers is None:
+        max_workers = _default_max_workers()
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    with _executor_lock:
+        previous = _executor
+        _executor = None
+        _max_workers = max_workers
+
+    # Let in-flight calls on the old pool finish on their own
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+def get_worker_pool() -> ThreadPoolExecutor:
+    """
+    Get the shared worker pool, creating it on first use.
+
+    Returns:
+        ThreadPoolExecutor used to run tool bodies
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_max_workers or _default_max_workers(),
+                thread_name_prefix="azure-devops-tool",
+            )
+        return _executor
+
+
+def run_in_worker(
+    fn: Callable[..., Any],
+) -> Callable[..., Coroutine[Any, Any, Any]]:
+    """
+    Wrap a blocking function so it runs on the shared worker pool.
+
+    The wrapper keeps the wrapped function's signature and docstring, so it
+    can be registered as an MCP tool in its place. Context variables are
+    copied into the worker thread.
+
+    Args:
+        fn: Synchronous function to wrap
+
+    Returns:
+        Async function that awaits fn on the worker pool
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, fn, *args, **kwargs)
+        return await loop.run_in_executor(get_worker_pool(), call)
+
+    return wrapper
+
+
+def _get_fanout_pool() -> ThreadPoolExecutor:
+    global _fanout_executor
+
+    with _executor_lock:
+        if _fanout_executor is None:
+            value = os.environ.get("AZURE_DEVOPS_MAX_FANOUT")
+            _fanout_executor = ThreadPoolExecutor(
+                max_workers=max(int(value), 1)
+                if value
+                else DEFAULT_MAX_FANOUT,
+                thread_name_prefix="azure-devops-fanout",
+            )
+        return _fanout_executor
+
+
+def map_concurrently(fn: Callable[[Any], Any], items: Iterable) -> List:
+    """
+    Call a blocking function for several items at once.
+
+    The calls share a bounded pool of AZURE_DEVOPS_MAX_FANOUT threads
+    (default 4) and see the caller's context variables. A single item is
+    handled on the calling thread. Must not be called from fn itself.
+
+    Args:
+        fn: Function taking one item
+        items: Items to call fn with
+
+    Returns:
+        The results, in the order of the items
+
+    Raises:
+        Exception: The first exception raised by any call, in item order
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+
+    pool = _get_fanout_pool()
+    futures = [
+        pool.submit(contextvars.copy_context().run, fn, item) for item in items
+    ]
+    return [future.result() for future in futures]
@@ -0,0 +1,132 @@
+"""
+Conditional requests for Azure DevOps resources that carry an ETag.
+
+Successful GET responses with an ``ETag`` (wiki pages, among others) are
+kept in the cache. The next request for the same URL is sent with
+``If-None-Match``; when Azure DevOps answers ``304 Not Modified`` the
+cached body is replayed as a normal ``200`` response, so SDK clients never
+notice the difference but unchanged content is not downloaded again.
+Bodies larger than MAX_STORED_BYTES are not kept, and neither are
+downloads of unknown length, which would otherwise be read into memory.
+"""
+
+import logging
+from typing import Optional
+
+from msrest.pipeline import HTTPPolicy
+
+from mcp_azure_devops.utils import metrics
+from mcp_azure_devops.utils.cache import get_cache
+from mcp_azure_devops.utils.retry import resource_area
+
+logger = logging.getLogger(__name__)
+
+CONDITIONAL_HITS = "azure_devops_conditional_hits_total"
+CONDITIONAL_BYTES_SAVED = "azure_devops_conditional_bytes_saved_total"
+
+# Largest response body kept for revalidation
+MAX_STORED_BYTES = 1024 * 1024
+
+# Response headers replayed from the cached response on a 304
+_REPLAYED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+def _fits(headers) -> bool:
+    """
+    Tell whether a body may be small enough to keep, before reading it.
+
+    JSON bodies are read whole by the SDK anyway; anything else is only
+    read when its announced length fits.
+    """
+    length = headers.get("Content-Length")
+    if length is not None and length.isdigit():
+        return int(length) <= MAX_STORED_BYTES
+    content_type = headers.get("Content-Type", "")
+    return content_type.startswith("application/json")
+
+
+class ConditionalRequestPolicy(HTTPPolicy):
+    """
+    msrest pipeline policy revalidating cached GET responses by ETag.
+
+    Cached responses are stored in the "responses" cache category, keyed by
+    the connection's scope, URL and Accept header.
+    """
+
+    def __init__(self, scope: str):
+        super().__init__()
+        self._scope = scope
+
+    def _key(self, http_request):
+        return (
+            self._scope,
+            http_request.url,
+            http_request.headers.get("Accept", ""),
+        )
+
+    def send(self, request, **kwargs):
+        assert self.next, "ConditionalRequestPolicy must be in a pipeline"
+        http_request = request.http_request
+        if http_request.method.upper() != "GET" or (
+            "If-None-Match" in http_request.headers
+        ):
+            return self.next.send(request, **kwargs)
+
+        cache = get_cache()
+        key = self._key(http_request)
+        stored = cache.get("responses", key)
+        if stored is not None:
+            http_request.headers["If-None-Match"] = stored["etag"]
+
+        response = self.next.send(request, **kwargs)
+        http_response = response.http_response
+        status = http_response.status_code
+
+        if status == 304 and stored is not None:
+            self._replay(http_response, stored)
+            metrics.increment(
+                CONDITIONAL_HITS, area=resource_area(http_request.url)
+            )
+            metrics.increment(
+                CONDITIONAL_BYTES_SAVED,
+                len(stored["body"]),
+                area=resource_area(http_request.url),
+            )
+        elif status == 200:
+            self._store(cache, key, http_response)
+        return response
+
+    @staticmethod
+    def _store(cache, key, http_response) -> None:
+        """Keep a response that can be revalidated later."""
+        etag: Optional[str] = http_response.headers.get("ETag")
+        if not etag or not _fits(http_response.headers):
+            return
+        body = http_response.internal_response.content
+        if len(body) > MAX_STORED_BYTES:
+            return
+        headers = {
+            name: http_response.headers[name]
+            for name in _REPLAYED_HEADERS
+            if name in http_response.headers
+        }
+        cache.set(
+            "responses",
+            key,
+            {
+                "etag": etag,
+                "headers": headers,
+                "body": body,
+            },
+        )
+
+    @staticmethod
+    def _replay(http_response, stored) -> None:
+        """Turn a 304 response into the cached 200 response."""
+        internal = http_response.internal_response
+        internal.status_code = 200
+        internal.reason = "OK"
+        internal._content = stored["body"]
+        internal.headers.update(stored["headers"])
+        http_response.status_code = 200
+        logger.debug("Revalidated %s with a 304", internal.url)
@@ -0,0 +1,260 @@
+"""
+Azure DevOps credentials supplied by the client of a shared server.
+
+Over stdio the server acts as the identity configured in its environment.
+Over HTTP, each client can send its own PAT instead, as basic auth in the
+``Authorization`` header (the form Azure DevOps itself accepts), and
+optionally its organization in ``X-Azure-DevOps-Organization-Url``. The
+server sends requests to that organization, so it must be an Azure DevOps
+Services organization, the server's own organization, or one listed in
+AZURE_DEVOPS_ALLOWED_ORGANIZATIONS.
+
+CredentialsMiddleware puts those credentials into a context variable for
+the rest of the request. MCP sessions run in the context of the request
+that opened them, so the credentials of a stateful session are the ones
+it was opened with; later requests for the session must present the same
+credentials or are rejected.
+"""
+
+import base64
+import binascii
+import contextlib
+import contextvars
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import FrozenSet, Iterator, Optional, Tuple
+
+from starlette.datastructures import Headers, QueryParams
+
+ORGANIZATION_HEADER = "X-Azure-DevOps-Organization-Url"
+SESSION_HEADER = "mcp-session-id"
+
+# Sessions whose owner is remembered; the oldest are forgotten first
+DEFAULT_MAX_SESSIONS = 10000
+
+# Organizations of Azure DevOps Services, old and new style
+_SERVICES_ORGANIZATION = re.compile(
+    r"https://(dev\.azure\.com/[a-z0-9][a-z0-9-]*"
+    r"|[a-z0-9][a-z0-9-]*\.visualstudio\.com)",
+    re.IGNORECASE,
+)
+
+# The SSE transport announces its session in the body of the stream
+_SSE_SESSION = re.compile(rb"session_id=([0-9a-fA-F]+)")
+
+_request_credentials: contextvars.ContextVar[
+    Optional[Tuple[str, Optional[str]]]
+] = contextvars.ContextVar("azure_devops_credentials", default=None)
+
+
+def get_request_credentials() -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Get the credentials the current request was made with.
+
+    Returns:
+        Tuple containing (pat, organization_url), where the organization
+        URL may be None, or None outside a request with credentials
+    """
+    return _request_credentials.get()
+
+
+@contextlib.contextmanager
+def use_credentials(
+    pat: str, organization_url: Optional[str] = None
+) -> Iterator[None]:
+    """
+    Act as another identity for the duration of a block.
+
+    Args:
+        pat: Personal access token
+        organization_url: Organization URL; the one configured in the
+            environment is used when omitted
+    """
+    token = _request_credentials.set((pat, organization_url))
+    try:
+        yield
+    finally:
+        _request_credentials.reset(token)
+
+
+def _allowed_organizations() -> FrozenSet[str]:
+    """Organizations besides Azure DevOps Services clients may choose."""
+    env = os.environ
+    urls = [env.get("AZURE_DEVOPS_ORGANIZATION_URL", "")]
+    urls.extend(env.get("AZURE_DEVOPS_ALLOWED_ORGANIZATIONS", "").split(","))
+    return frozenset(
+        url.strip().rstrip("/").lower() for url in urls if url.strip()
+    )
+
+
+def _check_organization_url(organization_url: str) -> str:
+    """
+    Check that a client may direct the server to an organization.
+
+    Args:
+        organization_url: Organization URL sent by the client
+
+    Returns:
+        The organization URL without a trailing slash
+
+    Raises:
+        ValueError: If the URL is not an allowed organization
+    """
+    organization_url = organization_url.strip().rstrip("/")
+    if not (
+        _SERVICES_ORGANIZATION.fullmatch(organization_url)
+        or organization_url.lower() in _allowed_organizations()
+    ):
+        raise ValueError(
+            f"{ORGANIZATION_HEADER} must be an Azure DevOps organization "
+            "such as https://dev.azure.com/<organization>"
+        )
+    return organization_url
+
+
+def credentials_from_headers(
+    headers: Headers,
+) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Read client credentials from HTTP request headers.
+
+    Args:
+        headers: Request headers
+
+    Returns:
+        Tuple containing (pat, organization_url), or None when the request
+        carries no credentials
+
+    Raises:
+        ValueError: If the Authorization header is not valid basic auth,
+            or the organization is not allowed
+    """
+    organization_url = headers.get(ORGANIZATION_HEADER) or None
+    authorization = headers.get("authorization")
+    if not authorization:
+        if organization_url:
+            raise ValueError(
+                f"{ORGANIZATION_HEADER} needs a PAT in the Authorization "
+                "header"
+            )
+        return None
+
+    scheme, _, encoded = authorization.partition(" ")
+    if scheme.lower() != "basic":
+        raise ValueError("Send the PAT as basic auth")
+    try:
+        decoded = base64.b64decode(encoded.strip(), validate=True)
+        _, _, pat = decoded.decode("utf-8").partition(":")
+    except (binascii.Error, UnicodeDecodeError):
+        raise ValueError("Malformed basic auth credentials")
+    if not pat:
+        raise ValueError("Basic auth credentials contain no PAT")
+    if organization_url:
+        organization_url = _check_organization_url(organization_url)
+    return pat, organization_url
+
+
+def _owner(credentials: Optional[Tuple[str, Optional[str]]]) -> str:
+    """Identify who a session belongs to without keeping the PAT."""
+    if credentials is None:
+        return ""
+    return hashlib.sha256(json.dumps(credentials).encode("utf-8")).hexdigest()
+
+
+class CredentialsMiddleware:
+    """
+    ASGI middleware running each HTTP request with its client's credentials.
+
+    Requests without credentials run as the server's own identity. The
+    owner of every session the server announces is remembered, and
+    requests for a session made with different credentials get a 403.
+
+    Args:
+        app: ASGI application to wrap
+        max_sessions: Sessions whose owner is remembered
+    """
+
+    def __init__(self, app, max_sessions: int = DEFAULT_MAX_SESSIONS):
+        self.app = app
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        try:
+            credentials = credentials_from_headers(headers)
+        except ValueError as e:
+            await _reject(send, 401, str(e))
+            return
+
+        owner = _owner(credentials)
+        session_id = headers.get(SESSION_HEADER) or QueryParams(
+            scope.get("query_string", b"")
+        ).get("session_id")
+        if session_id and not self._owned_by(session_id, owner):
+            await _reject(send, 403, "Session belongs to other credentials")
+            return
+
+        # Only the first event of a new SSE stream announces a session
+        sse_endpoint = scope["method"] == "GET" and not session_id
+
+        async def send_announcing_session(message):
+            nonlocal sse_endpoint
+            if message["type"] == "http.response.start":
+                announced = Headers(raw=message.get("headers", [])).get(
+                    SESSION_HEADER
+                )
+                if announced:
+                    self._remember(announced, owner)
+                    sse_endpoint = False
+            elif message["type"] == "http.response.body" and sse_endpoint:
+                sse_endpoint = False
+                match = _SSE_SESSION.search(message.get("body", b""))
+                if match:
+                    self._remember(match.group(1).decode("ascii"), owner)
+            await send(message)
+
+        token = _request_credentials.set(credentials)
+        try:
+            await self.app(scope, receive, send_announcing_session)
+        finally:
+            _request_credentials.reset(token)
+
+    def _owned_by(self, session_id: str, owner: str) -> bool:
+        with self._lock:
+            known = self._sessions.get(session_id)
+            if known is None:
+                return True
+            self._sessions.move_to_end(session_id)
+            return known == owner
+
+    def _remember(self, session_id: str, owner: str) -> None:
+        with self._lock:
+            self._sessions.setdefault(session_id, owner)
+            self._sessions.move_to_end(session_id)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+
+async def _reject(send, status: int, detail: str) -> None:
+    body = json.dumps({"error": detail}).encode("utf-8")
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
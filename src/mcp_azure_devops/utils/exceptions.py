@@ -5,3 +5,15 @@ class AzureDevOpsClientError(Exception):
     """Exception raised for errors in Azure DevOps client operations."""
 
     pass
+
+
+class CircuitOpenError(AzureDevOpsClientError):
+    """Exception raised when requests to a failing service are cut off."""
+
+    pass
+
+
+class CassetteMissError(AzureDevOpsClientError):
+    """Exception raised when a replayed request was never recorded."""
+
+    pass
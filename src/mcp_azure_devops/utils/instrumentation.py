@@ -0,0 +1,142 @@
+"""
+Latency and error instrumentation for tools and Azure DevOps requests.
+
+Every registered tool records its latency and outcome, and every HTTP
+request sent by an SDK client records its latency, status and response
+size per endpoint (see telemetry.MetricsPolicy). The metrics can be
+scraped in the Prometheus text format from a small HTTP endpoint.
+"""
+
+import functools
+import inspect
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from mcp_azure_devops.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+TOOL_DURATION = "azure_devops_tool_duration_seconds"
+TOOL_CALLS = "azure_devops_tool_calls_total"
+HTTP_DURATION = "azure_devops_http_request_duration_seconds"
+HTTP_REQUESTS = "azure_devops_http_requests_total"
+HTTP_RESPONSE_BYTES = "azure_devops_http_response_bytes_total"
+FORMAT_DURATION = "azure_devops_format_duration_seconds"
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def endpoint_name(url: str) -> str:
+    """
+    Get a low-cardinality name for the REST endpoint of a URL.
+
+    The name is made of the two path segments following ``_apis``, which
+    name the resource area and resource without any IDs.
+
+    Args:
+        url: Request URL
+
+    Returns:
+        Endpoint name, e.g. "wit/workitems", or "location" for discovery
+    """
+    segments = [s.lower() for s in urlsplit(url).path.split("/") if s]
+    if "_apis" not in segments:
+        return "location"
+    resource = segments[segments.index("_apis") + 1 :][:2]
+    return "/".join(resource) or "location"
+
+
+def _outcome(result) -> str:
+    """Classify a tool result; tools report failures as "Error..." text."""
+    if isinstance(result, str) and result.startswith("Error"):
+        return "error"
+    return "ok"
+
+
+def instrument_tool(fn, name: str):
+    """
+    Record latency and outcome of every call to a tool.
+
+    Args:
+        fn: Tool function, synchronous or async
+        name: Tool name used as the metric label
+
+    Returns:
+        Wrapped function with the same signature
+    """
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            outcome = "exception"
+            try:
+                result = await fn(*args, **kwargs)
+                outcome = _outcome(result)
+                return result
+            finally:
+                _record_tool(name, outcome, start)
+
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        outcome = "exception"
+        try:
+            result = fn(*args, **kwargs)
+            outcome = _outcome(result)
+            return result
+        finally:
+            _record_tool(name, outcome, start)
+
+    return wrapper
+
+
+def _record_tool(name: str, outcome: str, start: float) -> None:
+    metrics.observe(TOOL_DURATION, time.perf_counter() - start, tool=name)
+    metrics.increment(TOOL_CALLS, tool=name, outcome=outcome)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Serves the metrics registry at /metrics."""
+
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = metrics.render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format, *args)
+
+
+def start_metrics_server(
+    port: int, host: str = "127.0.0.1"
+) -> ThreadingHTTPServer:
+    """
+    Serve the metrics in the Prometheus text format on a background thread.
+
+    Args:
+        port: Port to listen on; 0 picks a free port
+        host: Address to bind to
+
+    Returns:
+        The running server; call shutdown() to stop it
+    """
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(
+        target=server.serve_forever, name="metrics-server", daemon=True
+    )
+    thread.start()
+    logger.info("Serving metrics on http://%s:%d/metrics", host, port)
+    return server
@@ -0,0 +1,234 @@
+"""
+In-process metrics for the MCP Azure DevOps server.
+
+Counters, gauges and histograms are kept in a process-wide registry keyed by
+metric name and labels, so the client layer can report what it is doing
+without depending on a metrics library. The registry can be rendered in the
+Prometheus text exposition format.
+"""
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+LabelSet = Tuple[Tuple[str, str], ...]
+
+# Histogram bucket upper bounds in seconds
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+class _Histogram:
+    """Cumulative bucket counts, sum and count of observed values."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * len(self.buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.sum += value
+        self.count += 1
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+
+
+_lock = threading.Lock()
+_counters: Dict[Tuple[str, LabelSet], float] = {}
+_gauges: Dict[Tuple[str, LabelSet], float] = {}
+_histograms: Dict[Tuple[str, LabelSet], _Histogram] = {}
+
+
+def _key(name: str, labels: Dict[str, object]) -> Tuple[str, LabelSet]:
+    """Build a registry key from a metric name and its labels."""
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def increment(name: str, value: float = 1, **labels) -> None:
+    """
+    Increase a counter.
+
+    Args:
+        name: Metric name
+        value: Amount to add
+        **labels: Label values identifying the series
+    """
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def set_gauge(name: str, value: float, **labels) -> None:
+    """
+    Set a gauge to a value.
+
+    Args:
+        name: Metric name
+        value: Current value
+        **labels: Label values identifying the series
+    """
+    with _lock:
+        _gauges[_key(name, labels)] = value
+
+
+def observe(
+    name: str,
+    value: float,
+    buckets: Sequence[float] = DEFAULT_BUCKETS,
+    **labels,
+) -> None:
+    """
+    Record a value in a histogram.
+
+    Args:
+        name: Metric name
+        value: Observed value, usually a duration in seconds
+        buckets: Bucket upper bounds, used when the series is new
+        **labels: Label values identifying the series
+    """
+    key = _key(name, labels)
+    with _lock:
+        histogram = _histograms.get(key)
+        if histogram is None:
+            histogram = _histograms[key] = _Histogram(buckets)
+        histogram.observe(value)
+
+
+@contextmanager
+def timer(name: str, **labels) -> Iterator[None]:
+    """
+    Record the duration of a block in a histogram.
+
+    Args:
+        name: Metric name
+        **labels: Label values identifying the series
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start, **labels)
+
+
+def get_histogram(name: str, **labels) -> Tuple[int, float]:
+    """
+    Get the number and sum of values recorded in a histogram.
+
+    Args:
+        name: Metric name
+        **labels: Label values identifying the series
+
+    Returns:
+        Tuple of (count, sum), or (0, 0.0) if nothing was recorded
+    """
+    with _lock:
+        histogram = _histograms.get(_key(name, labels))
+        if histogram is None:
+            return 0, 0.0
+        return histogram.count, histogram.sum
+
+
+def get_value(name: str, **labels) -> float:
+    """
+    Get the current value of a counter or gauge.
+
+    Args:
+        name: Metric name
+        **labels: Label values identifying the series
+
+    Returns:
+        The current value, or 0 if the series has not been recorded
+    """
+    key = _key(name, labels)
+    with _lock:
+        if key in _gauges:
+            return _gauges[key]
+        return _counters.get(key, 0)
+
+
+def reset() -> None:
+    """Clear all recorded metrics."""
+    with _lock:
+        _counters.clear()
+        _gauges.clear()
+        _histograms.clear()
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: LabelSet, extra: LabelSet = ()) -> str:
+    """Render a label set, e.g. {tool="get_projects"}."""
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    rendered = ",".join(f'{k}="{_escape(v)}"' for k, v in pairs)
+    return "{" + rendered + "}"
+
+
+def _number(value: float) -> str:
+    """Render a sample value."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def render_prometheus() -> str:
+    """
+    Render all metrics in the Prometheus text exposition format.
+
+    Returns:
+        The exposition text, ending with a newline
+    """
+    with _lock:
+        counters = sorted(_counters.items())
+        gauges = sorted(_gauges.items())
+        histograms = sorted(
+            (key, (h.buckets, list(h.counts), h.sum, h.count))
+            for key, h in _histograms.items()
+        )
+
+    lines: List[str] = []
+    typed = set()
+
+    def declare(name: str, kind: str) -> None:
+        if name not in typed:
+            typed.add(name)
+            lines.append(f"# TYPE {name} {kind}")
+
+    for (name, labels), value in counters:
+        declare(name, "counter")
+        lines.append(f"{name}{_labels(labels)} {_number(value)}")
+    for (name, labels), value in gauges:
+        declare(name, "gauge")
+        lines.append(f"{name}{_labels(labels)} {_number(value)}")
+    for (name, labels), (buckets, counts, total, count) in histograms:
+        declare(name, "histogram")
+        for bound, bucket_count in zip(buckets, counts):
+            le = (("le", _number(bound)),)
+            lines.append(f"{name}_bucket{_labels(labels, le)} {bucket_count}")
+        inf = (("le", "+Inf"),)
+        lines.append(f"{name}_bucket{_labels(labels, inf)} {count}")
+        lines.append(f"{name}_sum{_labels(labels)} {_number(total)}")
+        lines.append(f"{name}_count{_labels(labels)} {count}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,115 @@
+"""
+Thread-safe, pooled Azure DevOps connection.
+
+This module imports the Azure DevOps SDK and the HTTP stack, so it is only
+loaded when the first connection is made (see azure_client.get_connection).
+"""
+
+import logging
+import threading
+from typing import Optional
+
+from azure.devops import _file_cache
+from azure.devops.connection import Connection
+from azure.devops.v7_1.location.location_client import LocationClient
+
+from mcp_azure_devops.utils.cassettes import CassettePolicy
+from mcp_azure_devops.utils.conditional import ConditionalRequestPolicy
+from mcp_azure_devops.utils.retry import CircuitBreakers, RetryPolicy
+from mcp_azure_devops.utils.singleflight import SingleFlight, coalesce_client
+from mcp_azure_devops.utils.telemetry import MetricsPolicy, TracingPolicy
+from mcp_azure_devops.utils.throttling import (
+    RateLimitPolicy,
+    create_rate_limiter,
+)
+from mcp_azure_devops.utils.transport import create_session, install_transport
+
+logger = logging.getLogger(__name__)
+
+
+class PooledConnection(Connection):
+    """
+    Connection that can be shared between threads.
+
+    The SDK already caches client instances per connection, but the cache
+    is not guarded against concurrent first use, which would build the
+    same client (and run resource area discovery) more than once.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        creds=None,
+        user_agent: Optional[str] = None,
+        scope: str = "",
+    ):
+        super().__init__(base_url=base_url, creds=creds, user_agent=user_agent)
+        self._client_lock = threading.RLock()
+        self.session = create_session()
+        self.single_flight = SingleFlight()
+        # Identifies the organization and PAT in shared caches
+        self.scope = scope or base_url
+        # Owned by the connection, so they are dropped when it is evicted;
+        # their metrics are labelled with the organization only
+        self.rate_limiter = create_rate_limiter(base_url)
+        self.circuit_breakers = CircuitBreakers(base_url)
+
+    def get_client(self, client_type):
+        with self._client_lock:
+            return super().get_client(client_type)
+
+    def _pipeline_policies(self) -> list:
+        """Create the extra pipeline policies for one client."""
+        # Retries sit outside the rate limiter so every attempt is paced
+        return [
+            RetryPolicy(self.circuit_breakers),
+            RateLimitPolicy(self.rate_limiter),
+            ConditionalRequestPolicy(self.scope),
+            TracingPolicy(),
+            MetricsPolicy(),
+            CassettePolicy(getattr(self._creds, "password", "")),
+        ]
+
+    def _get_client_instance(self, client_class):
+        client = super()._get_client_instance(client_class)
+        client.cache_scope = self.scope
+        install_transport(client, self.session, self._pipeline_policies())
+        return coalesce_client(client, self.single_flight)
+
+    def _get_resource_areas(self, force=False):
+        # Mirrors Connection._get_resource_areas, but the location client
+        # shares the pooled session instead of opening its own
+        if self._resource_areas is not None and not force:
+            return self._resource_areas
+
+        location_client = install_transport(
+            LocationClient(self.base_url, self._creds),
+            self.session,
+            self._pipeline_policies(),
+        )
+        cache = _file_cache.RESOURCE_CACHE
+        cache_key = location_client.normalized_url
+        if not force and cache[cache_key]:
+            try:
+                self._resource_areas = (
+                    location_client._base_deserialize.deserialize_data(
+                        cache[cache_key], "[ResourceAreaInfo]"
+                    )
+                )
+                return self._resource_areas
+            except Exception as ex:
+                logger.debug(ex, exc_info=True)
+
+        # On-premises servers return an empty collection
+        self._resource_areas = location_client.get_resource_areas() or []
+        try:
+            cache[cache_key] = location_client._base_serialize.serialize_data(
+                self._resource_areas, "[ResourceAreaInfo]"
+            )
+        except Exception as ex:
+            logger.debug(ex, exc_info=True)
+        return self._resource_areas
+
+    def close(self) -> None:
+        """Close the shared HTTP session."""
+        self.session.close()
@@ -0,0 +1,212 @@
+"""
+Opt-in profiling of individual tool calls.
+
+When enabled, selected tools are run under cProfile and/or tracemalloc and
+every call leaves its profile in a directory:
+
+- ``<tool>-<time>-<n>.prof``: cProfile stats, readable with ``pstats`` or
+  snakeviz, showing whether msrest deserialization or formatting dominates
+- ``<tool>-<time>-<n>.tracemalloc.txt``: the allocations added while the
+  call ran, grouped by source line. Memory tracing is process-wide, so
+  calls running at the same time show up in each other's snapshots.
+
+Profiling wraps the synchronous tool body, so it runs on the worker thread
+that actually does the work.
+"""
+
+import cProfile
+import functools
+import itertools
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import FrozenSet, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILING_MODES = ("cprofile", "tracemalloc")
+DEFAULT_PROFILE_DIR = "profiles"
+# Allocation statistics written per call
+TOP_ALLOCATIONS = 50
+# Stack depth recorded for each allocation
+TRACEMALLOC_FRAMES = 10
+
+
+@dataclass
+class ProfilingSettings:
+    """
+    Which tools are profiled and how.
+
+    Attributes:
+        modes: Profilers to run, any of "cprofile" and "tracemalloc"
+        tools: Names of the tools to profile; empty profiles every tool
+        directory: Directory the profiles are written to
+    """
+
+    modes: FrozenSet[str] = frozenset()
+    tools: FrozenSet[str] = frozenset()
+    directory: str = DEFAULT_PROFILE_DIR
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.modes)
+
+    def applies_to(self, tool: str) -> bool:
+        return self.enabled and (not self.tools or tool in self.tools)
+
+
+def _split(value: Optional[str]) -> FrozenSet[str]:
+    """Split a comma separated environment variable."""
+    return frozenset(v.strip() for v in (value or "").split(",") if v.strip())
+
+
+_settings = ProfilingSettings()
+_counter = itertools.count(1)
+# cProfile cannot profile two threads' calls at once, so profiled calls
+# that overlap another one run unprofiled instead of waiting
+_cprofile_lock = threading.Lock()
+
+
+def configure_profiling(
+    modes: Optional[Iterable[str]] = None,
+    tools: Optional[Iterable[str]] = None,
+    directory: Optional[str] = None,
+) -> ProfilingSettings:
+    """
+    Enable or disable profiling of tool calls.
+
+    Args:
+        modes: Profilers to run. Uses AZURE_DEVOPS_PROFILE (comma
+            separated) when omitted; profiling is off when neither is set.
+        tools: Tools to profile. Uses AZURE_DEVOPS_PROFILE_TOOLS when
+            omitted; every tool is profiled when neither is set.
+        directory: Output directory. Uses AZURE_DEVOPS_PROFILE_DIR or
+            ./profiles when omitted.
+
+    Returns:
+        The active settings
+
+    Raises:
+        ValueError: If a mode is unknown
+    """
+    global _settings
+    env = os.environ
+    modes = (
+        frozenset(modes) if modes else _split(env.get("AZURE_DEVOPS_PROFILE"))
+    )
+    unknown = modes - set(PROFILING_MODES)
+    if unknown:
+        raise ValueError(
+            f"Unknown profiling mode: {', '.join(sorted(unknown))} "
+            f"(expected {', '.join(PROFILING_MODES)})"
+        )
+    tools = (
+        frozenset(tools)
+        if tools
+        else _split(env.get("AZURE_DEVOPS_PROFILE_TOOLS"))
+    )
+    directory = (
+        directory or env.get("AZURE_DEVOPS_PROFILE_DIR") or DEFAULT_PROFILE_DIR
+    )
+
+    settings = ProfilingSettings(modes, tools, directory)
+    if "tracemalloc" in modes and not tracemalloc.is_tracing():
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+    elif "tracemalloc" not in modes and "tracemalloc" in _settings.modes:
+        tracemalloc.stop()
+    if settings.enabled:
+        os.makedirs(directory, exist_ok=True)
+        logger.info(
+            "Profiling %s with %s into %s",
+            ", ".join(sorted(tools)) or "all tools",
+            ", ".join(sorted(modes)),
+            directory,
+        )
+    _settings = settings
+    return settings
+
+
+def get_profiling_settings() -> ProfilingSettings:
+    """Get the active profiling settings."""
+    return _settings
+
+
+def _output_prefix(settings: ProfilingSettings, tool: str) -> str:
+    """Get a unique path prefix for one call's profiles."""
+    stamp = time.strftime("%Y%m%dT%H%M%S")
+    name = f"{tool}-{stamp}-{next(_counter)}"
+    return os.path.join(settings.directory, name)
+
+
+def _write_allocations(path: str, before, after, tool: str) -> None:
+    """Write the allocations added between two snapshots."""
+    stats = after.compare_to(before, "lineno")
+    lines = [f"# Allocations added during {tool}, largest first"]
+    lines.extend(str(stat) for stat in stats[:TOP_ALLOCATIONS])
+    with open(path, "w", encoding="utf-8") as out:
+        out.write("\n".join(lines) + "\n")
+
+
+def profile_tool(fn, name: str):
+    """
+    Profile calls to a synchronous tool while profiling is enabled for it.
+
+    Settings are checked on every call, so tools registered before
+    configure_profiling() is called are profiled too.
+
+    Args:
+        fn: Synchronous tool function
+        name: Tool name
+
+    Returns:
+        Wrapped function with the same signature
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        settings = _settings
+        if not settings.applies_to(name):
+            return fn(*args, **kwargs)
+
+        prefix = _output_prefix(settings, name)
+        profiler = None
+        if "cprofile" in settings.modes:
+            if _cprofile_lock.acquire(blocking=False):
+                profiler = cProfile.Profile()
+            else:
+                logger.debug("Skipping cProfile for overlapping %s", name)
+
+        trace_memory = (
+            "tracemalloc" in settings.modes and tracemalloc.is_tracing()
+        )
+        before = tracemalloc.take_snapshot() if trace_memory else None
+
+        try:
+            if profiler is not None:
+                return profiler.runcall(fn, *args, **kwargs)
+            return fn(*args, **kwargs)
+        finally:
+            # A profile that cannot be written must not replace the result
+            if profiler is not None:
+                _cprofile_lock.release()
+                try:
+                    profiler.dump_stats(f"{prefix}.prof")
+                except OSError as ex:
+                    logger.warning(
+                        "Could not write profile of %s: %s", name, ex
+                    )
+            if before is not None:
+                after = tracemalloc.take_snapshot()
+                try:
+                    _write_allocations(
+                        f"{prefix}.tracemalloc.txt", before, after, name
+                    )
+                except OSError as ex:
+                    logger.warning(
+                        "Could not write allocations of %s: %s", name, ex
+                    )
+
+    return wrapper
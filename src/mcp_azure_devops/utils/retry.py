@@ -0,0 +1,272 @@
+"""
+Retries and circuit breaking for Azure DevOps requests.
+
+Idempotent requests that hit a transient failure (a 5xx response or a
+dropped connection) are retried with jittered exponential backoff. Each
+resource area of an organization (wit, git, wiki, search, ...) has its own
+circuit breaker for every PAT: once an area keeps failing, requests to it
+fail fast until a cool-down has passed, instead of spending latency and
+rate limit budget on calls that are bound to fail.
+"""
+
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from msrest.exceptions import ClientRequestError
+from msrest.pipeline import HTTPPolicy
+
+from mcp_azure_devops.utils import metrics
+from mcp_azure_devops.utils.exceptions import CircuitOpenError
+
+RETRIES = "azure_devops_http_retries_total"
+CIRCUIT_OPEN = "azure_devops_circuit_open"
+CIRCUIT_REJECTED = "azure_devops_circuit_rejected_total"
+
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS"])
+RETRY_STATUS_CODES = frozenset([500, 502, 503, 504])
+
+
+@dataclass
+class RetrySettings:
+    """
+    Retry and circuit breaker settings.
+
+    Attributes:
+        attempts: Total attempts for an idempotent request
+        backoff: Base delay in seconds, doubled for every further attempt
+        max_backoff: Upper bound for a single delay in seconds
+        failure_threshold: Consecutive failures that open a circuit
+        reset_timeout: Seconds an open circuit waits before a trial request
+    """
+
+    attempts: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 8.0
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+
+    @classmethod
+    def from_env(cls) -> "RetrySettings":
+        """Create settings from AZURE_DEVOPS_RETRY_* environment variables."""
+        settings = cls()
+        env = os.environ
+        if env.get("AZURE_DEVOPS_RETRY_ATTEMPTS"):
+            settings.attempts = max(int(env["AZURE_DEVOPS_RETRY_ATTEMPTS"]), 1)
+        if env.get("AZURE_DEVOPS_RETRY_BACKOFF"):
+            settings.backoff = float(env["AZURE_DEVOPS_RETRY_BACKOFF"])
+        if env.get("AZURE_DEVOPS_CIRCUIT_FAILURE_THRESHOLD"):
+            settings.failure_threshold = int(
+                env["AZURE_DEVOPS_CIRCUIT_FAILURE_THRESHOLD"]
+            )
+        if env.get("AZURE_DEVOPS_CIRCUIT_RESET_TIMEOUT"):
+            settings.reset_timeout = float(
+                env["AZURE_DEVOPS_CIRCUIT_RESET_TIMEOUT"]
+            )
+        return settings
+
+
+def resource_area(url: str) -> str:
+    """
+    Get the resource area a REST API URL belongs to.
+
+    Args:
+        url: Request URL, e.g. https://dev.azure.com/org/_apis/wit/wiql
+
+    Returns:
+        The area name (e.g. "wit"), or "location" for discovery requests
+    """
+    segments = [s for s in urlsplit(url).path.split("/") if s]
+    lowered = [s.lower() for s in segments]
+    if "_apis" in lowered:
+        index = lowered.index("_apis")
+        if index + 1 < len(lowered):
+            return lowered[index + 1]
+    return "location"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one resource area of an organization.
+
+    The circuit opens after ``failure_threshold`` consecutive failures and
+    rejects requests until ``reset_timeout`` has passed. It then lets a
+    single trial request through: success closes the circuit, failure opens
+    it again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock=time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the circuit is currently rejecting requests."""
+        return self._opened_at is not None
+
+    def before_request(self) -> None:
+        """
+        Check that a request may be sent.
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            cooled_down = self._clock() - self._opened_at >= self.reset_timeout
+            if cooled_down and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+        metrics.increment(CIRCUIT_REJECTED, circuit=self.name)
+        raise CircuitOpenError(
+            f"Azure DevOps service '{self.name}' is failing; requests are "
+            f"paused for up to {self.reset_timeout:g} seconds."
+        )
+
+    def record_success(self) -> None:
+        """Record a successful request and close the circuit."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+        metrics.set_gauge(CIRCUIT_OPEN, 0, circuit=self.name)
+
+    def release_trial(self) -> None:
+        """End a trial request that neither succeeded nor failed."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit if needed."""
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if (
+                self._opened_at is not None
+                or self._failures >= self.failure_threshold
+            ):
+                self._opened_at = self._clock()
+            is_open = self._opened_at is not None
+        metrics.set_gauge(CIRCUIT_OPEN, int(is_open), circuit=self.name)
+
+
+class CircuitBreakers:
+    """
+    Circuit breakers for the resource areas of one pooled connection.
+
+    Each PAT has its own connection and so its own breakers, which go away
+    with the connection: failures caused by one client's credentials or
+    throttling do not cut off the others.
+    """
+
+    def __init__(
+        self,
+        organization_url: str,
+        settings: Optional[RetrySettings] = None,
+    ):
+        self.organization_url = organization_url.rstrip("/").lower()
+        self._settings = settings or RetrySettings.from_env()
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, area: str) -> CircuitBreaker:
+        """
+        Get the circuit breaker for a resource area.
+
+        Args:
+            area: Resource area name
+
+        Returns:
+            CircuitBreaker for the area, named after the organization
+        """
+        with self._lock:
+            breaker = self._breakers.get(area)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    f"{self.organization_url}:{area}",
+                    failure_threshold=self._settings.failure_threshold,
+                    reset_timeout=self._settings.reset_timeout,
+                )
+                self._breakers[area] = breaker
+            return breaker
+
+
+class RetryPolicy(HTTPPolicy):
+    """
+    msrest pipeline policy adding retries and circuit breaking.
+
+    Every request passes its area's circuit breaker. Only idempotent
+    requests are retried; other requests still count towards the breaker.
+    """
+
+    def __init__(
+        self,
+        breakers: CircuitBreakers,
+        settings: Optional[RetrySettings] = None,
+        sleep=time.sleep,
+    ):
+        super().__init__()
+        self._breakers = breakers
+        self._settings = settings or RetrySettings.from_env()
+        self._sleep = sleep
+
+    def _backoff(self, attempt: int) -> float:
+        """Get a jittered delay before the given retry."""
+        ceiling = min(
+            self._settings.backoff * 2**attempt, self._settings.max_backoff
+        )
+        return random.uniform(0, ceiling)
+
+    def send(self, request, **kwargs):
+        assert self.next, "RetryPolicy must be part of a pipeline"
+        http_request = request.http_request
+        area = resource_area(http_request.url)
+        breaker = self._breakers.get(area)
+        retryable = http_request.method.upper() in IDEMPOTENT_METHODS
+        attempts = self._settings.attempts if retryable else 1
+
+        attempt = 0
+        while True:
+            last_attempt = attempt >= attempts - 1
+            breaker.before_request()
+            try:
+                response = self.next.send(request, **kwargs)
+            except ClientRequestError:
+                breaker.record_failure()
+                if last_attempt:
+                    raise
+            except BaseException:
+                # Not an outcome of the service, but a trial request must
+                # still make way for the next one
+                breaker.release_trial()
+                raise
+            else:
+                if response.http_response.status_code not in (
+                    RETRY_STATUS_CODES
+                ):
+                    breaker.record_success()
+                    return response
+                breaker.record_failure()
+                if last_attempt:
+                    return response
+
+            metrics.increment(RETRIES, area=area)
+            self._sleep(self._backoff(attempt))
+            attempt += 1
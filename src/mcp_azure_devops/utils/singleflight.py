@@ -0,0 +1,157 @@
+"""
+Single-flight coalescing of identical Azure DevOps requests.
+
+When several tool calls ask for the same thing at the same time, only the
+first one goes to Azure DevOps; the others wait for it and share its
+result (or its exception). Calls are keyed by client, method and
+normalized arguments, and nothing is kept once a call has finished, so
+this never serves stale data.
+"""
+
+import functools
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from msrest.serialization import Model
+
+from mcp_azure_devops.utils import metrics
+
+SINGLE_FLIGHT_HITS = "azure_devops_single_flight_hits_total"
+
+# SDK methods that only read data and can be shared between callers
+READ_ONLY_PREFIXES = ("get_", "query_", "fetch_")
+
+# msrest call made by SDK methods that return a download generator
+_STREAM_DOWNLOAD = "stream_download"
+
+
+def normalize_args(value: Any) -> Hashable:
+    """
+    Turn call arguments into a hashable key.
+
+    msrest models are compared by their serialized content and containers
+    by their normalized items.
+
+    Args:
+        value: Argument value
+
+    Returns:
+        A hashable representation of the value
+
+    Raises:
+        TypeError: If the value cannot be made hashable
+    """
+    if isinstance(value, Model):
+        value = value.as_dict()
+    if isinstance(value, dict):
+        return tuple(
+            sorted(
+                ((k, normalize_args(v)) for k, v in value.items()),
+                key=repr,
+            )
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(normalize_args(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(normalize_args(v) for v in value)
+    hash(value)
+    return value
+
+
+class _Call:
+    """An in-flight call that later callers can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Group of calls that are coalesced while in flight."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any], name: str = ""):
+        """
+        Run a call, or wait for an identical call already in flight.
+
+        Args:
+            key: Key identifying identical calls
+            fn: Function making the call
+            name: Method name used as the metric label
+
+        Returns:
+            The result of the call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            metrics.increment(SINGLE_FLIGHT_HITS, method=name)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as ex:
+            call.error = ex
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+def coalesce_client(client, group: SingleFlight):
+    """
+    Coalesce identical concurrent calls to an SDK client's read methods.
+
+    Callers that share a call receive the same result object, so results
+    must be treated as read-only. Downloads are not coalesced: they return
+    a generator, which only one caller could consume.
+
+    Args:
+        client: Azure DevOps SDK client
+        group: Single-flight group shared by the connection's clients
+
+    Returns:
+        The same client, for chaining
+    """
+    client_name = type(client).__name__
+    for name in dir(type(client)):
+        if not name.startswith(READ_ONLY_PREFIXES):
+            continue
+        method = getattr(client, name)
+        if callable(method) and not _returns_stream(method):
+            setattr(client, name, _coalesced(method, client_name, group))
+    return client
+
+
+def _returns_stream(method) -> bool:
+    """Whether an SDK method returns a one-shot download generator."""
+    code = getattr(getattr(method, "__func__", method), "__code__", None)
+    return code is not None and _STREAM_DOWNLOAD in code.co_names
+
+
+def _coalesced(method, client_name: str, group: SingleFlight):
+    """Wrap one bound client method in a single-flight group."""
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        try:
+            key = (client_name, name, normalize_args((args, kwargs)))
+        except TypeError:
+            return method(*args, **kwargs)
+        return group.do(key, lambda: method(*args, **kwargs), name=name)
+
+    return wrapper
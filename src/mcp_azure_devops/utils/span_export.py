@@ -0,0 +1,40 @@
+"""
+Span exporter writing traces to a local file.
+
+Kept apart from tracing.py so that the OpenTelemetry SDK is only imported
+once an exporter is configured.
+"""
+
+import json
+import logging
+import threading
+from typing import Sequence
+
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+logger = logging.getLogger(__name__)
+
+
+class JsonFileSpanExporter(SpanExporter):
+    """Span exporter appending one JSON document per span to a file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        lines = [json.dumps(json.loads(span.to_json())) for span in spans]
+        try:
+            with self._lock, open(self.path, "a", encoding="utf-8") as out:
+                out.write("".join(line + "\n" for line in lines))
+        except OSError as ex:
+            logger.warning("Could not write spans to %s: %s", self.path, ex)
+            return SpanExportResult.FAILURE
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        pass
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
@@ -0,0 +1,88 @@
+"""
+Pipeline policies recording metrics and spans for Azure DevOps requests.
+
+They live apart from the tool instrumentation and tracing modules because
+they need msrest, which is only loaded with the first connection rather
+than at server startup.
+"""
+
+import time
+
+from msrest.exceptions import ClientRequestError
+from msrest.pipeline import HTTPPolicy
+
+from mcp_azure_devops.utils import metrics, tracing
+from mcp_azure_devops.utils.instrumentation import (
+    HTTP_DURATION,
+    HTTP_REQUESTS,
+    HTTP_RESPONSE_BYTES,
+    endpoint_name,
+)
+
+
+class MetricsPolicy(HTTPPolicy):
+    """
+    msrest pipeline policy recording every HTTP request to Azure DevOps.
+
+    It sits closest to the network, so each retry and each revalidation is
+    recorded as the request that actually went over the wire.
+    """
+
+    def send(self, request, **kwargs):
+        assert self.next, "MetricsPolicy must be part of a pipeline"
+        http_request = request.http_request
+        labels = {
+            "endpoint": endpoint_name(http_request.url),
+            "method": http_request.method.upper(),
+        }
+        start = time.perf_counter()
+        try:
+            response = self.next.send(request, **kwargs)
+        except ClientRequestError:
+            metrics.increment(HTTP_REQUESTS, status="error", **labels)
+            raise
+        finally:
+            metrics.observe(
+                HTTP_DURATION, time.perf_counter() - start, **labels
+            )
+
+        http_response = response.http_response
+        metrics.increment(
+            HTTP_REQUESTS, status=str(http_response.status_code), **labels
+        )
+        # Bodies without a length are not counted: reading them here would
+        # pull streamed downloads into memory
+        length = http_response.headers.get("Content-Length", "")
+        if length.isdigit():
+            metrics.increment(HTTP_RESPONSE_BYTES, int(length), **labels)
+        return response
+
+
+class TracingPolicy(HTTPPolicy):
+    """msrest pipeline policy recording each HTTP request as a span."""
+
+    def send(self, request, **kwargs):
+        assert self.next, "TracingPolicy must be part of a pipeline"
+        if not tracing.is_enabled():
+            return self.next.send(request, **kwargs)
+
+        http_request = request.http_request
+        method = http_request.method.upper()
+        with tracing.span(
+            f"{method} {endpoint_name(http_request.url)}",
+            **{
+                "http.request.method": method,
+                "url.full": http_request.url,
+            },
+        ) as current:
+            try:
+                response = self.next.send(request, **kwargs)
+            except ClientRequestError as ex:
+                tracing.mark_error(current, str(ex))
+                raise
+            status = response.http_response.status_code
+            if current is not None:
+                current.set_attribute("http.response.status_code", status)
+            if status >= 400:
+                tracing.mark_error(current, f"HTTP {status}")
+            return response
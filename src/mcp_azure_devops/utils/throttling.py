@@ -0,0 +1,236 @@
+"""
+Rate limit aware request scheduling for Azure DevOps.
+
+Azure DevOps throttles clients by their usage (TSTUs) and reports the
+remaining budget in ``X-RateLimit-*`` headers, with ``Retry-After`` once a
+client is being throttled. Requests made to an organization with one PAT
+are paced through the connection's token bucket, which also honours them,
+so heavy workloads queue and slow down instead of failing.
+"""
+
+import email.utils
+import os
+import threading
+import time
+from typing import Mapping, Optional
+
+from msrest.pipeline import HTTPPolicy
+
+from mcp_azure_devops.utils import metrics
+
+RATE_LIMIT_REMAINING = "azure_devops_rate_limit_remaining"
+RATE_LIMIT_LIMIT = "azure_devops_rate_limit_limit"
+RATE_LIMIT_DELAY = "azure_devops_rate_limit_delay_seconds"
+RATE_LIMIT_TOKENS = "azure_devops_rate_limit_tokens"
+THROTTLED_REQUESTS = "azure_devops_throttled_requests_total"
+
+DEFAULT_RATE = 25.0
+DEFAULT_BURST = 50
+# Below this fraction of the remaining budget, requests are slowed down
+LOW_WATER_MARK = 0.2
+# Slowest pace, as a fraction of the configured rate
+MIN_RATE_FACTOR = 0.1
+# Longest pause taken on the word of a single response header
+MAX_PAUSE = 300.0
+
+
+def _parse_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a header holding delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(when.timestamp() - time.time(), 0.0)
+
+
+class RateLimiter:
+    """
+    Token bucket shared by all requests made through one connection.
+
+    Tokens refill at ``rate`` per second up to ``burst``. Every request takes
+    one token, waiting for it if necessary. Responses feed their rate limit
+    headers back through observe(), which pauses the bucket when Azure
+    DevOps asks for a delay and slows the refill as the remaining budget
+    runs low.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        organization: str = "",
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.organization = organization
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._rate_factor = 1.0
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last update."""
+        if self.rate > 0:
+            earned = (now - self._updated) * self.rate * self._rate_factor
+            self._tokens = min(self._tokens + earned, float(self.burst))
+        self._updated = now
+
+    def acquire(self) -> float:
+        """
+        Wait until a request may be sent.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self.rate <= 0 or self._tokens >= 1:
+                    self._tokens -= 1
+                    metrics.set_gauge(
+                        RATE_LIMIT_TOKENS,
+                        max(self._tokens, 0),
+                        organization=self.organization,
+                    )
+                    return waited
+                else:
+                    wait = (1 - self._tokens) / (self.rate * self._rate_factor)
+            self._sleep(wait)
+            waited += wait
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back all requests for a number of seconds.
+
+        Args:
+            seconds: Length of the pause
+        """
+        seconds = min(seconds, MAX_PAUSE)
+        with self._lock:
+            self._paused_until = max(
+                self._paused_until, self._clock() + seconds
+            )
+
+    def observe(self, headers: Mapping[str, str]) -> Optional[float]:
+        """
+        Update the schedule from a response's rate limit headers.
+
+        Args:
+            headers: Response headers
+
+        Returns:
+            Seconds Azure DevOps asked clients to wait, if any
+        """
+        delay = _parse_seconds(headers.get("Retry-After"))
+        if delay is None:
+            delay = _parse_seconds(headers.get("X-RateLimit-Delay"))
+        if delay:
+            self.pause(delay)
+        metrics.set_gauge(
+            RATE_LIMIT_DELAY, delay or 0, organization=self.organization
+        )
+
+        remaining = headers.get("X-RateLimit-Remaining")
+        limit = headers.get("X-RateLimit-Limit")
+        if remaining is not None and limit:
+            try:
+                fraction = float(remaining) / float(limit)
+            except (ValueError, ZeroDivisionError):
+                fraction = None
+            if fraction is not None:
+                metrics.set_gauge(
+                    RATE_LIMIT_REMAINING,
+                    float(remaining),
+                    organization=self.organization,
+                )
+                metrics.set_gauge(
+                    RATE_LIMIT_LIMIT,
+                    float(limit),
+                    organization=self.organization,
+                )
+                with self._lock:
+                    self._refill(self._clock())
+                    self._rate_factor = min(
+                        1.0,
+                        max(MIN_RATE_FACTOR, fraction / LOW_WATER_MARK),
+                    )
+        return delay
+
+
+class RateLimitPolicy(HTTPPolicy):
+    """
+    msrest pipeline policy that schedules requests through a RateLimiter.
+
+    Throttled responses (429) are not returned to the caller while retries
+    remain: the request waits for the advertised delay and is sent again.
+    """
+
+    def __init__(self, limiter: RateLimiter, max_retries: int = 3):
+        super().__init__()
+        self._limiter = limiter
+        self._max_retries = max_retries
+
+    def send(self, request, **kwargs):
+        assert self.next, "RateLimitPolicy must be part of a pipeline"
+        attempt = 0
+        while True:
+            self._limiter.acquire()
+            response = self.next.send(request, **kwargs)
+            http_response = response.http_response
+            delay = self._limiter.observe(http_response.headers)
+
+            if (
+                http_response.status_code != 429
+                or attempt >= self._max_retries
+            ):
+                return response
+
+            metrics.increment(
+                THROTTLED_REQUESTS, organization=self._limiter.organization
+            )
+            if not delay:
+                # Throttled without guidance, back off exponentially
+                self._limiter.pause(2**attempt)
+            attempt += 1
+
+
+def create_rate_limiter(organization_url: str) -> RateLimiter:
+    """
+    Create the rate limiter for one pooled connection.
+
+    Azure DevOps throttles each identity separately, so every connection
+    (one per organization and PAT) has a limiter of its own, which goes
+    away with the connection. The rate and burst size come from
+    AZURE_DEVOPS_MAX_REQUESTS_PER_SECOND (0 disables pacing) and
+    AZURE_DEVOPS_MAX_REQUEST_BURST. Rate limit headers are honoured either
+    way.
+
+    Args:
+        organization_url: Organization the limiter's metrics are labelled
+            with
+
+    Returns:
+        RateLimiter for the connection
+    """
+    rate = os.environ.get("AZURE_DEVOPS_MAX_REQUESTS_PER_SECOND")
+    burst = os.environ.get("AZURE_DEVOPS_MAX_REQUEST_BURST")
+    return RateLimiter(
+        rate=float(rate) if rate else DEFAULT_RATE,
+        burst=int(burst) if burst else DEFAULT_BURST,
+        organization=organization_url.rstrip("/").lower(),
+    )
@@ -0,0 +1,213 @@
+"""
+OpenTelemetry tracing for tool calls and the Azure DevOps requests they make.
+
+Every tool call becomes a trace with a child span for each HTTP request
+(see telemetry.TracingPolicy) and for formatting, which shows round trips
+that run one after another but could overlap. Tracing is optional: it
+needs the ``tracing`` extra (``pip install mcp-azure-devops[tracing]``) and
+is off until an exporter is configured. Spans can be sent to an OTLP
+collector (configured through the standard ``OTEL_EXPORTER_OTLP_*``
+variables) or appended to a JSON lines file.
+"""
+
+import atexit
+import functools
+import inspect
+import logging
+import os
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator, Optional
+
+try:
+    from opentelemetry import trace
+except ImportError:  # pragma: no cover - depends on installed extras
+    trace = None
+
+if TYPE_CHECKING:
+    from opentelemetry.sdk.trace.export import SpanExporter
+    from opentelemetry.trace import Span
+
+logger = logging.getLogger(__name__)
+
+TRACER_NAME = "mcp_azure_devops"
+SERVICE_NAME = "mcp-azure-devops"
+EXPORTERS = ("otlp", "json")
+DEFAULT_TRACE_FILE = "mcp-azure-devops-traces.jsonl"
+
+_provider = None
+_tracer = None
+
+
+def _create_exporter(exporter: str, path: Optional[str]) -> "SpanExporter":
+    """Create the span exporter for an exporter name."""
+    if exporter == "otlp":
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+                OTLPSpanExporter,
+            )
+        except ImportError:
+            raise RuntimeError(
+                "OTLP tracing needs opentelemetry-exporter-otlp-proto-http; "
+                "install mcp-azure-devops[tracing]"
+            )
+        return OTLPSpanExporter()
+    if exporter == "json":
+        from mcp_azure_devops.utils.span_export import JsonFileSpanExporter
+
+        return JsonFileSpanExporter(path or DEFAULT_TRACE_FILE)
+    raise ValueError(
+        f"Unknown trace exporter: {exporter} "
+        f"(expected one of {', '.join(EXPORTERS)})"
+    )
+
+
+def configure_tracing(
+    exporter: Optional[str] = None, path: Optional[str] = None
+) -> bool:
+    """
+    Start exporting spans.
+
+    Args:
+        exporter: "otlp" or "json". Uses AZURE_DEVOPS_TRACE_EXPORTER when
+            omitted; tracing stays off when neither is set.
+        path: File for the json exporter. Uses AZURE_DEVOPS_TRACE_FILE or
+            mcp-azure-devops-traces.jsonl when omitted.
+
+    Returns:
+        True if tracing was enabled
+
+    Raises:
+        RuntimeError: If the OpenTelemetry packages are not installed
+        ValueError: If the exporter name is unknown
+    """
+    global _provider, _tracer
+    exporter = exporter or os.environ.get("AZURE_DEVOPS_TRACE_EXPORTER")
+    if not exporter:
+        return False
+    if trace is None:
+        raise RuntimeError(
+            "Tracing needs the OpenTelemetry SDK; install "
+            "mcp-azure-devops[tracing]"
+        )
+
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+    span_exporter = _create_exporter(
+        exporter, path or os.environ.get("AZURE_DEVOPS_TRACE_FILE")
+    )
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": SERVICE_NAME})
+    )
+    provider.add_span_processor(BatchSpanProcessor(span_exporter))
+
+    shutdown_tracing()
+    _provider = provider
+    _tracer = provider.get_tracer(TRACER_NAME)
+    atexit.register(shutdown_tracing)
+    return True
+
+
+def shutdown_tracing() -> None:
+    """Flush pending spans and stop tracing."""
+    global _provider, _tracer
+    provider, _provider, _tracer = _provider, None, None
+    if provider is not None:
+        provider.shutdown()
+
+
+def is_enabled() -> bool:
+    """Whether spans are being recorded."""
+    return _tracer is not None
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[Optional["Span"]]:
+    """
+    Record a block as a span, nested under the current span.
+
+    Args:
+        name: Span name
+        **attributes: Span attributes
+
+    Yields:
+        The span, or None while tracing is off
+    """
+    tracer = _tracer
+    if tracer is None:
+        yield None
+        return
+    with tracer.start_as_current_span(name, attributes=attributes) as current:
+        yield current
+
+
+def mark_error(current: Optional["Span"], description: str) -> None:
+    """
+    Mark a span as failed.
+
+    Args:
+        current: Span from span(), or None
+        description: Short description of the failure
+    """
+    if current is not None:
+        from opentelemetry.trace import Status, StatusCode
+
+        current.set_status(Status(StatusCode.ERROR, description))
+
+
+def traced(name: str):
+    """Decorator recording every call of a function as a span."""
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return fn(*args, **kwargs)
+            with span(name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def trace_tool(fn, name: str):
+    """
+    Record every call to a tool as the root span of its trace.
+
+    Args:
+        fn: Tool function, synchronous or async
+        name: Tool name
+
+    Returns:
+        Wrapped function with the same signature
+    """
+
+    def finish(current, result):
+        if isinstance(result, str) and result.startswith("Error"):
+            mark_error(current, result.splitlines()[0])
+
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            if _tracer is None:
+                return await fn(*args, **kwargs)
+            with span(f"tool {name}", **{"mcp.tool.name": name}) as current:
+                result = await fn(*args, **kwargs)
+                finish(current, result)
+                return result
+
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if _tracer is None:
+            return fn(*args, **kwargs)
+        with span(f"tool {name}", **{"mcp.tool.name": name}) as current:
+            result = fn(*args, **kwargs)
+            finish(current, result)
+            return result
+
+    return wrapper
@@ -0,0 +1,241 @@
+"""
+HTTP transport for Azure DevOps SDK clients.
+
+Every SDK client normally owns a private ``requests`` session, so a fresh
+client means a fresh TCP and TLS handshake. This module provides one
+long-lived, pooled session per pooled connection and installs it into the
+msrest pipeline of each client created from that connection.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import requests
+from msrest.pipeline import HTTPPolicy, Pipeline
+from msrest.pipeline.requests import (
+    PipelineRequestsHTTPSender,
+    RequestsCredentialsPolicy,
+    RequestsPatchSession,
+)
+from msrest.universal_http.requests import RequestsHTTPSender
+from requests.adapters import HTTPAdapter
+from urllib3 import Retry
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from mcp_azure_devops.utils import metrics
+
+CONNECTIONS_OPENED = "azure_devops_http_connections_opened_total"
+CONNECTIONS_REUSED = "azure_devops_http_connections_reused_total"
+
+
+@dataclass
+class PoolSettings:
+    """
+    Connection pool settings for the shared HTTP session.
+
+    Attributes:
+        pool_connections: Number of per-host connection pools to keep
+        pool_maxsize: Maximum number of connections kept per host
+        keep_alive: Whether connections are kept open between requests
+        idle_timeout: Seconds without requests after which pooled
+            connections are closed; 0 disables the timeout
+    """
+
+    pool_connections: int = 10
+    pool_maxsize: int = 32
+    keep_alive: bool = True
+    idle_timeout: float = 60.0
+
+    @classmethod
+    def from_env(cls) -> "PoolSettings":
+        """Create settings from AZURE_DEVOPS_HTTP_* environment variables."""
+        settings = cls()
+        env = os.environ
+        if env.get("AZURE_DEVOPS_HTTP_POOL_CONNECTIONS"):
+            settings.pool_connections = int(
+                env["AZURE_DEVOPS_HTTP_POOL_CONNECTIONS"]
+            )
+        if env.get("AZURE_DEVOPS_HTTP_POOL_MAXSIZE"):
+            settings.pool_maxsize = int(env["AZURE_DEVOPS_HTTP_POOL_MAXSIZE"])
+        keep_alive = env.get("AZURE_DEVOPS_HTTP_KEEP_ALIVE")
+        if keep_alive:
+            settings.keep_alive = keep_alive.lower() in ("1", "true", "yes")
+        if env.get("AZURE_DEVOPS_HTTP_IDLE_TIMEOUT"):
+            settings.idle_timeout = float(
+                env["AZURE_DEVOPS_HTTP_IDLE_TIMEOUT"]
+            )
+        return settings
+
+
+_settings: Optional[PoolSettings] = None
+
+
+def configure_pool(settings: Optional[PoolSettings] = None) -> None:
+    """
+    Set the pool settings used for sessions created from now on.
+
+    Args:
+        settings: Pool settings. Reads the environment when omitted.
+    """
+    global _settings
+    _settings = settings
+
+
+def get_pool_settings() -> PoolSettings:
+    """Get the configured pool settings."""
+    return _settings or PoolSettings.from_env()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    """Connection pool that records whether each request reused a socket."""
+
+    def _make_request(self, conn, *args, **kwargs):
+        if getattr(conn, "sock", None) is None:
+            metrics.increment(CONNECTIONS_OPENED, host=self.host)
+        else:
+            metrics.increment(CONNECTIONS_REUSED, host=self.host)
+        return super()._make_request(conn, *args, **kwargs)
+
+
+class _CountingHTTPSConnectionPool(
+    _CountingHTTPConnectionPool, HTTPSConnectionPool
+):
+    """HTTPS variant of the counting connection pool."""
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter with connection counting and an idle timeout.
+
+    Pooled connections are dropped once the adapter has been idle for
+    longer than the idle timeout, so long quiet periods do not leave the
+    server holding sockets that Azure DevOps has already closed.
+    """
+
+    def __init__(self, settings: PoolSettings, **kwargs):
+        self._settings = settings
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._last_used = time.monotonic()
+        super().__init__(
+            pool_connections=settings.pool_connections,
+            pool_maxsize=settings.pool_maxsize,
+            **kwargs,
+        )
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+    def _drop_idle_connections(self) -> None:
+        """Close pooled connections if the adapter has been idle too long."""
+        idle_timeout = self._settings.idle_timeout
+        with self._lock:
+            now = time.monotonic()
+            idle = (
+                idle_timeout > 0
+                and self._in_flight == 0
+                and now - self._last_used > idle_timeout
+            )
+            self._in_flight += 1
+            self._last_used = now
+        if idle:
+            self.poolmanager.clear()
+
+    def send(self, request, *args, **kwargs):
+        self._drop_idle_connections()
+        if not self._settings.keep_alive:
+            request.headers["Connection"] = "close"
+        try:
+            return super().send(request, *args, **kwargs)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._last_used = time.monotonic()
+
+
+def create_session(
+    settings: Optional[PoolSettings] = None,
+) -> requests.Session:
+    """
+    Create a pooled session for talking to one Azure DevOps organization.
+
+    Args:
+        settings: Pool settings. Uses the configured settings when omitted.
+
+    Returns:
+        A requests Session with pooled adapters mounted
+    """
+    settings = settings or get_pool_settings()
+    session = requests.Session()
+    for prefix in ("https://", "http://"):
+        session.mount(prefix, PooledHTTPAdapter(settings))
+
+    # Apply the msrest session defaults (redirect handling) once, but leave
+    # retries to RetryPolicy so requests are not retried at two layers
+    RequestsHTTPSender()._init_session(session)
+    for adapter in session.adapters.values():
+        if isinstance(adapter, HTTPAdapter):
+            adapter.max_retries = Retry(0, read=False)
+    return session
+
+
+class _SharedSessionSender(RequestsHTTPSender):
+    """msrest sender that always uses one shared session."""
+
+    def __init__(self, config, session: requests.Session):
+        super().__init__(config)
+        self._shared_session = session
+
+    @property
+    def session(self):
+        return self._shared_session
+
+    @session.setter
+    def session(self, value):
+        self._shared_session = value
+
+
+def install_transport(
+    client, session: requests.Session, policies: Sequence[HTTPPolicy] = ()
+):
+    """
+    Route an SDK client's requests through a shared session.
+
+    This rebuilds the client's msrest pipeline with the same policies msrest
+    uses by default, but with a sender bound to the given session.
+
+    Args:
+        client: Azure DevOps SDK client
+        session: Shared session to use
+        policies: Additional pipeline policies, run in order after the
+            default ones. Policy instances cannot be shared by clients.
+
+    Returns:
+        The same client, for chaining
+    """
+    config = client.config
+    # Never let msrest close the shared session after a request
+    config.keep_alive = True
+
+    default_policies = [
+        config.user_agent_policy,
+        RequestsPatchSession(),
+        config.http_logger_policy,
+    ]
+    if config.credentials:
+        default_policies.insert(
+            1, RequestsCredentialsPolicy(config.credentials)
+        )
+
+    config.pipeline = Pipeline(
+        default_policies + list(policies),
+        PipelineRequestsHTTPSender(_SharedSessionSender(config, session)),
+    )
+    return client
@@ -0,0 +1,11 @@
+import pytest
+
+from mcp_azure_devops.utils.cache import get_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_metadata_cache():
+    """Keep cached organization metadata from leaking between tests."""
+    get_cache().invalidate()
+    yield
+    get_cache().invalidate()
@@ -80,3 +80,20 @@ def test_get_projects_impl_with_filters():
 
     # Check result contains the filtered project
     assert "# Project: Filtered Project" in result
+
+
+def test_get_projects_impl_cached():
+    """Test that projects are cached until fresh data is requested."""
+    mock_client = MagicMock()
+    mock_project = MagicMock(spec=TeamProjectReference)
+    mock_project.name = "Project 1"
+    mock_project.id = "proj-id-1"
+    mock_client.get_projects.return_value = [mock_project]
+
+    _get_projects_impl(mock_client)
+    result = _get_projects_impl(mock_client)
+    assert mock_client.get_projects.call_count == 1
+    assert "# Project: Project 1" in result
+
+    _get_projects_impl(mock_client, fresh=True)
+    assert mock_client.get_projects.call_count == 2
@@ -0,0 +1,64 @@
+import threading
+from unittest.mock import MagicMock
+
+from azure.devops.v7_1.work_item_tracking.models import WorkItem
+
+from mcp_azure_devops.features.work_items.batch import (
+    MAX_BATCH_SIZE,
+    get_work_items_batched,
+)
+from mcp_azure_devops.features.work_items.tools.read import _get_work_item_impl
+
+
+def _client(missing=()):
+    """A client returning a work item for every ID except the missing."""
+    client = MagicMock()
+    requested = []
+    lock = threading.Lock()
+
+    def get_work_items(ids, error_policy=None, **kwargs):
+        assert len(ids) <= MAX_BATCH_SIZE
+        assert error_policy == "omit"
+        with lock:
+            requested.append(list(ids))
+        return [
+            None if i in missing else WorkItem(id=i, fields={}) for i in ids
+        ]
+
+    client.get_work_items.side_effect = get_work_items
+    client.requested = requested
+    return client
+
+
+def test_batches_are_split_and_reassembled_in_order():
+    ids = list(range(450, 0, -1))
+    client = _client(missing={7, 300})
+
+    work_items, omitted = get_work_items_batched(client, ids, expand="all")
+
+    assert [len(chunk) for chunk in client.requested] == [200, 200, 50]
+    assert [item.id for item in work_items] == [
+        i for i in ids if i not in (7, 300)
+    ]
+    assert omitted == [300, 7]
+    assert client.get_work_items.call_args.kwargs["expand"] == "all"
+
+
+def test_duplicate_ids_are_fetched_once():
+    client = _client()
+
+    work_items, omitted = get_work_items_batched(client, [3, 1, 3, 2, 1])
+
+    assert client.requested == [[3, 1, 2]]
+    assert [item.id for item in work_items] == [3, 1, 2]
+    assert omitted == []
+
+
+def test_get_work_item_impl_reports_omitted_ids():
+    client = _client(missing={2})
+
+    result = _get_work_item_impl([1, 2, 3], client)
+
+    assert "# Work Item 1" in result
+    assert "# Work Item 3" in result
+    assert "Work items not found or not accessible: 2" in result
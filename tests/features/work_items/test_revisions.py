@@ -0,0 +1,155 @@
+import threading
+from unittest.mock import MagicMock
+
+from azure.devops.v7_1.work_item_tracking.models import WorkItem
+
+from mcp_azure_devops.features.work_items.revisions import (
+    REVISION_FIELD,
+    get_work_item_cached,
+    get_work_items_cached,
+)
+from mcp_azure_devops.features.work_items.tools.create import (
+    _update_work_item_impl,
+)
+from mcp_azure_devops.features.work_items.tools.read import _get_work_item_impl
+from mcp_azure_devops.utils.cache import configure_cache
+
+
+def _work_item(item_id, rev, fields=None):
+    return WorkItem(
+        id=item_id,
+        rev=rev,
+        fields={"System.Rev": rev, "System.Title": f"Item {item_id}"}
+        if fields is None
+        else fields,
+    )
+
+
+def _client(revs):
+    """A client serving work items at the revisions in revs."""
+    client = MagicMock()
+    client.normalized_url = "https://dev.azure.com/org"
+    client.calls = []
+    lock = threading.Lock()
+
+    def serve(item_id, fields):
+        if fields == [REVISION_FIELD]:
+            return _work_item(item_id, revs[item_id], {})
+        return _work_item(item_id, revs[item_id])
+
+    def get_work_item(id, fields=None, **kwargs):
+        with lock:
+            client.calls.append(("get", [id], fields))
+        return serve(id, fields)
+
+    def get_work_items(ids, fields=None, error_policy=None, **kwargs):
+        with lock:
+            client.calls.append(("batch", list(ids), fields))
+        return [serve(i, fields) if i in revs else None for i in ids]
+
+    def update_work_item(document, id, project=None, expand=None):
+        revs[id] += 1
+        return _work_item(id, revs[id])
+
+    client.get_work_item.side_effect = get_work_item
+    client.get_work_items.side_effect = get_work_items
+    client.update_work_item.side_effect = update_work_item
+    return client
+
+
+def test_cold_read_skips_the_revision_check():
+    client = _client({1: 3})
+
+    work_item = get_work_item_cached(client, 1, expand="all")
+
+    assert work_item.rev == 3
+    assert client.calls == [("get", [1], None)]
+
+
+def test_unchanged_work_item_is_served_from_the_cache():
+    client = _client({1: 3})
+    first = get_work_item_cached(client, 1, expand="all")
+
+    second = get_work_item_cached(client, 1, expand="all")
+
+    assert second is first
+    assert client.calls[1:] == [("get", [1], [REVISION_FIELD])]
+
+
+def test_new_revision_is_fetched_in_full():
+    revs = {1: 3}
+    client = _client(revs)
+    get_work_item_cached(client, 1, expand="all")
+    revs[1] = 4
+
+    work_item = get_work_item_cached(client, 1, expand="all")
+
+    assert work_item.rev == 4
+    assert client.calls[1:] == [
+        ("get", [1], [REVISION_FIELD]),
+        ("get", [1], None),
+    ]
+
+
+def test_forms_are_cached_separately():
+    client = _client({1: 3})
+    get_work_item_cached(client, 1, expand="all")
+
+    get_work_item_cached(client, 1, fields=["System.Title"])
+
+    assert client.calls[1:] == [("get", [1], ["System.Title"])]
+
+
+def test_batch_only_fetches_stale_work_items():
+    revs = {1: 3, 2: 5, 3: 1}
+    client = _client(revs)
+    get_work_items_cached(client, [1, 2, 3], expand="all")
+    revs[2] = 6
+    del revs[3]
+
+    work_items, omitted = get_work_items_cached(
+        client, [4, 3, 2, 1], expand="all"
+    )
+
+    assert client.calls[1:] == [
+        ("batch", [3, 2, 1], [REVISION_FIELD]),
+        ("batch", [4, 2], None),
+    ]
+    assert [(item.id, item.rev) for item in work_items] == [(2, 6), (1, 3)]
+    assert omitted == [4, 3]
+
+
+def test_updates_are_cached_write_through():
+    client = _client({1: 3})
+    _update_work_item_impl(1, {"System.Title": "Renamed"}, client)
+
+    result = _get_work_item_impl(1, client)
+
+    assert "# Work Item 1" in result
+    assert client.calls == [("get", [1], [REVISION_FIELD])]
+
+
+def test_disabled_cache_always_fetches():
+    configure_cache(enabled=False)
+    try:
+        client = _client({1: 3})
+        get_work_item_cached(client, 1, expand="all")
+        get_work_item_cached(client, 1, expand="all")
+    finally:
+        configure_cache()
+
+    assert client.calls == [("get", [1], None), ("get", [1], None)]
+
+
+def test_sqlite_cache_keeps_work_items(tmp_path):
+    configure_cache(backend="sqlite", path=str(tmp_path / "cache.sqlite3"))
+    try:
+        client = _client({1: 3})
+        get_work_item_cached(client, 1, expand="all")
+
+        work_item = get_work_item_cached(client, 1, expand="all")
+    finally:
+        configure_cache()
+
+    assert (work_item.fields or {})["System.Title"] == "Item 1"
+    assert client.calls[1:] == [("get", [1], [REVISION_FIELD])]
@@ -1,7 +1,10 @@
+import re
 from unittest.mock import MagicMock
 
 from azure.devops.v7_1.work_item_tracking.models import (
     WorkItem,
+    WorkItemFieldReference,
+    WorkItemQueryResult,
     WorkItemReference,
 )
 
@@ -9,9 +12,11 @@ from mcp_azure_devops.features.work_items.tools.comments import (
     _get_work_item_comments_impl,
 )
 from mcp_azure_devops.features.work_items.tools.query import (
+    _get_query_page_impl,
     _query_work_items_impl,
 )
 from mcp_azure_devops.features.work_items.tools.read import _get_work_item_impl
+from mcp_azure_devops.utils.cache import configure_cache
 
 
 # Tests for _query_work_items_impl
@@ -75,6 +80,152 @@ def test_query_work_items_impl_with_results():
     assert "- **System.State**: Closed" in result
 
 
+def _query_client(columns):
+    """A client whose query returns work items 1 and 2."""
+    mock_client = MagicMock()
+    mock_client.query_by_wiql.return_value = WorkItemQueryResult(
+        as_of="2024-01-02T10:00:00Z",
+        columns=[WorkItemFieldReference(reference_name=c) for c in columns],
+        work_items=[WorkItemReference(id=1), WorkItemReference(id=2)],
+    )
+    mock_client.get_work_items.return_value = [
+        WorkItem(
+            id=i,
+            fields={"System.Title": f"Item {i}", "System.State": "Active"},
+        )
+        for i in (1, 2)
+    ]
+    return mock_client
+
+
+def test_query_work_items_impl_fetches_selected_fields():
+    """Test that only the SELECT list is fetched, as of the query time."""
+    mock_client = _query_client(["System.Id", "System.Title"])
+
+    _query_work_items_impl(
+        "SELECT [System.Id], [System.Title] FROM WorkItems", 10, mock_client
+    )
+
+    kwargs = mock_client.get_work_items.call_args.kwargs
+    assert kwargs["fields"] == ["System.Id", "System.Title"]
+    assert kwargs["as_of"] == "2024-01-02T10:00:00Z"
+    assert "expand" not in kwargs
+
+
+def test_query_work_items_impl_notes_capped_results():
+    """Test that a query stopped at the result cap says how to read on."""
+    mock_client = _query_client(["System.Title"])
+    mock_client.query_by_wiql.return_value.work_items = [
+        WorkItemReference(id=i) for i in range(1, 20001)
+    ]
+
+    result = _query_work_items_impl(
+        "SELECT [System.Title] FROM WorkItems", 2, mock_client
+    )
+
+    assert "all_results=true" in result
+    mock_client.query_by_wiql.assert_called_once()
+
+
+def test_query_work_items_impl_explicit_fields():
+    """Test that explicit fields replace the SELECT list."""
+    mock_client = _query_client(["System.Id"])
+
+    _query_work_items_impl(
+        "SELECT [System.Id] FROM WorkItems",
+        10,
+        mock_client,
+        fields=["System.State"],
+    )
+
+    assert mock_client.get_work_items.call_args.kwargs["fields"] == [
+        "System.State"
+    ]
+
+
+def test_query_work_items_impl_relations_on_demand():
+    """Test that relations are expanded only when asked for."""
+    mock_client = _query_client(["System.Title"])
+
+    result = _query_work_items_impl(
+        "SELECT [System.Title] FROM WorkItems",
+        10,
+        mock_client,
+        include_relations=True,
+    )
+
+    kwargs = mock_client.get_work_items.call_args.kwargs
+    assert kwargs["expand"] == "relations"
+    assert "fields" not in kwargs
+    # Fields outside the SELECT list are not shown
+    assert "System.Title" in result
+    assert "System.State" not in result
+
+
+def _paged_client(count):
+    """A client whose query matches work items 1 to count."""
+    mock_client = MagicMock()
+    mock_client.cache_scope = "https://dev.azure.com/org#pat"
+    mock_client.query_by_wiql.return_value = WorkItemQueryResult(
+        as_of="2024-01-02T10:00:00Z",
+        columns=[WorkItemFieldReference(reference_name="System.Title")],
+        work_items=[WorkItemReference(id=i) for i in range(1, count + 1)],
+    )
+    mock_client.get_work_items.side_effect = lambda ids, **kwargs: [
+        WorkItem(id=i, fields={"System.Title": f"Item {i}"}) for i in ids
+    ]
+    return mock_client
+
+
+def _cursor(result):
+    match = re.search(r'cursor "([^"]+)"', result)
+    assert match, f"no cursor in {result!r}"
+    return match.group(1)
+
+
+def test_query_work_items_pages_through_results():
+    """Test that later pages come from the cursor, not a new query."""
+    mock_client = _paged_client(5)
+
+    first = _query_work_items_impl(
+        "SELECT [System.Title] FROM WorkItems", 2, mock_client
+    )
+    second = _get_query_page_impl(_cursor(first), 2, mock_client)
+    last = _get_query_page_impl(_cursor(second), 2, mock_client)
+
+    assert "# Work Item 2" in first and "# Work Item 3" not in first
+    assert "Showing work items 1-2 of 5" in first
+    assert "# Work Item 3" in second and "# Work Item 4" in second
+    assert "# Work Item 5" in last and "cursor" not in last
+    mock_client.query_by_wiql.assert_called_once()
+    # Later pages keep the fields of the query
+    assert mock_client.get_work_items.call_args.kwargs["fields"] == [
+        "System.Title"
+    ]
+
+
+def test_get_query_page_unknown_cursor():
+    """Test that an expired or foreign cursor is reported."""
+    mock_client = _paged_client(5)
+
+    assert "expired" in _get_query_page_impl("nope:2", 2, mock_client)
+    assert "Invalid cursor" in _get_query_page_impl("nope", 2, mock_client)
+
+
+def test_query_work_items_without_cache_cannot_page():
+    """Test that no cursor is offered when it could not be kept."""
+    configure_cache(enabled=False)
+    try:
+        result = _query_work_items_impl(
+            "SELECT [System.Title] FROM WorkItems", 2, _paged_client(5)
+        )
+    finally:
+        configure_cache()
+
+    assert "cursor" not in result
+    assert "Raise top to see more." in result
+
+
 # Tests for _get_work_item_impl
 def test_get_work_item_impl_basic():
     """Test retrieving basic work item info."""
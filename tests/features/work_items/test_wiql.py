@@ -0,0 +1,163 @@
+import re
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from azure.devops.exceptions import AzureDevOpsServiceError
+from azure.devops.v7_1.work_item_tracking.models import (
+    WorkItemQueryResult,
+    WorkItemReference,
+)
+
+from mcp_azure_devops.features.work_items.wiql import (
+    MAX_QUERY_RESULTS,
+    query_work_item_ids,
+    restrict_query,
+)
+from mcp_azure_devops.utils.exceptions import AzureDevOpsClientError
+
+AS_OF = datetime(2024, 1, 2, 10, 0, tzinfo=timezone.utc)
+WINDOW = re.compile(r"\[System.Id\] >= (\d+) AND \[System.Id\] < (\d+)")
+
+
+def _oversize():
+    return AzureDevOpsServiceError(
+        SimpleNamespace(
+            message="VS402337: The number of work items returned exceeds "
+            "the size limit of 20000.",
+            inner_exception=None,
+            exception_id=None,
+            type_name=None,
+            type_key=None,
+            error_code=None,
+            event_id=None,
+            custom_properties=None,
+        )
+    )
+
+
+def _client(matching):
+    """A client over an organization where the given IDs match."""
+    client = MagicMock()
+    queries = []
+
+    def query_by_wiql(wiql, top=None):
+        queries.append(wiql.query)
+        if "DESC" in wiql.query and top == 1:
+            return WorkItemQueryResult(
+                as_of=AS_OF, work_items=[WorkItemReference(id=max(matching))]
+            )
+        window = WINDOW.search(wiql.query)
+        low, high = map(int, window.groups()) if window else (0, 10**9)
+        ids = [i for i in matching if low <= i < high]
+        if len(ids) > MAX_QUERY_RESULTS:
+            raise _oversize()
+        return WorkItemQueryResult(
+            as_of=AS_OF, work_items=[WorkItemReference(id=i) for i in ids]
+        )
+
+    client.query_by_wiql.side_effect = query_by_wiql
+    client.queries = queries
+    return client
+
+
+def test_restrict_query_adds_condition_before_order_by():
+    query = (
+        "SELECT [System.Id] FROM WorkItems WHERE [System.State] = 'Active' "
+        "OR [System.State] = 'New' ORDER BY [System.ChangedDate] DESC"
+    )
+
+    assert restrict_query(query, "[System.Id] < 10", AS_OF) == (
+        "SELECT [System.Id] FROM WorkItems WHERE ([System.State] = 'Active' "
+        "OR [System.State] = 'New') AND [System.Id] < 10 "
+        "ORDER BY [System.ChangedDate] DESC "
+        "ASOF '2024-01-02T10:00:00+00:00'"
+    )
+
+
+def test_restrict_query_without_where_keeps_asof():
+    query = "SELECT [System.Id] FROM WorkItems ASOF '2023-01-01'"
+
+    assert restrict_query(query, "[System.Id] < 10", AS_OF) == (
+        "SELECT [System.Id] FROM WorkItems WHERE [System.Id] < 10 "
+        "ASOF '2023-01-01'"
+    )
+
+
+def test_restrict_query_skips_field_names_and_literals():
+    query = (
+        "SELECT [System.Id] FROM WorkItems WHERE [Custom.Mode] = 'Dark mode' "
+        "AND [System.Title] CONTAINS 'where to order by, it''s asof' "
+        "ORDER BY [Custom.Order By]"
+    )
+
+    assert restrict_query(query, "[System.Id] < 10", AS_OF) == (
+        "SELECT [System.Id] FROM WorkItems WHERE ([Custom.Mode] = 'Dark mode' "
+        "AND [System.Title] CONTAINS 'where to order by, it''s asof') "
+        "AND [System.Id] < 10 ORDER BY [Custom.Order By] "
+        "ASOF '2024-01-02T10:00:00+00:00'"
+    )
+
+
+def test_restrict_query_skips_keywords_in_field_names():
+    query = "SELECT [Custom.Where], [Custom.Asof] FROM WorkItems"
+
+    assert restrict_query(query, "[System.Id] < 10", AS_OF) == (
+        "SELECT [Custom.Where], [Custom.Asof] FROM WorkItems "
+        "WHERE [System.Id] < 10 ASOF '2024-01-02T10:00:00+00:00'"
+    )
+
+
+def test_small_queries_run_once():
+    client = _client(range(1, 100))
+
+    result = query_work_item_ids(client, "SELECT [System.Id] FROM WorkItems")
+
+    assert len(result.work_items or []) == 99
+    assert len(client.queries) == 1
+
+
+@pytest.mark.parametrize("matching", [range(2, 90001, 2), range(1, 20001)])
+def test_oversize_queries_are_partitioned(matching):
+    client = _client(matching)
+
+    result = query_work_item_ids(
+        client, "SELECT [System.Id] FROM WorkItems", partition=True
+    )
+
+    assert [int(ref.id) for ref in result.work_items or []] == list(matching)
+    assert result.as_of == AS_OF
+    windows = [q for q in client.queries if WINDOW.search(q)]
+    assert windows
+    assert all("ASOF '2024-01-02T10:00:00+00:00'" in q for q in windows)
+
+
+def test_queries_are_only_partitioned_when_asked():
+    client = _client(range(1, 90001))
+
+    with pytest.raises(AzureDevOpsClientError, match="20,000"):
+        query_work_item_ids(client, "SELECT [System.Id] FROM WorkItems")
+    assert len(client.queries) == 1
+
+
+def test_capped_queries_are_returned_as_is():
+    client = _client(range(1, 20001))
+
+    result = query_work_item_ids(client, "SELECT [System.Id] FROM WorkItems")
+
+    assert len(result.work_items or []) == MAX_QUERY_RESULTS
+    assert len(client.queries) == 1
+
+
+def test_link_queries_are_not_partitioned():
+    client = MagicMock()
+    client.query_by_wiql.side_effect = _oversize()
+
+    with pytest.raises(AzureDevOpsServiceError):
+        query_work_item_ids(
+            client,
+            "SELECT [System.Id] FROM WorkItemLinks MODE (Recursive)",
+            partition=True,
+        )
+    client.query_by_wiql.assert_called_once()
@@ -0,0 +1,43 @@
+"""
+Smoke test for the benchmark suite.
+
+Runs every benchmark case a couple of times against the fake Azure DevOps
+server, which checks that the fake still answers everything the tools ask
+for.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_benchmarks_run_against_fake_server(tmp_path):
+    results_file = tmp_path / "results.json"
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.run",
+            "--iterations",
+            "2",
+            "--warmup",
+            "0",
+            "--json",
+            str(results_file),
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert result.returncode == 0, result.stderr
+    results = json.loads(results_file.read_text())
+    assert "query_work_items" in results
+    assert all(case["errors"] == 0 for case in results.values())
+    # A WIQL query is one query plus one batched fetch
+    assert results["query_work_items"]["requests_per_call"] <= 2
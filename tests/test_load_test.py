@@ -0,0 +1,62 @@
+"""
+Smoke test for the load test harness.
+
+Starts the server against the fake Azure DevOps server, over stdio and over
+streamable HTTP, and replays a short mixed workload.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _run_load_test(tmp_path, *options):
+    summary_file = tmp_path / "summary.json"
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.load_test",
+            *options,
+            "--sessions",
+            "2",
+            "--concurrency",
+            "2",
+            "--requests",
+            "30",
+            "--latency",
+            "0",
+            "--json",
+            str(summary_file),
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    return json.loads(summary_file.read_text())
+
+
+def test_load_test_drives_stdio_servers(tmp_path):
+    summary = _run_load_test(tmp_path)
+
+    assert summary["calls"] == 30
+    assert summary["errors"] == 0
+    assert summary["throughput"] > 0
+    if sys.platform.startswith("linux"):
+        assert summary["memory"]["processes"] == 2
+
+
+def test_load_test_drives_an_http_server(tmp_path):
+    summary = _run_load_test(tmp_path, "--transport", "http")
+
+    assert summary["calls"] == 30
+    assert summary["errors"] == 0
+    if sys.platform.startswith("linux"):
+        assert summary["memory"]["processes"] >= 1
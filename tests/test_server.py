@@ -2,12 +2,33 @@
 Tests for the Azure DevOps MCP Server.
 """
 
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
 import pytest
+from mcp.client.session import ClientSession
+from mcp.client.streamable_http import streamablehttp_client
+from mcp.server.fastmcp import FastMCP
 from mcp.shared.memory import (
     create_connected_server_and_client_session as client_session,
 )
+from starlette.testclient import TestClient
 
-from mcp_azure_devops.server import mcp
+from mcp_azure_devops.server import (
+    AzureDevOpsMCP,
+    _build_parser,
+    _configure,
+    _resolve_transport,
+    create_server,
+    mcp,
+)
+from mcp_azure_devops.utils import metrics
+from mcp_azure_devops.utils.cache import configure_cache
+from mcp_azure_devops.utils.instrumentation import TOOL_CALLS, TOOL_DURATION
 
 
 # Mark all tests with anyio for async testing
@@ -32,3 +53,325 @@ async def test_server_initialization():
         assert capabilities.prompts is not None
         assert capabilities.resources is not None
         assert capabilities.tools is not None
+
+
+@pytest.mark.anyio
+async def test_tools_run_on_worker_pool():
+    """Test that blocking tools are registered as async wrappers."""
+    tools = mcp._tool_manager.list_tools()
+
+    assert tools
+    assert all(tool.is_async for tool in tools)
+
+    # Schemas still come from the original tool signatures
+    get_work_item = mcp._tool_manager.get_tool("get_work_item")
+    assert get_work_item is not None
+    assert "id" in get_work_item.parameters["properties"]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_tool_calls_are_instrumented(monkeypatch):
+    """Test that tool latency and outcome are recorded."""
+    monkeypatch.delenv("AZURE_DEVOPS_PAT", raising=False)
+    metrics.reset()
+
+    await mcp.call_tool("get_projects", {})
+
+    assert (
+        metrics.get_value(TOOL_CALLS, tool="get_projects", outcome="error")
+        == 1
+    )
+    count, _ = metrics.get_histogram(TOOL_DURATION, tool="get_projects")
+    assert count == 1
+
+
+def test_create_server_registers_selected_features():
+    """Test that only the selected feature groups are registered."""
+    server = create_server(features=["work_items"])
+    names = {tool.name for tool in server._tool_manager.list_tools()}
+
+    assert "get_work_item" in names
+    assert "get_projects" not in names
+    assert "get_pull_requests" not in names
+
+
+def test_create_server_disables_features_and_tools(monkeypatch):
+    """Test that features and tools can be left out through the env."""
+    monkeypatch.setenv("AZURE_DEVOPS_DISABLED_FEATURES", "git,wiki")
+    monkeypatch.setenv(
+        "AZURE_DEVOPS_DISABLED_TOOLS", "create_work_item,update_work_item"
+    )
+
+    server = create_server()
+    names = {tool.name for tool in server._tool_manager.list_tools()}
+
+    assert "get_projects" in names
+    assert "get_work_item" in names
+    assert "create_work_item" not in names
+    assert "update_work_item" not in names
+    assert "search_wiki" not in names
+    assert "get_pull_requests" not in names
+
+
+def test_add_tool_passes_other_arguments_through(monkeypatch):
+    """Test that arguments of newer mcp releases reach FastMCP."""
+    received = {}
+
+    def add_tool(self, fn, name=None, *args, **kwargs):
+        received.update(kwargs, name=name)
+
+    monkeypatch.setattr(FastMCP, "add_tool", add_tool)
+
+    def get_answer() -> str:
+        return "42"
+
+    AzureDevOpsMCP("test").add_tool(
+        get_answer, "get_answer", title="Answer", structured_output=False
+    )
+
+    assert received == {
+        "name": "get_answer",
+        "title": "Answer",
+        "structured_output": False,
+    }
+
+
+def test_create_server_rejects_unknown_feature():
+    """Test that a misspelled feature group is reported."""
+    with pytest.raises(ValueError, match="Unknown feature: pipelines"):
+        create_server(features=["work_items", "pipelines"])
+
+
+def test_http_app_serves_health_and_metrics():
+    """Test that health checks and metrics are served over HTTP."""
+    metrics.reset()
+    metrics.increment(TOOL_CALLS, tool="get_projects", outcome="success")
+    app = create_server(features=["projects"]).streamable_http_app()
+
+    with TestClient(app) as client:
+        health = client.get("/healthz")
+        scraped = client.get("/metrics")
+
+    assert health.status_code == 200
+    assert health.json() == {"status": "ok"}
+    assert scraped.status_code == 200
+    assert TOOL_CALLS in scraped.text
+
+
+def test_metrics_not_served_by_one_of_several_workers():
+    """Test that a worker does not pass its own counters off as the total."""
+    server = create_server(features=["projects"])
+    server.serves_metrics = False
+
+    with TestClient(server.streamable_http_app()) as client:
+        scraped = client.get("/metrics")
+
+    assert scraped.status_code == 404
+
+
+def test_transport_options_come_from_env(monkeypatch):
+    """Test that transport options fall back to the environment."""
+    monkeypatch.setenv("AZURE_DEVOPS_TRANSPORT", "streamable-http")
+    monkeypatch.setenv("AZURE_DEVOPS_PORT", "9000")
+    monkeypatch.setenv("AZURE_DEVOPS_WORKERS", "3")
+    monkeypatch.delenv("AZURE_DEVOPS_METRICS_PORT", raising=False)
+    parser = _build_parser()
+    args = parser.parse_args(["--host", "0.0.0.0"])
+
+    _resolve_transport(parser, args)
+
+    assert args.transport == "streamable-http"
+    assert (args.host, args.port, args.workers) == ("0.0.0.0", 9000, 3)
+
+
+def test_invalid_metrics_port_is_reported(monkeypatch, capsys):
+    """Test that a non-numeric metrics port is a usage error."""
+    monkeypatch.setenv("AZURE_DEVOPS_METRICS_PORT", "metrics")
+    parser = _build_parser()
+    args = parser.parse_args([])
+
+    with pytest.raises(SystemExit):
+        _resolve_transport(parser, args)
+
+    assert "AZURE_DEVOPS_METRICS_PORT" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--workers", "2"],
+        ["--transport", "sse", "--workers", "2"],
+        ["--transport", "streamable-http", "--workers", "0"],
+        [
+            "--transport",
+            "streamable-http",
+            "--workers",
+            "2",
+            "--metrics-port",
+            "9100",
+        ],
+        [
+            "--transport",
+            "streamable-http",
+            "--workers",
+            "2",
+            "--cache-backend",
+            "memory",
+        ],
+    ],
+)
+def test_workers_need_a_shareable_transport(monkeypatch, argv):
+    """Test that worker setups that cannot work are rejected."""
+    for name in (
+        "AZURE_DEVOPS_TRANSPORT",
+        "AZURE_DEVOPS_METRICS_PORT",
+        "AZURE_DEVOPS_CACHE_BACKEND",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    with pytest.raises(SystemExit):
+        _resolve_transport(parser, args)
+
+
+def test_workers_share_the_sqlite_cache(monkeypatch):
+    """Test that workers page query cursors through a shared cache."""
+    monkeypatch.delenv("AZURE_DEVOPS_CACHE_BACKEND", raising=False)
+    parser = _build_parser()
+    args = parser.parse_args(
+        ["--transport", "streamable-http", "--workers", "2"]
+    )
+
+    _resolve_transport(parser, args)
+
+    assert args.cache_backend == "sqlite"
+
+
+@pytest.mark.parametrize(
+    "argv, env",
+    [
+        (["--max-workers", "0"], {}),
+        ([], {"AZURE_DEVOPS_MAX_WORKERS": "0"}),
+        ([], {"AZURE_DEVOPS_MAX_WORKERS": "many"}),
+    ],
+)
+def test_invalid_worker_pool_size_is_reported(monkeypatch, capsys, argv, env):
+    """Test that a bad worker pool size is a usage error."""
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    parser = _build_parser()
+    args = parser.parse_args(argv + ["--features", "projects"])
+
+    with pytest.raises(SystemExit):
+        _configure(parser, args)
+
+    err = capsys.readouterr().err
+    assert "--max-workers" in err or "AZURE_DEVOPS_MAX_WORKERS" in err
+
+
+@pytest.mark.parametrize("value", ["0", "many"])
+def test_invalid_connection_pool_size_is_reported(monkeypatch, capsys, value):
+    """Test that a bad connection pool size is a usage error."""
+    monkeypatch.setenv("AZURE_DEVOPS_MAX_CONNECTIONS", value)
+    parser = _build_parser()
+    args = parser.parse_args(["--features", "projects"])
+
+    with pytest.raises(SystemExit):
+        _configure(parser, args)
+
+    assert "AZURE_DEVOPS_MAX_CONNECTIONS" in capsys.readouterr().err
+
+
+def test_invalid_location_cache_ttl_is_reported(monkeypatch, capsys):
+    """Test that a non-numeric location cache TTL is a usage error."""
+    monkeypatch.setenv("AZURE_DEVOPS_LOCATION_CACHE_TTL", "daily")
+    parser = _build_parser()
+    args = parser.parse_args(["--features", "projects"])
+
+    with pytest.raises(SystemExit):
+        _configure(parser, args)
+
+    assert "AZURE_DEVOPS_LOCATION_CACHE_TTL" in capsys.readouterr().err
+
+
+def test_unusable_cache_path_is_reported(tmp_path, capsys):
+    """Test that a cache file that cannot be created is a usage error."""
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    parser = _build_parser()
+    args = parser.parse_args(
+        [
+            "--features",
+            "projects",
+            "--cache-backend",
+            "sqlite",
+            "--cache-path",
+            str(blocker / "cache.sqlite3"),
+        ]
+    )
+
+    try:
+        with pytest.raises(SystemExit):
+            _configure(parser, args)
+    finally:
+        configure_cache()
+
+    assert "cannot use the cache" in capsys.readouterr().err
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_workers_share_one_port(tmp_path):
+    """Test that several worker processes serve MCP on one port."""
+    port = _free_port()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "mcp_azure_devops.server",
+            "--transport",
+            "streamable-http",
+            "--port",
+            str(port),
+            "--workers",
+            "2",
+            "--features",
+            "projects",
+        ],
+        env={
+            **os.environ,
+            "AZURE_DEVOPS_METRICS_PORT": "",
+            "AZURE_DEVOPS_CACHE_DIR": str(tmp_path),
+        },
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                urllib.request.urlopen(f"http://127.0.0.1:{port}/healthz")
+                break
+            except OSError:
+                assert server.poll() is None, "server exited"
+                assert time.monotonic() < deadline, "server did not start"
+                time.sleep(0.1)
+
+        url = f"http://127.0.0.1:{port}/mcp"
+        async with streamablehttp_client(url) as (read, write, _):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                tools = await session.list_tools()
+
+        assert "get_projects" in {tool.name for tool in tools.tools}
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
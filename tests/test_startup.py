@@ -0,0 +1,83 @@
+"""
+Tests for server startup cost.
+
+MCP clients start the stdio server at the beginning of every session, so
+importing the server must not load the Azure DevOps SDK or its HTTP stack.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+# Seconds allowed for importing the server on top of the MCP package. A
+# cold import currently takes well under half of this.
+STARTUP_BUDGET = 0.5
+
+# Loaded with the first connection, never at startup
+DEFERRED_PACKAGES = ("azure.devops.v7_1", "msrest", "requests")
+
+PROBE = """
+import json, sys, time
+import mcp.server.fastmcp
+start = time.perf_counter()
+from mcp_azure_devops.server import mcp
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "elapsed": elapsed,
+    "modules": sorted(sys.modules),
+    "tools": {
+        tool.name: tool.parameters
+        for tool in mcp._tool_manager.list_tools()
+    },
+}))
+"""
+
+
+def _probe_startup(**env) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, **env},
+    )
+    return json.loads(result.stdout)
+
+
+def test_startup_defers_sdk_imports():
+    startup = _probe_startup()
+
+    loaded = [
+        module
+        for module in startup["modules"]
+        if module.startswith(DEFERRED_PACKAGES)
+    ]
+    assert loaded == []
+
+
+def test_startup_registers_tool_schemas():
+    tools = _probe_startup()["tools"]
+
+    assert "query_work_items" in tools
+    assert "get_pull_requests" in tools
+    assert "query" in tools["query_work_items"]["properties"]
+
+
+def test_startup_within_budget():
+    # Best of a few runs, so a busy machine does not fail the test
+    elapsed = min(_probe_startup()["elapsed"] for _ in range(3))
+
+    assert elapsed < STARTUP_BUDGET
+
+
+def test_startup_imports_only_selected_features():
+    startup = _probe_startup(AZURE_DEVOPS_FEATURES="work_items")
+
+    features = {
+        module.split(".")[2]
+        for module in startup["modules"]
+        if module.startswith("mcp_azure_devops.features.")
+    }
+    assert features == {"work_items"}
+    assert "get_pull_requests" not in startup["tools"]
@@ -0,0 +1,3 @@
+"""
+Tests for shared Azure DevOps utilities.
+"""
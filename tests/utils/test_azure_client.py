@@ -0,0 +1,263 @@
+import gc
+import json
+import os
+import weakref
+from unittest.mock import patch
+
+import pytest
+from azure.devops import _file_cache
+
+from mcp_azure_devops.utils import azure_client
+from mcp_azure_devops.utils.azure_client import (
+    configure_connection_pool,
+    get_connection,
+    get_credentials,
+    invalidate_connections,
+    preload_location_cache,
+)
+from mcp_azure_devops.utils.cache import cache_scope
+from mcp_azure_devops.utils.credentials import use_credentials
+from mcp_azure_devops.utils.exceptions import AzureDevOpsClientError
+from mcp_azure_devops.utils.pooled_connection import PooledConnection
+
+ORG_URL = "https://dev.azure.com/test-org"
+
+
+@pytest.fixture(autouse=True)
+def _clear_connections():
+    invalidate_connections()
+    yield
+    invalidate_connections()
+    configure_connection_pool()
+
+
+def _credentials(pat, organization_url=ORG_URL):
+    return patch.object(
+        azure_client,
+        "get_credentials",
+        return_value=(pat, organization_url),
+    )
+
+
+def test_get_connection_is_pooled():
+    """Test that repeated calls share one connection."""
+    with _credentials("pat-1"):
+        first = get_connection()
+        second = get_connection()
+
+    assert first is second
+    assert first.base_url == ORG_URL
+
+
+def test_get_connection_ignores_trailing_slash():
+    """Test that the organization URL is normalized for pooling."""
+    with _credentials("pat-1"):
+        first = get_connection()
+    with _credentials("pat-1", ORG_URL + "/"):
+        second = get_connection()
+
+    assert first is second
+
+
+def test_get_connection_replaced_when_pat_rotates():
+    """Test that a new PAT for the same organization gets a new connection."""
+    with _credentials("pat-1"):
+        old = get_connection()
+    with _credentials("pat-2"):
+        new = get_connection()
+
+    assert old is not new
+    assert len(azure_client._connections) == 1
+
+
+def test_invalidate_connections():
+    """Test that invalidation drops pooled connections."""
+    with _credentials("pat-1"):
+        old = get_connection()
+        invalidate_connections(ORG_URL)
+        new = get_connection()
+
+    assert old is not new
+
+
+def test_get_connection_caches_clients():
+    """Test that SDK clients are created once per connection."""
+    with _credentials("pat-1"):
+        connection = get_connection()
+
+    with patch.object(
+        connection, "_get_client_instance", return_value=object()
+    ) as mock_create:
+        first = connection.clients.get_git_client()
+        second = connection.clients.get_git_client()
+
+    assert first is second
+    mock_create.assert_called_once()
+
+
+def test_clients_share_connection_session():
+    """Test that clients of a connection use its pooled HTTP session."""
+    with _credentials("pat-1"):
+        connection = get_connection()
+    assert isinstance(connection, PooledConnection)
+
+    with patch.object(
+        connection, "_get_url_for_client_instance", return_value=ORG_URL
+    ):
+        git_client = connection.clients.get_git_client()
+        core_client = connection.clients.get_core_client()
+
+    for client in (git_client, core_client):
+        sender = client.config.pipeline._sender.driver
+        assert sender.session is connection.session
+
+
+def test_get_connection_missing_credentials():
+    """Test that missing credentials raise a client error."""
+    with _credentials(None):
+        with pytest.raises(AzureDevOpsClientError):
+            get_connection()
+
+
+def test_request_credentials_take_precedence(monkeypatch):
+    """Test that a client's credentials replace the server's own."""
+    monkeypatch.setenv("AZURE_DEVOPS_PAT", "server-pat")
+    monkeypatch.setenv("AZURE_DEVOPS_ORGANIZATION_URL", ORG_URL)
+
+    with use_credentials("client-pat"):
+        assert get_credentials() == ("client-pat", ORG_URL)
+    with use_credentials("client-pat", "https://dev.azure.com/other"):
+        assert get_credentials() == (
+            "client-pat",
+            "https://dev.azure.com/other",
+        )
+    assert get_credentials() == ("server-pat", ORG_URL)
+
+
+def test_tenants_get_separate_connections(monkeypatch):
+    """Test that clients with their own PATs do not share connections."""
+    monkeypatch.setenv("AZURE_DEVOPS_PAT", "server-pat")
+    monkeypatch.setenv("AZURE_DEVOPS_ORGANIZATION_URL", ORG_URL)
+
+    server = get_connection()
+    with use_credentials("alice-pat"):
+        alice = get_connection()
+    with use_credentials("bob-pat"):
+        bob = get_connection()
+
+    assert len({id(server), id(alice), id(bob)}) == 3
+    assert get_connection() is server
+    assert len(azure_client._connections) == 3
+
+    with (
+        patch.object(
+            alice, "_get_url_for_client_instance", return_value=ORG_URL
+        ),
+        patch.object(
+            bob, "_get_url_for_client_instance", return_value=ORG_URL
+        ),
+    ):
+        alice_client = alice.clients.get_core_client()
+        bob_client = bob.clients.get_core_client()
+    assert cache_scope(alice_client) != cache_scope(bob_client)
+
+
+def test_tenants_are_throttled_separately(monkeypatch):
+    """Test that PATs do not share rate limiters or circuit breakers."""
+    monkeypatch.setenv("AZURE_DEVOPS_ORGANIZATION_URL", ORG_URL)
+
+    with use_credentials("alice-pat"):
+        alice = get_connection()
+    with use_credentials("bob-pat"):
+        bob = get_connection()
+
+    assert alice.rate_limiter is not bob.rate_limiter
+    assert alice.circuit_breakers.get("wit") is not (
+        bob.circuit_breakers.get("wit")
+    )
+    # Metrics are public, so they name the organization but not the PAT
+    assert alice.rate_limiter.organization == ORG_URL
+    assert alice.circuit_breakers.get("wit").name == f"{ORG_URL}:wit"
+
+
+def test_evicted_connections_drop_their_limiters(monkeypatch):
+    """Test that rate limiters and circuit breakers leave with the pool."""
+    monkeypatch.setenv("AZURE_DEVOPS_ORGANIZATION_URL", ORG_URL)
+    configure_connection_pool(1)
+
+    with use_credentials("alice-pat"):
+        alice = get_connection()
+    limiter = weakref.ref(alice.rate_limiter)
+    breaker = weakref.ref(alice.circuit_breakers.get("wit"))
+    del alice
+    with use_credentials("bob-pat"):
+        get_connection()
+    gc.collect()
+
+    assert limiter() is None
+    assert breaker() is None
+
+
+def test_least_recently_used_connections_are_closed(monkeypatch):
+    """Test that the connection pool is bounded."""
+    monkeypatch.setenv("AZURE_DEVOPS_ORGANIZATION_URL", ORG_URL)
+    configure_connection_pool(2)
+
+    connections = {}
+    for pat in ("pat-1", "pat-2", "pat-1", "pat-3"):
+        with use_credentials(pat):
+            connections[pat] = get_connection()
+
+    pooled = list(azure_client._connections.values())
+    assert pooled == [connections["pat-1"], connections["pat-3"]]
+
+
+@pytest.fixture
+def resource_cache(tmp_path, monkeypatch):
+    cache = _file_cache.RESOURCE_CACHE
+    path = tmp_path / "resources.json"
+    path.write_text(
+        json.dumps(
+            {
+                ORG_URL: [
+                    {
+                        "id": "5264459e-e5e0-4bd8-b118-0985e68a4ec5",
+                        "locationUrl": "https://wit.example/test-org/",
+                        "name": "wit",
+                    }
+                ]
+            }
+        )
+    )
+    monkeypatch.setattr(cache, "file_name", str(path))
+    monkeypatch.setattr(cache, "data", {})
+    monkeypatch.setattr(cache, "initial_load_occurred", False)
+    monkeypatch.setattr(_file_cache.OPTIONS_CACHE, "load", lambda: None)
+    return path
+
+
+def test_preload_location_cache_avoids_discovery(resource_cache):
+    """Test that cached resource areas are used without a request."""
+    preload_location_cache(ttl=0)
+
+    with _credentials("pat-1"):
+        connection = get_connection()
+
+    with patch(
+        "azure.devops.v7_1.location.location_client.LocationClient"
+        ".get_resource_areas",
+        side_effect=AssertionError("discovery request made"),
+    ):
+        areas = connection._get_resource_areas()
+
+    assert [area.name for area in areas] == ["wit"]
+
+
+def test_preload_location_cache_discards_expired(resource_cache):
+    """Test that cache files older than the TTL are dropped."""
+    os.utime(resource_cache, (0, 0))
+
+    preload_location_cache(ttl=60)
+
+    assert len(_file_cache.RESOURCE_CACHE) == 0
+    assert not resource_cache.exists()
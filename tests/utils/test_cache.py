@@ -0,0 +1,241 @@
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from azure.devops.v7_1.core.models import TeamProjectReference
+
+from mcp_azure_devops.utils import metrics
+from mcp_azure_devops.utils.cache import (
+    CACHE_HITS,
+    SQLiteCache,
+    TTLCache,
+    cached,
+    configure_cache,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_entries_expire_per_category(clock):
+    """Test that each category uses its own TTL."""
+    cache = TTLCache(ttls={"projects": 10, "fields": 100}, clock=clock)
+    cache.set("projects", "a", 1)
+    cache.set("fields", "a", 2)
+
+    clock.now = 50
+
+    assert cache.get("projects", "a") is None
+    assert cache.get("fields", "a") == 2
+
+
+def test_least_recently_used_evicted(clock):
+    """Test that the oldest unused entry is evicted when full."""
+    cache = TTLCache(max_entries=2, clock=clock)
+    cache.set("teams", "a", 1)
+    cache.set("teams", "b", 2)
+    cache.get("teams", "a")
+
+    cache.set("teams", "c", 3)
+
+    assert cache.get("teams", "b") is None
+    assert cache.get("teams", "a") == 1
+    assert cache.get("teams", "c") == 3
+
+
+def test_limited_categories_evicted_on_their_own(clock):
+    """Test that many work items do not evict the metadata."""
+    cache = TTLCache(
+        max_entries=2, limits={"work_item_revisions": 2}, clock=clock
+    )
+    cache.set("projects", "list", 1)
+    for item_id in range(10):
+        cache.set("work_item_revisions", item_id, item_id)
+
+    assert cache.get("projects", "list") == 1
+    assert cache.get("work_item_revisions", 7) is None
+    assert cache.get("work_item_revisions", 9) == 9
+    assert len(cache) == 3
+
+
+def test_get_or_load_caches_and_fresh_bypasses(clock):
+    """Test that loads are cached unless fresh data is requested."""
+    cache = TTLCache(clock=clock)
+    loader = MagicMock(side_effect=[1, 2])
+
+    assert cache.get_or_load("projects", "k", loader) == 1
+    assert cache.get_or_load("projects", "k", loader) == 1
+    assert cache.get_or_load("projects", "k", loader, fresh=True) == 2
+    assert cache.get_or_load("projects", "k", loader) == 2
+    assert loader.call_count == 2
+    assert metrics.get_value(CACHE_HITS, category="projects") == 2
+
+
+def test_errors_not_cached(clock):
+    """Test that a failed load is tried again next time."""
+    cache = TTLCache(clock=clock)
+    loader = MagicMock(side_effect=[Exception("boom"), 1])
+
+    with pytest.raises(Exception):
+        cache.get_or_load("teams", "k", loader)
+    assert cache.get_or_load("teams", "k", loader) == 1
+
+
+def test_cached_scoped_by_organization():
+    """Test that clients of different organizations do not share entries."""
+    first = MagicMock(normalized_url="https://dev.azure.com/one")
+    second = MagicMock(normalized_url="https://dev.azure.com/two")
+
+    assert cached("projects", first, "list", lambda: "one") == "one"
+    assert cached("projects", second, "list", lambda: "two") == "two"
+    assert cached("projects", first, "list", lambda: "other") == "one"
+
+
+def test_disabled_cache_always_loads():
+    """Test that a disabled cache never stores values."""
+    configure_cache(enabled=False)
+    try:
+        client = MagicMock(normalized_url="https://dev.azure.com/org")
+        loader = MagicMock(return_value=1)
+
+        cached("projects", client, "list", loader)
+        cached("projects", client, "list", loader)
+
+        assert loader.call_count == 2
+    finally:
+        configure_cache()
+
+
+@pytest.fixture
+def sqlite_path(tmp_path):
+    return str(tmp_path / "cache.sqlite3")
+
+
+def test_sqlite_cache_persists_between_instances(sqlite_path):
+    """Test that a new process sees entries written by another."""
+    project = TeamProjectReference(id="p1", name="Project")
+    SQLiteCache(sqlite_path).set("projects", ("org", "list"), [project])
+
+    cached_projects = SQLiteCache(sqlite_path).get("projects", ("org", "list"))
+
+    assert cached_projects[0].name == "Project"
+
+
+def test_sqlite_cache_expiry_and_immutable(sqlite_path):
+    """Test that TTLs apply, but immutable objects never expire."""
+    now = [1000.0]
+    cache = SQLiteCache(sqlite_path, clock=lambda: now[0])
+    cache.set("teams", "a", 1)
+    cache.set("work_item_revisions", (1, 3), "rev")
+
+    now[0] += 10**6
+
+    assert cache.get("teams", "a") is None
+    assert cache.get("work_item_revisions", (1, 3)) == "rev"
+
+
+def test_sqlite_cache_evicts_least_recently_read(sqlite_path):
+    """Test that the size cap evicts the entries read longest ago."""
+    now = [0.0]
+    cache = SQLiteCache(sqlite_path, max_bytes=2500, clock=lambda: now[0])
+    for key in ("a", "b"):
+        now[0] += 1
+        cache.set("work_item_revisions", key, b"x" * 1000)
+    now[0] += 1
+    cache.get("work_item_revisions", "a")
+
+    now[0] += 1
+    cache.set("work_item_revisions", "c", b"x" * 1000)
+
+    assert cache.get("work_item_revisions", "b") is None
+    assert cache.get("work_item_revisions", "a") is not None
+    assert cache.get("work_item_revisions", "c") is not None
+
+
+def test_sqlite_cache_limits_categories(sqlite_path):
+    """Test that each limited category is evicted apart from the rest."""
+    now = [0.0]
+    cache = SQLiteCache(
+        sqlite_path,
+        max_entries=2,
+        limits={"query_cursors": 1},
+        clock=lambda: now[0],
+    )
+    for category, key in [
+        ("projects", "list"),
+        ("teams", "list"),
+        ("query_cursors", "a"),
+        ("query_cursors", "b"),
+        ("fields", "list"),
+    ]:
+        now[0] += 1
+        cache.set(category, key, key)
+
+    assert cache.get("projects", "list") is None
+    assert cache.get("teams", "list") == "list"
+    assert cache.get("fields", "list") == "list"
+    assert cache.get("query_cursors", "a") is None
+    assert cache.get("query_cursors", "b") == "b"
+
+
+def test_sqlite_cache_uses_wal(sqlite_path):
+    """Test that the database allows concurrent readers and a writer."""
+    cache = SQLiteCache(sqlite_path)
+
+    mode = cache._connect().execute("PRAGMA journal_mode").fetchone()[0]
+
+    assert mode == "wal"
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+def test_sqlite_cache_is_private(sqlite_path):
+    """Test that only the owner can read or write the database."""
+    with open(sqlite_path, "w"):
+        pass
+    os.chmod(sqlite_path, 0o644)
+
+    cache = SQLiteCache(sqlite_path)
+    cache.set("fields", "a", 1)
+
+    for path in (sqlite_path, sqlite_path + "-wal"):
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_sqlite_cache_shared_between_threads(sqlite_path):
+    """Test that threads can use the cache at the same time."""
+    cache = SQLiteCache(sqlite_path)
+
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(lambda i: cache.set("fields", i, i), range(20)))
+
+    assert [cache.get("fields", i) for i in range(20)] == list(range(20))
+
+
+def test_configure_sqlite_backend(sqlite_path):
+    """Test that the backend is chosen by configuration."""
+    try:
+        cache = configure_cache(backend="sqlite", path=sqlite_path)
+        assert isinstance(cache, SQLiteCache)
+        with pytest.raises(ValueError):
+            configure_cache(backend="redis")
+    finally:
+        configure_cache()
@@ -0,0 +1,143 @@
+import base64
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from azure.devops.v7_1.core import CoreClient
+from msrest.authentication import BasicAuthentication
+
+from mcp_azure_devops.utils.cassettes import (
+    CassettePolicy,
+    configure_cassette,
+)
+from mcp_azure_devops.utils.exceptions import CassetteMissError
+from mcp_azure_devops.utils.transport import (
+    PoolSettings,
+    create_session,
+    install_transport,
+)
+
+PAT = "secret-pat-value"
+DELAY = 0.2
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    delay = 0.0
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        body = json.dumps({"path": self.path}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _EchoHandler.delay = 0.0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _no_cassette(monkeypatch):
+    for name in (
+        "AZURE_DEVOPS_CASSETTE_MODE",
+        "AZURE_DEVOPS_CASSETTE",
+        "AZURE_DEVOPS_CASSETTE_LATENCY",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    yield
+    configure_cassette()
+
+
+def _client():
+    client = CoreClient(
+        "https://dev.azure.com/test-org", BasicAuthentication("", PAT)
+    )
+    install_transport(
+        client, create_session(PoolSettings()), [CassettePolicy(PAT)]
+    )
+    return client
+
+
+def _get(client, url):
+    response = client._client.send(client._client.get(url))
+    return response.status_code, response.json()
+
+
+def _record(server, path, urls):
+    base = f"http://127.0.0.1:{server.server_port}"
+    configure_cassette("record", str(path))
+    client = _client()
+    results = [_get(client, f"{base}{url}") for url in urls]
+    configure_cassette()
+    return base, results
+
+
+def test_replay_returns_recorded_responses(server, tmp_path):
+    cassette = tmp_path / "session.jsonl"
+    base, recorded = _record(server, cassette, ["/a", "/b?x=1"])
+    server.shutdown()
+
+    configure_cassette("replay", str(cassette), "none")
+    client = _client()
+
+    assert _get(client, f"{base}/a") == recorded[0]
+    assert _get(client, f"{base}/b?x=1") == recorded[1]
+
+
+def test_recording_scrubs_the_pat(server, tmp_path):
+    cassette = tmp_path / "session.jsonl"
+    _record(server, cassette, [f"/a?token={PAT}"])
+
+    content = cassette.read_text()
+    assert PAT not in content
+    assert base64.b64encode(f":{PAT}".encode()).decode() not in content
+    assert "authorization" not in content.lower()
+
+
+def test_replay_waits_for_recorded_latency(server, tmp_path):
+    _EchoHandler.delay = DELAY
+    cassette = tmp_path / "session.jsonl"
+    base, _ = _record(server, cassette, ["/slow"])
+
+    for latency, check in (
+        ("recorded", lambda t: t >= DELAY),
+        ("none", lambda t: t < DELAY),
+    ):
+        configure_cassette("replay", str(cassette), latency)
+        client = _client()
+        start = time.perf_counter()
+        _get(client, f"{base}/slow")
+        assert check(time.perf_counter() - start), latency
+
+
+def test_replay_miss_raises(server, tmp_path):
+    cassette = tmp_path / "session.jsonl"
+    base, _ = _record(server, cassette, ["/a"])
+
+    configure_cassette("replay", str(cassette), "none")
+    client = _client()
+
+    with pytest.raises(CassetteMissError):
+        _get(client, f"{base}/never-recorded")
+
+
+def test_configure_requires_a_file():
+    with pytest.raises(ValueError):
+        configure_cassette("record")
+    with pytest.raises(ValueError):
+        configure_cassette("rewind", "cassette.jsonl")
@@ -0,0 +1,94 @@
+import contextvars
+import inspect
+import threading
+import time
+
+import anyio
+import pytest
+
+from mcp_azure_devops.utils.concurrency import (
+    configure_worker_pool,
+    map_concurrently,
+    run_in_worker,
+)
+
+
+@pytest.fixture
+def anyio_backend():
+    # The server always runs on asyncio
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+def _reset_pool():
+    yield
+    configure_worker_pool()
+
+
+def test_run_in_worker_preserves_signature():
+    """Test that the wrapper keeps the tool's name, docs and parameters."""
+
+    def get_thing(project: str, top: int = 10) -> str:
+        """Get a thing."""
+        return project
+
+    wrapper = run_in_worker(get_thing)
+
+    assert inspect.iscoroutinefunction(wrapper)
+    assert wrapper.__name__ == "get_thing"
+    assert wrapper.__doc__ == "Get a thing."
+    assert list(inspect.signature(wrapper).parameters) == ["project", "top"]
+
+
+@pytest.mark.anyio
+async def test_run_in_worker_runs_off_event_loop():
+    """Test that the wrapped function runs on a worker thread."""
+    main_thread = threading.get_ident()
+    wrapper = run_in_worker(lambda: threading.get_ident())
+
+    assert await wrapper() != main_thread
+
+
+@pytest.mark.anyio
+async def test_run_in_worker_overlaps_calls():
+    """Test that blocking calls overlap up to the pool size."""
+    configure_worker_pool(2)
+    barrier = threading.Barrier(2, timeout=5)
+    wrapper = run_in_worker(barrier.wait)
+
+    # Both calls must be in flight at once for the barrier to release
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(wrapper)
+        tg.start_soon(wrapper)
+
+
+def test_configure_worker_pool_rejects_zero():
+    """Test that an empty worker pool is rejected."""
+    with pytest.raises(ValueError):
+        configure_worker_pool(0)
+
+
+def test_map_concurrently_keeps_order_and_context():
+    """Test that fanned out calls overlap, in order, with the context."""
+    var = contextvars.ContextVar("var")
+    var.set("caller")
+
+    def slow(item):
+        time.sleep(0.1 if item == 0 else 0)
+        return item, var.get(), threading.current_thread().name
+
+    start = time.perf_counter()
+    results = map_concurrently(slow, range(4))
+
+    assert [(item, value) for item, value, _ in results] == [
+        (i, "caller") for i in range(4)
+    ]
+    assert all("fanout" in thread for _, _, thread in results)
+    assert time.perf_counter() - start < 0.3
+
+
+def test_map_concurrently_single_item_runs_inline():
+    """Test that a single call does not hop threads."""
+    results = map_concurrently(lambda _: threading.current_thread(), [1])
+
+    assert results == [threading.current_thread()]
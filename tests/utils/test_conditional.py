@@ -0,0 +1,150 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from azure.devops.v7_1.core import CoreClient
+from msrest.authentication import BasicAuthentication
+
+from mcp_azure_devops.utils import metrics
+from mcp_azure_devops.utils.conditional import (
+    CONDITIONAL_BYTES_SAVED,
+    CONDITIONAL_HITS,
+    ConditionalRequestPolicy,
+    _fits,
+)
+from mcp_azure_devops.utils.transport import (
+    PoolSettings,
+    create_session,
+    install_transport,
+)
+
+BODY = b'{"content": "# Home"}'
+
+
+class _ETagHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    statuses = []
+    etag = '"v1"'
+
+    def do_GET(self):
+        if self.headers.get("If-None-Match") == self.etag:
+            self.statuses.append(304)
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.statuses.append(200)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _ETagHandler.statuses = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _ETagHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def _client(scope="org#pat"):
+    client = CoreClient(
+        "https://dev.azure.com/test-org", BasicAuthentication("", "pat")
+    )
+    install_transport(
+        client,
+        create_session(PoolSettings()),
+        [ConditionalRequestPolicy(scope)],
+    )
+    return client
+
+
+def _get(client, url):
+    return client._client.send(client._client.get(url))
+
+
+def test_unchanged_response_revalidated(server):
+    """Test that a 304 replays the cached body as a 200."""
+    client = _client()
+    url = f"{server}/_apis/wiki/wikis/w/pages?path=/Home"
+
+    first = _get(client, url)
+    second = _get(client, url)
+
+    assert _ETagHandler.statuses == [200, 304]
+    assert second.status_code == 200
+    assert second.content == first.content == BODY
+    assert second.headers["Content-Type"] == "application/json"
+    assert metrics.get_value(CONDITIONAL_HITS, area="wiki") == 1
+    assert metrics.get_value(CONDITIONAL_BYTES_SAVED, area="wiki") == len(BODY)
+
+
+def test_changed_response_replaces_cached_copy(server):
+    """Test that a new ETag is downloaded and stored."""
+    client = _client()
+    url = f"{server}/_apis/wiki/wikis/w/pages?path=/Home"
+    _get(client, url)
+
+    _ETagHandler.etag = '"v2"'
+    try:
+        _get(client, url)
+        _get(client, url)
+    finally:
+        _ETagHandler.etag = '"v1"'
+
+    assert _ETagHandler.statuses == [200, 200, 304]
+
+
+def test_cached_responses_scoped_per_connection(server):
+    """Test that a different PAT does not see another one's responses."""
+    url = f"{server}/_apis/wiki/wikis/w/pages?path=/Home"
+    _get(_client("org#one"), url)
+
+    _get(_client("org#two"), url)
+
+    assert _ETagHandler.statuses == [200, 200]
+
+
+def test_large_responses_not_kept(server, monkeypatch):
+    """Test that bodies over the size limit are not cached."""
+    monkeypatch.setattr(
+        "mcp_azure_devops.utils.conditional.MAX_STORED_BYTES", len(BODY) - 1
+    )
+    client = _client()
+    url = f"{server}/_apis/wiki/wikis/w/pages?path=/Home"
+
+    _get(client, url)
+    _get(client, url)
+
+    assert _ETagHandler.statuses == [200, 200]
+
+
+@pytest.mark.parametrize(
+    "headers, fits",
+    [
+        ({"Content-Length": "10", "Content-Type": "application/zip"}, True),
+        ({"Content-Length": str(2**30)}, False),
+        ({"Content-Type": "application/json; charset=utf-8"}, True),
+        ({"Content-Type": "application/octet-stream"}, False),
+    ],
+)
+def test_downloads_of_unknown_length_not_read(headers, fits):
+    """Test that only bodies that may fit are read to be stored."""
+    assert _fits(headers) is fits
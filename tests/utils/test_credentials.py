@@ -0,0 +1,130 @@
+import base64
+
+import pytest
+from starlette.applications import Starlette
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from mcp_azure_devops.utils.credentials import (
+    ORGANIZATION_HEADER,
+    SESSION_HEADER,
+    CredentialsMiddleware,
+    credentials_from_headers,
+    get_request_credentials,
+)
+
+ORG_URL = "https://dev.azure.com/test-org"
+
+
+def _basic(pat: str, user: str = "") -> dict:
+    token = base64.b64encode(f"{user}:{pat}".encode()).decode()
+    return {"Authorization": f"Basic {token}"}
+
+
+def test_credentials_from_headers():
+    headers = Headers({**_basic("pat-1", "me"), ORGANIZATION_HEADER: ORG_URL})
+
+    assert credentials_from_headers(headers) == ("pat-1", ORG_URL)
+    assert credentials_from_headers(Headers(_basic("pat-1"))) == (
+        "pat-1",
+        None,
+    )
+    assert credentials_from_headers(Headers({})) is None
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"Authorization": "Bearer token"},
+        {"Authorization": "Basic not-base64!"},
+        _basic(""),
+        {ORGANIZATION_HEADER: ORG_URL},
+    ],
+)
+def test_credentials_from_headers_rejects_invalid(headers):
+    with pytest.raises(ValueError):
+        credentials_from_headers(Headers(headers))
+
+
+@pytest.mark.parametrize(
+    "organization_url",
+    [
+        "https://dev.azure.com/Test-Org/",
+        "https://test-org.visualstudio.com",
+        "https://tfs.example.com/DefaultCollection",
+    ],
+)
+def test_allowed_organizations(monkeypatch, organization_url):
+    monkeypatch.setenv(
+        "AZURE_DEVOPS_ALLOWED_ORGANIZATIONS",
+        "https://tfs.example.com/defaultcollection/",
+    )
+    headers = Headers(
+        {**_basic("pat-1"), ORGANIZATION_HEADER: organization_url}
+    )
+
+    assert credentials_from_headers(headers) == (
+        "pat-1",
+        organization_url.rstrip("/"),
+    )
+
+
+@pytest.mark.parametrize(
+    "organization_url",
+    [
+        "http://dev.azure.com/test-org",
+        "https://dev.azure.com/test-org/project",
+        "https://dev.azure.com.evil.example/test-org",
+        "https://dev.azure.com@169.254.169.254/test-org",
+        "http://localhost:8080",
+    ],
+)
+def test_other_organizations_rejected(monkeypatch, organization_url):
+    for name in ("ORGANIZATION_URL", "ALLOWED_ORGANIZATIONS"):
+        monkeypatch.delenv(f"AZURE_DEVOPS_{name}", raising=False)
+    headers = Headers(
+        {**_basic("pat-1"), ORGANIZATION_HEADER: organization_url}
+    )
+
+    with pytest.raises(ValueError):
+        credentials_from_headers(headers)
+
+
+async def _whoami(request):
+    credentials = get_request_credentials()
+    response = JSONResponse({"pat": credentials and credentials[0]})
+    session = request.query_params.get("new_session")
+    if session:
+        response.headers[SESSION_HEADER] = session
+    return response
+
+
+@pytest.fixture
+def client():
+    app = Starlette(routes=[Route("/mcp", _whoami, methods=["GET", "POST"])])
+    app.add_middleware(CredentialsMiddleware)
+    with TestClient(app) as client:
+        yield client
+
+
+def test_middleware_runs_request_with_client_credentials(client):
+    assert client.post("/mcp", headers=_basic("pat-1")).json() == {
+        "pat": "pat-1"
+    }
+    assert client.post("/mcp").json() == {"pat": None}
+    assert client.post("/mcp", headers=_basic("")).status_code == 401
+    assert get_request_credentials() is None
+
+
+def test_middleware_binds_sessions_to_credentials(client):
+    client.post("/mcp?new_session=abc", headers=_basic("pat-1"))
+
+    owner = {SESSION_HEADER: "abc", **_basic("pat-1")}
+    other = {SESSION_HEADER: "abc", **_basic("pat-2")}
+    anonymous = {SESSION_HEADER: "abc"}
+
+    assert client.post("/mcp", headers=owner).status_code == 200
+    assert client.post("/mcp", headers=other).status_code == 403
+    assert client.post("/mcp", headers=anonymous).status_code == 403
@@ -0,0 +1,160 @@
+import urllib.request
+from unittest.mock import MagicMock
+
+import pytest
+from msrest.exceptions import ClientRequestError
+from msrest.pipeline import Pipeline
+
+from mcp_azure_devops.utils import metrics
+from mcp_azure_devops.utils.instrumentation import (
+    HTTP_DURATION,
+    HTTP_REQUESTS,
+    HTTP_RESPONSE_BYTES,
+    TOOL_CALLS,
+    TOOL_DURATION,
+    endpoint_name,
+    instrument_tool,
+    start_metrics_server,
+)
+from mcp_azure_devops.utils.telemetry import MetricsPolicy
+
+ORG = "https://dev.azure.com/org"
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+@pytest.mark.parametrize(
+    "url, endpoint",
+    [
+        (f"{ORG}/Project/_apis/wit/workitems/42?$expand=all", "wit/workitems"),
+        (f"{ORG}/_apis/wiki/wikis/w/pages", "wiki/wikis"),
+        (f"{ORG}/_apis/projects", "projects"),
+        (f"{ORG}/_apis", "location"),
+    ],
+)
+def test_endpoint_name(url, endpoint):
+    """Test that endpoint names leave out IDs."""
+    assert endpoint_name(url) == endpoint
+
+
+def test_instrument_tool_records_outcomes():
+    """Test that error results and exceptions are counted as failures."""
+    results = iter(["ok", "Error: boom"])
+    tool = instrument_tool(lambda: next(results), "my_tool")
+
+    tool()
+    tool()
+    with pytest.raises(StopIteration):
+        tool()
+
+    for outcome in ("ok", "error", "exception"):
+        assert (
+            metrics.get_value(TOOL_CALLS, tool="my_tool", outcome=outcome) == 1
+        )
+    assert metrics.get_histogram(TOOL_DURATION, tool="my_tool")[0] == 3
+
+
+@pytest.mark.anyio
+async def test_instrument_async_tool():
+    """Test that async tools stay async and are recorded."""
+
+    async def tool():
+        return "done"
+
+    wrapped = instrument_tool(tool, "async_tool")
+
+    assert await wrapped() == "done"
+    assert metrics.get_value(TOOL_CALLS, tool="async_tool", outcome="ok") == 1
+
+
+def _request(url=f"{ORG}/_apis/wit/workitems/1"):
+    request = MagicMock()
+    request.http_request.method = "get"
+    request.http_request.url = url
+    return request
+
+
+def _policy():
+    """Create a metrics policy whose next step is a mock sender."""
+    policy = MetricsPolicy()
+    sender = MagicMock()
+    Pipeline([policy], sender)
+    return policy, sender
+
+
+def _response(headers):
+    response = MagicMock()
+    response.http_response.status_code = 200
+    response.http_response.headers = headers
+    return response
+
+
+def test_metrics_policy_records_requests():
+    """Test that requests are recorded per endpoint and status."""
+    policy, sender = _policy()
+    response = _response({"Content-Length": "512"})
+    sender.send.return_value = response
+
+    assert policy.send(_request()) is response
+
+    labels = {"endpoint": "wit/workitems", "method": "GET"}
+    assert metrics.get_value(HTTP_REQUESTS, status="200", **labels) == 1
+    assert metrics.get_value(HTTP_RESPONSE_BYTES, **labels) == 512
+    assert metrics.get_histogram(HTTP_DURATION, **labels)[0] == 1
+
+
+def test_metrics_policy_leaves_streamed_bodies_unread():
+    """Test that bodies without a length are not read to be counted."""
+    policy, sender = _policy()
+    response = _response({})
+    type(response.http_response.internal_response).content = property(
+        lambda _: pytest.fail("streamed body was read")
+    )
+    sender.send.return_value = response
+
+    policy.send(_request())
+
+    labels = {"endpoint": "wit/workitems", "method": "GET"}
+    assert metrics.get_value(HTTP_REQUESTS, status="200", **labels) == 1
+    assert not metrics.get_value(HTTP_RESPONSE_BYTES, **labels)
+
+
+def test_metrics_policy_records_connection_errors():
+    """Test that failed connections count as errors."""
+    policy, sender = _policy()
+    sender.send.side_effect = ClientRequestError("reset")
+
+    with pytest.raises(ClientRequestError):
+        policy.send(_request())
+
+    assert (
+        metrics.get_value(
+            HTTP_REQUESTS,
+            endpoint="wit/workitems",
+            method="GET",
+            status="error",
+        )
+        == 1
+    )
+
+
+def test_metrics_server_serves_prometheus_text():
+    """Test that the metrics endpoint returns the registry."""
+    metrics.increment("scraped_total")
+    server = start_metrics_server(0)
+    try:
+        url = f"http://127.0.0.1:{server.server_port}/metrics"
+        with urllib.request.urlopen(url) as response:
+            body = response.read().decode()
+            content_type = response.headers["Content-Type"]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert "scraped_total 1" in body
+    assert content_type.startswith("text/plain")
@@ -0,0 +1,56 @@
+import pytest
+
+from mcp_azure_devops.utils import metrics
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def test_histogram_counts_and_sum():
+    """Test that observed values are counted and summed."""
+    metrics.observe("latency", 0.2, tool="a")
+    metrics.observe("latency", 0.4, tool="a")
+
+    count, total = metrics.get_histogram("latency", tool="a")
+
+    assert count == 2
+    assert total == pytest.approx(0.6)
+    assert metrics.get_histogram("latency", tool="b") == (0, 0.0)
+
+
+def test_timer_records_duration():
+    """Test that a timed block is recorded once."""
+    with metrics.timer("block"):
+        pass
+
+    assert metrics.get_histogram("block")[0] == 1
+
+
+def test_render_prometheus():
+    """Test the Prometheus text exposition output."""
+    metrics.increment("requests_total", 2, endpoint="wit/wiql")
+    metrics.set_gauge("tokens", 1.5)
+    metrics.observe("duration_seconds", 0.3, buckets=(0.1, 0.5), tool="t")
+
+    text = metrics.render_prometheus()
+
+    assert "# TYPE requests_total counter" in text
+    assert 'requests_total{endpoint="wit/wiql"} 2' in text
+    assert "# TYPE tokens gauge\ntokens 1.5" in text
+    assert "# TYPE duration_seconds histogram" in text
+    assert 'duration_seconds_bucket{tool="t",le="0.1"} 0' in text
+    assert 'duration_seconds_bucket{tool="t",le="0.5"} 1' in text
+    assert 'duration_seconds_bucket{tool="t",le="+Inf"} 1' in text
+    assert 'duration_seconds_count{tool="t"} 1' in text
+    assert text.endswith("\n")
+
+
+def test_render_escapes_label_values():
+    """Test that quotes in label values are escaped."""
+    metrics.increment("calls_total", tool='say "hi"')
+
+    assert 'calls_total{tool="say \\"hi\\""} 1' in metrics.render_prometheus()
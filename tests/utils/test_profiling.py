@@ -0,0 +1,89 @@
+import pstats
+import tracemalloc
+
+import pytest
+
+from mcp_azure_devops.utils.profiling import (
+    configure_profiling,
+    profile_tool,
+)
+
+
+@pytest.fixture(autouse=True)
+def _disable_profiling(monkeypatch):
+    for name in ("PROFILE", "PROFILE_TOOLS", "PROFILE_DIR"):
+        monkeypatch.delenv(f"AZURE_DEVOPS_{name}", raising=False)
+    yield
+    configure_profiling()
+
+
+def _format_items():
+    return "\n".join(str(i) for i in range(1000))
+
+
+def test_cprofile_dumps_stats_per_call(tmp_path):
+    """Test that each profiled call leaves a cProfile stats file."""
+    configure_profiling(["cprofile"], directory=str(tmp_path))
+    tool = profile_tool(_format_items, "get_work_items")
+
+    tool()
+    tool()
+
+    profiles = sorted(tmp_path.glob("get_work_items-*.prof"))
+    assert len(profiles) == 2
+    stats = pstats.Stats(str(profiles[0]))
+    assert "_format_items" in stats.get_stats_profile().func_profiles
+
+
+def test_tracemalloc_writes_allocations(tmp_path):
+    """Test that memory snapshots are compared around the call."""
+    configure_profiling(["tracemalloc"], directory=str(tmp_path))
+    tool = profile_tool(lambda: [bytes(1024) for _ in range(100)], "big")
+
+    assert tracemalloc.is_tracing()
+    assert len(tool()) == 100
+
+    (report,) = tmp_path.glob("big-*.tracemalloc.txt")
+    assert "test_profiling.py" in report.read_text()
+
+    configure_profiling()
+    assert not tracemalloc.is_tracing()
+
+
+def test_unwritable_profile_keeps_the_result(tmp_path):
+    """Test that a profile that cannot be written does not fail the call."""
+    directory = tmp_path / "profiles"
+    configure_profiling(["cprofile", "tracemalloc"], directory=str(directory))
+    tool = profile_tool(_format_items, "get_work_items")
+    directory.rmdir()
+
+    assert tool() == _format_items()
+
+
+def test_only_selected_tools_profiled(tmp_path, monkeypatch):
+    """Test that tool selection comes from the environment."""
+    monkeypatch.setenv("AZURE_DEVOPS_PROFILE", "cprofile")
+    monkeypatch.setenv("AZURE_DEVOPS_PROFILE_TOOLS", "search_wiki")
+    monkeypatch.setenv("AZURE_DEVOPS_PROFILE_DIR", str(tmp_path))
+    configure_profiling()
+
+    profile_tool(_format_items, "get_projects")()
+    profile_tool(_format_items, "search_wiki")()
+
+    assert [p.name.split("-")[0] for p in tmp_path.iterdir()] == [
+        "search_wiki"
+    ]
+
+
+def test_disabled_by_default(tmp_path):
+    """Test that tools run unprofiled unless configured."""
+    configure_profiling(directory=str(tmp_path))
+
+    assert profile_tool(_format_items, "get_projects")() == _format_items()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_unknown_mode_rejected():
+    """Test that a misspelt mode fails loudly."""
+    with pytest.raises(ValueError):
+        configure_profiling(["pyspy"])
@@ -0,0 +1,206 @@
+from typing import Tuple
+from unittest.mock import MagicMock, patch
+
+import pytest
+from msrest.exceptions import ClientRequestError
+from msrest.pipeline import Pipeline
+
+from mcp_azure_devops.utils import metrics
+from mcp_azure_devops.utils.exceptions import CircuitOpenError
+from mcp_azure_devops.utils.retry import (
+    CIRCUIT_OPEN,
+    RETRIES,
+    CircuitBreaker,
+    CircuitBreakers,
+    RetryPolicy,
+    RetrySettings,
+    resource_area,
+)
+
+ORG = "https://dev.azure.com/org"
+
+
+class FakeClock:
+    """Clock whose sleep() advances time instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def _request(method="GET", url=f"{ORG}/_apis/wit/workitems/1"):
+    request = MagicMock()
+    request.http_request.method = method
+    request.http_request.url = url
+    return request
+
+
+def _response(status):
+    response = MagicMock()
+    response.http_response.status_code = status
+    return response
+
+
+def _policy(settings=None, sleep=None) -> Tuple[RetryPolicy, MagicMock]:
+    """Create a policy whose next step is a mock sender."""
+    settings = settings or RetrySettings()
+    policy = RetryPolicy(
+        CircuitBreakers(ORG, settings),
+        settings,
+        sleep=sleep or (lambda s: None),
+    )
+    sender = MagicMock()
+    Pipeline([policy], sender)
+    return policy, sender
+
+
+@pytest.mark.parametrize(
+    "url, area",
+    [
+        (f"{ORG}/_apis/wit/wiql", "wit"),
+        (f"{ORG}/Project/_apis/Git/repositories", "git"),
+        ("https://almsearch.dev.azure.com/org/_apis/search/x", "search"),
+        (f"{ORG}/_apis", "location"),
+        (f"{ORG}/_apis/", "location"),
+    ],
+)
+def test_resource_area(url, area):
+    """Test that URLs map to their resource area."""
+    assert resource_area(url) == area
+
+
+def test_get_retried_on_server_error():
+    """Test that idempotent requests are retried after a 5xx."""
+    slept = []
+    policy, sender = _policy(sleep=slept.append)
+    ok = _response(200)
+    sender.send.side_effect = [_response(503), _response(500), ok]
+
+    assert policy.send(_request()) is ok
+    assert sender.send.call_count == 3
+    assert len(slept) == 2
+    # Full jitter stays below the exponential ceiling
+    assert 0 <= slept[0] <= 0.5 and 0 <= slept[1] <= 1.0
+    assert metrics.get_value(RETRIES, area="wit") == 2
+
+
+def test_connection_error_retried_then_raised():
+    """Test that dropped connections are retried until attempts run out."""
+    policy, sender = _policy()
+    sender.send.side_effect = ClientRequestError("reset")
+
+    with pytest.raises(ClientRequestError):
+        policy.send(_request())
+    assert sender.send.call_count == 3
+
+
+def test_post_not_retried():
+    """Test that non-idempotent requests are sent only once."""
+    policy, sender = _policy()
+    failed = _response(503)
+    sender.send.return_value = failed
+
+    assert policy.send(_request("POST")) is failed
+    assert sender.send.call_count == 1
+
+
+def test_client_error_not_retried():
+    """Test that 4xx responses are returned as they are."""
+    policy, sender = _policy()
+    missing = _response(404)
+    sender.send.return_value = missing
+
+    assert policy.send(_request()) is missing
+    assert sender.send.call_count == 1
+
+
+def test_circuit_opens_per_area():
+    """Test that a failing area fails fast without affecting others."""
+    settings = RetrySettings(attempts=1, failure_threshold=2)
+    policy, sender = _policy(settings)
+    sender.send.return_value = _response(500)
+
+    policy.send(_request())
+    policy.send(_request())
+    with pytest.raises(CircuitOpenError):
+        policy.send(_request())
+    assert sender.send.call_count == 2
+    assert metrics.get_value(CIRCUIT_OPEN, circuit=f"{ORG}:wit") == 1
+
+    sender.send.return_value = _response(200)
+    policy.send(_request(url=f"{ORG}/_apis/git/repositories"))
+    assert sender.send.call_count == 3
+
+
+def test_circuit_half_open_trial():
+    """Test that an open circuit lets one trial request through."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        "wit", failure_threshold=1, reset_timeout=10, clock=clock
+    )
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    clock.now = 10
+    breaker.before_request()
+    # Only one trial at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    clock.now = 20
+    breaker.before_request()
+    breaker.record_success()
+    assert not breaker.is_open
+    breaker.before_request()
+
+
+def test_unexpected_error_ends_the_trial():
+    """Test that a trial request raising an unrelated error is released."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        "wit", failure_threshold=1, reset_timeout=10, clock=clock
+    )
+    breaker.record_failure()
+    clock.now = 10
+    policy, sender = _policy(RetrySettings(attempts=1))
+    sender.send.side_effect = ValueError("not a service failure")
+
+    with patch.object(CircuitBreakers, "get", return_value=breaker):
+        with pytest.raises(ValueError):
+            policy.send(_request())
+
+        sender.send.side_effect = None
+        sender.send.return_value = _response(200)
+        policy.send(_request())
+
+    assert not breaker.is_open
+
+
+def test_settings_from_env(monkeypatch):
+    """Test that retry settings are read from the environment."""
+    monkeypatch.setenv("AZURE_DEVOPS_RETRY_ATTEMPTS", "5")
+    monkeypatch.setenv("AZURE_DEVOPS_CIRCUIT_RESET_TIMEOUT", "2.5")
+
+    settings = RetrySettings.from_env()
+
+    assert settings.attempts == 5
+    assert settings.reset_timeout == 2.5
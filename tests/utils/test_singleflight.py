@@ -0,0 +1,156 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+from azure.devops.v7_1.work_item_tracking.models import Wiql
+
+from mcp_azure_devops.utils import metrics
+from mcp_azure_devops.utils.singleflight import (
+    SINGLE_FLIGHT_HITS,
+    SingleFlight,
+    coalesce_client,
+    normalize_args,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+class _SlowClient:
+    """Client whose reads block until released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = 0
+
+    def get_work_item(self, id, project=None):
+        self.calls += 1
+        self.release.wait(5)
+        if id < 0:
+            raise ValueError("bad id")
+        return {"id": id}
+
+    def update_work_item(self, document, id):
+        self.calls += 1
+        return id
+
+
+def _run_concurrently(fn, count):
+    """Start count calls of fn and wait until all of them are running."""
+    started = threading.Barrier(count + 1)
+
+    def call():
+        started.wait()
+        return fn()
+
+    pool = ThreadPoolExecutor(count)
+    futures = [pool.submit(call) for _ in range(count)]
+    started.wait()
+    return pool, futures
+
+
+def _wait_for_waiters(count):
+    """Wait until count callers joined an in-flight call."""
+    for _ in range(500):
+        if metrics.get_value(SINGLE_FLIGHT_HITS, method="get_work_item") >= (
+            count
+        ):
+            return
+        threading.Event().wait(0.01)
+
+
+def test_concurrent_reads_share_one_call():
+    """Test that identical in-flight reads make a single request."""
+    client = coalesce_client(_SlowClient(), SingleFlight())
+
+    pool, futures = _run_concurrently(
+        lambda: client.get_work_item(1, project="P"), 4
+    )
+    _wait_for_waiters(3)
+    client.release.set()
+    results = [f.result() for f in futures]
+    pool.shutdown()
+
+    assert client.calls == 1
+    assert all(result is results[0] for result in results)
+    assert metrics.get_value(SINGLE_FLIGHT_HITS, method="get_work_item") == 3
+
+
+def test_different_arguments_not_shared():
+    """Test that calls with different arguments are sent separately."""
+    client = coalesce_client(_SlowClient(), SingleFlight())
+    client.release.set()
+
+    assert client.get_work_item(1) == {"id": 1}
+    assert client.get_work_item(2) == {"id": 2}
+    assert client.calls == 2
+
+
+def test_errors_shared_with_waiters():
+    """Test that waiters receive the exception of the shared call."""
+    client = coalesce_client(_SlowClient(), SingleFlight())
+
+    pool, futures = _run_concurrently(lambda: client.get_work_item(-1), 3)
+    _wait_for_waiters(2)
+    client.release.set()
+    for future in futures:
+        with pytest.raises(ValueError):
+            future.result()
+    pool.shutdown()
+
+    assert client.calls == 1
+
+
+def test_finished_calls_not_cached():
+    """Test that a completed call is not reused by later callers."""
+    client = coalesce_client(_SlowClient(), SingleFlight())
+    client.release.set()
+
+    client.get_work_item(1)
+    client.get_work_item(1)
+
+    assert client.calls == 2
+
+
+def test_writes_not_coalesced():
+    """Test that only read methods are wrapped."""
+    client = _SlowClient()
+    update = client.update_work_item
+
+    coalesce_client(client, SingleFlight())
+
+    assert client.update_work_item == update
+
+
+def test_downloads_not_coalesced():
+    """Test that methods returning a download generator are not wrapped."""
+
+    class _DownloadClient(_SlowClient):
+        # Stands in for the SDK's msrest service client; never called
+        _client: Any = None
+
+        def get_blob_content(self, sha1):
+            return self._client.stream_download(sha1)
+
+    client = _DownloadClient()
+    download = client.get_blob_content
+    read = client.get_work_item
+
+    coalesce_client(client, SingleFlight())
+
+    assert client.get_blob_content == download
+    assert client.get_work_item != read
+
+
+def test_normalize_args_models_and_containers():
+    """Test that equal models and containers produce equal keys."""
+    first = normalize_args(([Wiql(query="SELECT")], {"b": 1, "a": [2]}))
+    second = normalize_args(([Wiql(query="SELECT")], {"a": [2], "b": 1}))
+
+    assert first == second
+    assert hash(first) == hash(second)
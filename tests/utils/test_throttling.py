@@ -0,0 +1,123 @@
+from unittest.mock import MagicMock
+
+import pytest
+from msrest.pipeline import Pipeline
+
+from mcp_azure_devops.utils import metrics
+from mcp_azure_devops.utils.throttling import (
+    RATE_LIMIT_REMAINING,
+    THROTTLED_REQUESTS,
+    RateLimiter,
+    RateLimitPolicy,
+)
+
+
+class FakeClock:
+    """Clock whose sleep() advances time instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def _limiter(clock, rate=10.0, burst=2):
+    return RateLimiter(
+        rate=rate,
+        burst=burst,
+        organization="org",
+        clock=clock,
+        sleep=clock.sleep,
+    )
+
+
+def test_acquire_spends_burst_then_paces(clock):
+    """Test that requests beyond the burst wait for tokens."""
+    limiter = _limiter(clock)
+
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == pytest.approx(0.1)
+
+
+def test_retry_after_pauses_requests(clock):
+    """Test that a Retry-After header holds back later requests."""
+    limiter = _limiter(clock)
+
+    assert limiter.observe({"Retry-After": "5"}) == 5
+
+    assert limiter.acquire() == pytest.approx(5)
+
+
+def test_rate_limit_delay_header(clock):
+    """Test that X-RateLimit-Delay is honoured without Retry-After."""
+    limiter = _limiter(clock)
+
+    assert limiter.observe({"X-RateLimit-Delay": "1.5"}) == 1.5
+
+
+def test_low_budget_slows_refill(clock):
+    """Test that the refill rate drops as the remaining budget runs low."""
+    limiter = _limiter(clock, burst=1)
+    limiter.observe(
+        {"X-RateLimit-Remaining": "10", "X-RateLimit-Limit": "200"}
+    )
+
+    limiter.acquire()
+    waited = limiter.acquire()
+
+    # 5% remaining against a 20% low water mark paces at a quarter speed
+    assert waited == pytest.approx(0.4)
+    assert metrics.get_value(RATE_LIMIT_REMAINING, organization="org") == 10
+
+
+def test_policy_queues_throttled_requests(clock):
+    """Test that a 429 is retried after the advertised delay."""
+    limiter = _limiter(clock)
+    policy = RateLimitPolicy(limiter)
+    throttled = MagicMock()
+    throttled.http_response.status_code = 429
+    throttled.http_response.headers = {"Retry-After": "2"}
+    ok = MagicMock()
+    ok.http_response.status_code = 200
+    ok.http_response.headers = {}
+    sender = MagicMock()
+    Pipeline([policy], sender)
+    sender.send.side_effect = [throttled, ok]
+
+    assert policy.send(MagicMock()) is ok
+    assert sender.send.call_count == 2
+    assert clock.now == pytest.approx(2)
+    assert metrics.get_value(THROTTLED_REQUESTS, organization="org") == 1
+
+
+def test_policy_returns_429_when_retries_exhausted(clock):
+    """Test that throttling surfaces once retries are used up."""
+    policy = RateLimitPolicy(_limiter(clock), max_retries=1)
+    throttled = MagicMock()
+    throttled.http_response.status_code = 429
+    throttled.http_response.headers = {}
+    sender = MagicMock()
+    Pipeline([policy], sender)
+    sender.send.return_value = throttled
+
+    assert policy.send(MagicMock()) is throttled
+    assert sender.send.call_count == 2
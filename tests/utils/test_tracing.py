@@ -0,0 +1,97 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from msrest.pipeline import Pipeline
+
+from mcp_azure_devops.utils import tracing
+from mcp_azure_devops.utils.telemetry import TracingPolicy
+
+pytest.importorskip("opentelemetry.sdk")
+
+
+@pytest.fixture
+def trace_file(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    assert tracing.configure_tracing("json", str(path))
+    yield path
+    tracing.shutdown_tracing()
+
+
+def _spans(path):
+    tracing.shutdown_tracing()
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def _http_policy(status=200):
+    policy = TracingPolicy()
+    response = MagicMock()
+    response.http_response.status_code = status
+    sender = MagicMock()
+    sender.send.return_value = response
+    Pipeline([policy], sender)
+    return policy
+
+
+def _request(url):
+    request = MagicMock()
+    request.http_request.method = "GET"
+    request.http_request.url = url
+    return request
+
+
+def test_tool_trace_nests_requests_and_formatting(trace_file):
+    """Test that HTTP requests and formatting are children of the tool."""
+    policy = _http_policy()
+
+    @tracing.traced("format")
+    def format_result():
+        return "formatted"
+
+    def tool():
+        policy.send(_request("https://dev.azure.com/org/_apis/wit/wiql"))
+        policy.send(_request("https://dev.azure.com/org/_apis/wit/workitems"))
+        return format_result()
+
+    assert tracing.trace_tool(tool, "query_work_items")() == "formatted"
+
+    spans = {span["name"]: span for span in _spans(trace_file)}
+    root = spans["tool query_work_items"]
+    assert root["parent_id"] is None
+    for name in ("GET wit/wiql", "GET wit/workitems", "format"):
+        assert spans[name]["parent_id"] == root["context"]["span_id"]
+        assert (
+            spans[name]["context"]["trace_id"] == (root["context"]["trace_id"])
+        )
+    attributes = spans["GET wit/wiql"]["attributes"]
+    assert attributes["http.response.status_code"] == 200
+
+
+def test_error_results_mark_spans_failed(trace_file):
+    """Test that failed tools and requests get an error status."""
+    policy = _http_policy(status=404)
+
+    def tool():
+        policy.send(_request("https://dev.azure.com/org/_apis/projects"))
+        return "Error: not found"
+
+    assert tracing.trace_tool(tool, "get_projects")() == "Error: not found"
+
+    spans = {span["name"]: span for span in _spans(trace_file)}
+    assert spans["tool get_projects"]["status"]["status_code"] == "ERROR"
+    assert spans["GET projects"]["status"]["status_code"] == "ERROR"
+
+
+def test_tracing_off_by_default(monkeypatch):
+    """Test that nothing is recorded without an exporter."""
+    monkeypatch.delenv("AZURE_DEVOPS_TRACE_EXPORTER", raising=False)
+
+    assert not tracing.configure_tracing()
+    with tracing.span("ignored") as current:
+        assert current is None
+
+
+def test_unknown_exporter_rejected():
+    """Test that a misspelt exporter fails loudly."""
+    with pytest.raises(ValueError):
+        tracing.configure_tracing("zipkin")
@@ -0,0 +1,100 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+from azure.devops.v7_1.core import CoreClient
+from msrest.authentication import BasicAuthentication
+
+from mcp_azure_devops.utils import metrics
+from mcp_azure_devops.utils.transport import (
+    CONNECTIONS_OPENED,
+    CONNECTIONS_REUSED,
+    PooledHTTPAdapter,
+    PoolSettings,
+    create_session,
+    install_transport,
+)
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def test_session_reuses_connections(server):
+    """Test that the pooled session keeps connections alive."""
+    session = create_session(PoolSettings())
+
+    for _ in range(3):
+        session.get(server).raise_for_status()
+
+    assert metrics.get_value(CONNECTIONS_OPENED, host="127.0.0.1") == 1
+    assert metrics.get_value(CONNECTIONS_REUSED, host="127.0.0.1") == 2
+
+
+def test_session_without_keep_alive(server):
+    """Test that disabling keep-alive opens a connection per request."""
+    session = create_session(PoolSettings(keep_alive=False))
+
+    for _ in range(2):
+        session.get(server).raise_for_status()
+
+    assert metrics.get_value(CONNECTIONS_OPENED, host="127.0.0.1") == 2
+
+
+def test_session_drops_idle_connections(server):
+    """Test that connections idle past the timeout are not reused."""
+    session = create_session(PoolSettings(idle_timeout=0.01))
+    session.get(server).raise_for_status()
+
+    adapter = session.get_adapter(server)
+    assert isinstance(adapter, PooledHTTPAdapter)
+    adapter._last_used -= 1
+    session.get(server).raise_for_status()
+
+    assert metrics.get_value(CONNECTIONS_OPENED, host="127.0.0.1") == 2
+    assert metrics.get_value(CONNECTIONS_REUSED, host="127.0.0.1") == 0
+
+
+def test_install_transport_uses_shared_session():
+    """Test that SDK clients send through the shared session."""
+    session = create_session(PoolSettings())
+    session.request = MagicMock(side_effect=RuntimeError("sent"))
+    client = CoreClient(
+        "https://dev.azure.com/test-org", BasicAuthentication("", "pat")
+    )
+
+    install_transport(client, session)
+
+    assert client.config.keep_alive is True
+    with pytest.raises(Exception):
+        client._client.send(client._client.get("https://example.invalid"))
+    session.request.assert_called_once()